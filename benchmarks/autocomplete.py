@@ -0,0 +1,68 @@
+"""가상 식당 이름으로 자동완성 색인을 채우고 접두어 추천 시간을 측정한다.
+
+    ENV=local python -m benchmarks.autocomplete --rows 50000
+"""
+
+import argparse
+import random
+
+from benchmarks.utils import create_test_database, measure, report, setup_django
+
+SYLLABLES: str = "가나다라마바사아자차카타파하원조막창곱찜닭국밥커피술집회초밥면옥"
+
+
+def create_rows(rows: int, seed: int) -> None:
+    from restaurants.models import Restaurant
+
+    rng: random.Random = random.Random(seed)
+    restaurants: list[Restaurant] = []
+    for index in range(rows):
+        name: str = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6)))
+        address: str = f"대구광역시 수성구 야구전설로 {index}"
+        restaurants.append(
+            Restaurant(
+                name=name,
+                address=address,
+                detail_address=name,
+                longitude=128.68,
+                latitude=35.84,
+                far_from_lions_park=0,
+                category=Restaurant.RestaurantType.KOREAN,
+                suggested_count=rng.randint(1, 50),
+                identity_key=Restaurant.make_identity_key(name, address, name),
+            )
+        )
+    Restaurant.objects.bulk_create(restaurants, batch_size=5000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--memory-budget", type=int, default=16 * 1024 * 1024)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    destroy = create_test_database()
+    try:
+        from restaurants.autocomplete import RestaurantAutocomplete
+
+        create_rows(args.rows, args.seed)
+        autocomplete = RestaurantAutocomplete(
+            memory_budget=args.memory_budget, refresh_interval=3600
+        )
+        report("initial load", measure(autocomplete.refresh, 1))
+        print(f"{len(autocomplete)} names, ~{autocomplete.memory // 1024}KiB")
+
+        for query in ("막", "원조", "막창곱"):
+            report(
+                f"suggest {query!r}",
+                measure(lambda: autocomplete.suggest(query, 10), args.repeat),
+            )
+    finally:
+        destroy()
+
+
+if __name__ == "__main__":
+    main()
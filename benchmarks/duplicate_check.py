@@ -0,0 +1,107 @@
+"""수백만 개의 SuggestionCooldown 위에서 중복 추천 검사(쿨다운 획득) 시간을 측정한다.
+
+    ENV=local python -m benchmarks.duplicate_check --restaurants 100000 --cooldowns 2000000
+"""
+
+import argparse
+import itertools
+import random
+
+from benchmarks.utils import create_test_database, measure, report, setup_django
+
+
+def make_name(index: int) -> tuple[str, str]:
+    return f"식당{index}", f"대구광역시 가상구 {index}"
+
+
+def create_rows(restaurants: int, cooldowns: int, seed: int) -> None:
+    from django.utils import timezone
+
+    from restaurants.models import Restaurant, SuggestionCooldown
+
+    identity_keys: list[str] = [
+        Restaurant.make_identity_key(name, address, name)
+        for name, address in map(make_name, range(restaurants))
+    ]
+    expires_at = timezone.now() + timezone.timedelta(days=3)
+
+    rng: random.Random = random.Random(seed)
+    batch: list[SuggestionCooldown] = []
+    for _ in range(cooldowns):
+        batch.append(
+            SuggestionCooldown(
+                identity_key=rng.choice(identity_keys),
+                ip_address=f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+                expires_at=expires_at,
+            )
+        )
+        if len(batch) == 10000:
+            SuggestionCooldown.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    SuggestionCooldown.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--restaurants", type=int, default=100_000)
+    parser.add_argument("--cooldowns", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    destroy = create_test_database()
+    try:
+        from django.utils import timezone
+
+        from exceptions import AlreadyAddRestaurantException
+        from restaurants.models import Restaurant, SuggestionCooldown
+        from restaurants.validators import RestaurantValidator
+
+        create_rows(args.restaurants, args.cooldowns, args.seed)
+        print(
+            f"{SuggestionCooldown.objects.count()} cooldowns "
+            f"over {args.restaurants} restaurants"
+        )
+
+        name, address = make_name(0)
+        claimed_ip: str = "172.16.0.1"
+        RestaurantValidator.claim_suggestion_cooldown(name, address, claimed_ip)
+
+        def claim(ip_address: str) -> None:
+            try:
+                RestaurantValidator.claim_suggestion_cooldown(name, address, ip_address)
+            except AlreadyAddRestaurantException:
+                pass
+
+        report(
+            "claim cooldown (active, rejected)",
+            measure(lambda: claim(claimed_ip), args.repeat),
+        )
+
+        new_ips = (
+            f"192.168.{index // 256 % 256}.{index % 256}" for index in itertools.count()
+        )
+        report(
+            "claim cooldown (new)",
+            measure(lambda: claim(next(new_ips)), args.repeat),
+        )
+
+        def claim_expired() -> None:
+            SuggestionCooldown.objects.filter(
+                identity_key=Restaurant.make_identity_key(name, address, name),
+                ip_address=claimed_ip,
+            ).update(expires_at=timezone.now())
+            claim(claimed_ip)
+
+        report(
+            "claim cooldown (expired, renewed)",
+            measure(claim_expired, args.repeat),
+            note="includes the expiring update",
+        )
+    finally:
+        destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""가상 데이터와 가짜 네이버 서버를 띄우고 모든 엔드포인트를 동시 요청으로 측정한다.
+
+    ENV=local python -m benchmarks.endpoints --restaurants 10000 --rows 100000
+    ENV=local python -m benchmarks.endpoints --only list reviews --concurrency 16
+
+시나리오마다 p50/p95/p99, 처리량(rps), 실패 수와 요청당 DB 쿼리 수를 출력한다.
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+
+from benchmarks.fake_naver import BASE_LATITUDE, BASE_LONGITUDE, FakeNaverServer
+from benchmarks.utils import create_test_database, percentile, report, setup_django
+
+API_PREFIX: str = "api/v1"
+SYLLABLES: str = "가나다라마바사아자차카타파하원조막창곱찜닭국밥커피술집회초밥면옥"
+
+
+@dataclass
+class Scenario:
+    name: str
+    view: str
+    method: str
+    build: Callable[[random.Random, int], tuple[str, dict[str, Any]]]
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def create_fixtures(args: argparse.Namespace) -> None:
+    from bugs.models import Answer, Bug
+    from restaurants.models import (
+        IPAddress,
+        Restaurant,
+        RestaurantImage,
+        Review,
+    )
+    from restaurants.search import RestaurantSearchIndex
+    from utils import geohash
+
+    rng: random.Random = random.Random(args.seed)
+    categories: list[str] = Restaurant.RestaurantType.values
+    restaurants: list[Restaurant] = []
+    for index in range(args.restaurants):
+        name: str = f"{make_word(rng)}{make_word(rng)}"
+        address: str = f"대구광역시 {make_word(rng)}구 {make_word(rng)}로 {index}"
+        longitude: float = BASE_LONGITUDE + rng.uniform(-0.1, 0.1)
+        latitude: float = BASE_LATITUDE + rng.uniform(-0.1, 0.1)
+        restaurants.append(
+            Restaurant(
+                name=name,
+                address=address,
+                detail_address=name,
+                longitude=longitude,
+                latitude=latitude,
+                far_from_lions_park=rng.uniform(0, 15),
+                category=rng.choice(categories),
+                suggested_count=rng.randint(1, 50),
+                geohash=geohash.encode(longitude, latitude),
+                identity_key=Restaurant.make_identity_key(name, address, name),
+            )
+        )
+    Restaurant.objects.bulk_create(restaurants, batch_size=5000)
+    restaurant_ids: list[int] = list(Restaurant.objects.values_list("id", flat=True))
+
+    Review.objects.bulk_create(
+        (
+            Review(
+                restaurant_id=rng.choice(restaurant_ids),
+                post=" ".join(make_word(rng) for _ in range(8)),
+            )
+            for _ in range(args.rows)
+        ),
+        batch_size=5000,
+    )
+    RestaurantImage.objects.bulk_create(
+        (
+            RestaurantImage(
+                restaurant_id=rng.choice(restaurant_ids),
+                img_url=f"https://images.example.com/fixture/{index}.jpg",
+            )
+            for index in range(args.rows)
+        ),
+        batch_size=5000,
+    )
+    IPAddress.objects.bulk_create(
+        (
+            IPAddress(
+                restaurant_id=rng.choice(restaurant_ids),
+                ip_address=f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.1",
+            )
+            for _ in range(args.rows)
+        ),
+        batch_size=5000,
+    )
+    bugs: list[Bug] = Bug.objects.bulk_create(
+        Bug(
+            bug_type=rng.choice(Bug.BugType.values),
+            title=make_word(rng),
+            description=" ".join(make_word(rng) for _ in range(10)),
+        )
+        for _ in range(args.bugs)
+    )
+    Answer.objects.bulk_create(
+        Answer(bug=bug, answer=make_word(rng)) for bug in bugs[::2]
+    )
+
+    restaurants = list(Restaurant.objects.only("id", "name", "address"))
+    for start in range(0, len(restaurants), 1000):
+        RestaurantSearchIndex.index_restaurants(restaurants[start : start + 1000])
+
+
+def make_scenarios(restaurant_ids: list[int], bug_ids: list[int]) -> list[Scenario]:
+    from bugs.models import Bug
+    from restaurants.models import Restaurant
+
+    categories: list[str] = Restaurant.RestaurantType.values
+
+    def create_restaurant(rng: random.Random, index: int) -> tuple[str, dict[str, Any]]:
+        return "", {
+            "json": {
+                "name": f"{make_word(rng)}식당{index}",
+                "address": f"대구광역시 수성구 벤치로 {index}",
+                "category": rng.choice(categories),
+                "review": make_word(rng),
+            },
+            "headers": {"X-Forwarded-For": f"10.0.{index // 256 % 256}.{index % 256}"},
+        }
+
+    return [
+        Scenario(
+            "list",
+            f"{API_PREFIX}/restaurants/restaurants",
+            "GET",
+            lambda rng, index: ("", {}),
+        ),
+        Scenario(
+            "list-filtered",
+            f"{API_PREFIX}/restaurants/restaurants",
+            "GET",
+            lambda rng, index: (
+                "",
+                {"params": {"category": rng.choice(categories), "max_range": 10}},
+            ),
+        ),
+        Scenario(
+            "list-near",
+            f"{API_PREFIX}/restaurants/restaurants",
+            "GET",
+            lambda rng, index: (
+                "",
+                {
+                    "params": {
+                        "near": f"{BASE_LATITUDE},{BASE_LONGITUDE}",
+                        "radius": rng.choice((1, 3, 5)),
+                        "pagination": "cursor",
+                    }
+                },
+            ),
+        ),
+        Scenario(
+            "reviews",
+            f"{API_PREFIX}/restaurants/restaurants/<int:restaurant_id>/reviews",
+            "GET",
+            lambda rng, index: (f"/{rng.choice(restaurant_ids)}/reviews", {}),
+        ),
+        Scenario(
+            "search",
+            f"{API_PREFIX}/restaurants/search-restaurants",
+            "GET",
+            lambda rng, index: ("", {"params": {"name": f"{make_word(rng)}{index}"}}),
+        ),
+        Scenario(
+            "async-search",
+            f"{API_PREFIX}/restaurants/async/search-restaurants",
+            "GET",
+            lambda rng, index: ("", {"params": {"name": f"{make_word(rng)}{index}"}}),
+        ),
+        Scenario(
+            "local-search",
+            f"{API_PREFIX}/restaurants/local-search-restaurants",
+            "GET",
+            lambda rng, index: ("", {"params": {"query": make_word(rng)}}),
+        ),
+        Scenario(
+            "autocomplete",
+            f"{API_PREFIX}/restaurants/autocomplete-restaurants",
+            "GET",
+            lambda rng, index: ("", {"params": {"query": rng.choice(SYLLABLES)}}),
+        ),
+        Scenario(
+            "create",
+            f"{API_PREFIX}/restaurants/restaurant",
+            "POST",
+            create_restaurant,
+        ),
+        Scenario(
+            "async-create",
+            f"{API_PREFIX}/restaurants/async/restaurant",
+            "POST",
+            lambda rng, index: create_restaurant(rng, index + 1_000_000),
+        ),
+        Scenario(
+            "bugs",
+            f"{API_PREFIX}/bugs/bugs",
+            "GET",
+            lambda rng, index: ("", {}),
+        ),
+        Scenario(
+            "bug",
+            f"{API_PREFIX}/bugs/bugs/<int:pk>",
+            "GET",
+            lambda rng, index: (f"/{rng.choice(bug_ids)}", {}),
+        ),
+        Scenario(
+            "create-bug",
+            f"{API_PREFIX}/bugs/bugs",
+            "POST",
+            lambda rng, index: (
+                "",
+                {
+                    "json": {
+                        "bug_type": rng.choice(Bug.BugType.values),
+                        "title": make_word(rng),
+                        "description": make_word(rng),
+                    }
+                },
+            ),
+        ),
+    ]
+
+
+def _base_path(view: str) -> str:
+    return "/" + view.split("/<", 1)[0]
+
+
+def _query_totals(view: str) -> tuple[float, float]:
+    """view로 기록된 요청당 DB 쿼리 수 히스토그램의 (합계, 개수)"""
+    from utils.metrics import REGISTRY
+
+    total: float = 0
+    count: float = 0
+    for labels, values in REGISTRY.collect()["http_request_db_queries"].items():
+        if labels == (view,):
+            total += values[-1]
+            count += sum(values[:-1])
+    return total, count
+
+
+def run_scenario(
+    base_url: str, scenario: Scenario, requests_count: int, concurrency: int, seed: int
+) -> None:
+    local: threading.local = threading.local()
+    lock: threading.Lock = threading.Lock()
+    timings: list[float] = []
+    failures: list[int] = []
+
+    def send(index: int) -> None:
+        session: Optional[requests.Session] = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        path, kwargs = scenario.build(random.Random(seed * 1_000_003 + index), index)
+        started: float = time.perf_counter()
+        response: requests.Response = session.request(
+            scenario.method,
+            f"{base_url}{_base_path(scenario.view)}{path}",
+            timeout=30,
+            **kwargs,
+        )
+        elapsed: float = (time.perf_counter() - started) * 1000
+        with lock:
+            timings.append(elapsed)
+            if response.status_code >= 400 and response.status_code != 404:
+                failures.append(response.status_code)
+
+    queries_before, count_before = _query_totals(scenario.view)
+    started: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send, range(requests_count)))
+    wall: float = time.perf_counter() - started
+    queries_after, count_after = _query_totals(scenario.view)
+
+    timings.sort()
+    report(
+        scenario.name,
+        {
+            "p50": percentile(timings, 0.5),
+            "p95": percentile(timings, 0.95),
+            "p99": percentile(timings, 0.99),
+        },
+        rps=f"{requests_count / wall:.1f}",
+        failed=len(failures),
+        queries=f"{(queries_after - queries_before) / max(1, count_after - count_before):.1f}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--restaurants", type=int, default=10_000)
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="리뷰, 이미지, IP 기록 각각의 행 수"
+    )
+    parser.add_argument("--bugs", type=int, default=1_000)
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--naver-latency", type=float, default=0.05)
+    parser.add_argument("--naver-jitter", type=float, default=0.01)
+    parser.add_argument("--naver-error-rate", type=float, default=0.0)
+    parser.add_argument("--only", nargs="*", help="실행할 시나리오 이름")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    naver: FakeNaverServer = FakeNaverServer(
+        ("127.0.0.1", 0),
+        args.naver_latency,
+        args.naver_jitter,
+        args.naver_error_rate,
+        args.seed,
+    ).start()
+    work_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+    for key, value in {
+        "NAVER_DEVELOPER_PLATFORM_URL": naver.url,
+        "NAVER_CLOUD_PLATFORM_URL": naver.url,
+        "NAVER_DEVELOPER_PLATFORM_RATE": "1000000",
+        "NAVER_DEVELOPER_PLATFORM_BURST": "1000000",
+        "NAVER_DEVELOPER_PLATFORM_DAILY_LIMIT": "1000000000",
+        "NAVER_CLOUD_PLATFORM_RATE": "1000000",
+        "NAVER_CLOUD_PLATFORM_BURST": "1000000",
+        "NAVER_CLOUD_PLATFORM_DAILY_LIMIT": "1000000000",
+        "NAVER_CLIENT_STATE_DIR": str(Path(work_dir.name) / "naver"),
+        "SHARED_CACHE_LOCATION": str(Path(work_dir.name) / "cache"),
+        "METRICS_DIR": str(Path(work_dir.name) / "metrics"),
+    }.items():
+        os.environ[key] = value
+    setup_django()
+
+    from django.conf import settings
+    from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+    from django.core.wsgi import get_wsgi_application
+    from django.db import connection
+
+    # DEBUG의 쿼리 로그가 측정에 섞이지 않도록 운영과 같게 둔다.
+    settings.DEBUG = False
+    if connection.vendor == "sqlite":
+        # 메모리 DB는 스레드 간 쓰기에서 테이블이 잠기므로 파일 DB를 쓰고,
+        # 읽다가 쓰기로 올라가는 트랜잭션끼리 바로 실패하지 않도록 처음부터 잠근다.
+        connection.settings_dict["TEST"]["NAME"] = str(
+            Path(work_dir.name) / "benchmark.sqlite3"
+        )
+        connection.settings_dict["OPTIONS"].update(
+            timeout=30, transaction_mode="IMMEDIATE"
+        )
+
+    destroy = create_test_database()
+    server: Optional[ThreadedWSGIServer] = None
+    try:
+        from bugs.models import Bug
+        from restaurants.models import Restaurant
+
+        started: float = time.perf_counter()
+        create_fixtures(args)
+        print(
+            f"{args.restaurants} restaurants, {args.rows} reviews/images/ip addresses, "
+            f"{args.bugs} bugs in {time.perf_counter() - started:.1f}s"
+        )
+
+        server = ThreadedWSGIServer(("127.0.0.1", 0), WSGIRequestHandler)
+        server.daemon_threads = True
+        server.set_app(get_wsgi_application())
+        # get_wsgi_application()이 로깅 설정을 다시 적용하므로 그 뒤에 줄인다.
+        logging.getLogger("django.server").setLevel(logging.CRITICAL)
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url: str = f"http://127.0.0.1:{server.server_address[1]}"
+        # 목록 스냅샷은 허용된 Host에만 저장되므로 임의 포트를 추가한다.
+        settings.RESTAURANT_FEED_HOSTS = [f"127.0.0.1:{server.server_address[1]}"]
+
+        scenarios: list[Scenario] = make_scenarios(
+            list(Restaurant.objects.values_list("id", flat=True)),
+            list(Bug.objects.values_list("id", flat=True)),
+        )
+        for scenario in scenarios:
+            if args.only and scenario.name not in args.only:
+                continue
+            run_scenario(base_url, scenario, args.requests, args.concurrency, args.seed)
+        print(f"naver: {naver.requests} requests, {naver.errors} injected errors")
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        destroy()
+        naver.stop()
+        work_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""지연 시간과 에러 비율을 조절할 수 있는 로컬 가짜 네이버 API 서버.
+
+    ENV=local python -m benchmarks.fake_naver --port 8090 --latency 0.05
+
+NAVER_DEVELOPER_PLATFORM_URL, NAVER_CLOUD_PLATFORM_URL을 이 서버 주소로 두면
+NaverClient가 실제 네이버 대신 이 서버를 호출한다.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+# 라이온즈 파크 주변
+BASE_LONGITUDE: float = 128.6812364
+BASE_LATITUDE: float = 35.8411290
+DISTRICTS: tuple[str, ...] = ("수성구", "중구", "동구", "북구", "남구", "달서구")
+
+
+def _seed(query: str) -> int:
+    return int.from_bytes(hashlib.sha256(query.encode()).digest()[:4], "big")
+
+
+def search_places(query: str, display: int) -> dict[str, Any]:
+    seed: int = _seed(query)
+    return {
+        "items": [
+            {
+                "title": f"<b>{query}</b> {index}호점",
+                "roadAddress": (
+                    f"대구광역시 {DISTRICTS[(seed + index) % len(DISTRICTS)]} "
+                    f"야구전설로 {seed % 1000 + index}"
+                ),
+            }
+            for index in range(display)
+        ]
+    }
+
+
+def get_images(query: str, display: int) -> dict[str, Any]:
+    seed: int = _seed(query)
+    return {
+        "items": [
+            {"link": f"https://images.example.com/{seed}/{index}.jpg"}
+            for index in range(display)
+        ]
+    }
+
+
+def geocode(query: str, display: int) -> dict[str, Any]:
+    seed: int = _seed(query)
+    return {
+        "addresses": [
+            {
+                "x": str(BASE_LONGITUDE + (seed % 1000 - 500) / 10000),
+                "y": str(BASE_LATITUDE + (seed // 1000 % 1000 - 500) / 10000),
+                "distance": float(seed % 10000),
+            }
+        ]
+    }
+
+
+ROUTES: dict[str, Callable[[str, int], dict[str, Any]]] = {
+    "/v1/search/local.json": search_places,
+    "/v1/search/image.json": get_images,
+    "/map-geocode/v2/geocode": geocode,
+}
+
+
+class FakeNaverServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        latency: float,
+        jitter: float,
+        error_rate: float,
+        seed: int,
+    ) -> None:
+        super().__init__(address, FakeNaverHandler)
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.requests: int = 0
+        self.errors: int = 0
+        self._rng: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def draw(self) -> tuple[float, bool]:
+        """이번 요청의 지연 시간과 실패 여부를 정한다."""
+        with self._lock:
+            self.requests += 1
+            delay: float = max(0.0, self._rng.gauss(self.latency, self.jitter))
+            failed: bool = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay, failed
+
+    def start(self) -> "FakeNaverServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class FakeNaverHandler(BaseHTTPRequestHandler):
+    server: FakeNaverServer
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: int, content: dict[str, Any]) -> None:
+        body: bytes = json.dumps(content, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        route: Optional[Callable[[str, int], dict[str, Any]]] = ROUTES.get(url.path)
+        if route is None:
+            self._send_json(404, {"errorCode": "SE05", "errorMessage": "Not Found"})
+            return
+
+        delay, failed = self.server.draw()
+        time.sleep(delay)
+        if failed:
+            self._send_json(500, {"errorCode": "SE99", "errorMessage": "System Error"})
+            return
+
+        params: dict[str, list[str]] = parse_qs(url.query)
+        query: str = params.get("query", [""])[0]
+        display: int = int(params.get("display", ["5"])[0])
+        self._send_json(200, route(query, display))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server: FakeNaverServer = FakeNaverServer(
+        (args.host, args.port), args.latency, args.jitter, args.error_rate, args.seed
+    )
+    print(f"fake naver server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
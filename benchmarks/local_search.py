@@ -0,0 +1,87 @@
+"""가상 식당과 리뷰로 n-gram 검색 색인을 채우고 로컬 검색 시간을 측정한다.
+
+    ENV=local python -m benchmarks.local_search --rows 20000
+"""
+
+import argparse
+import random
+
+from benchmarks.utils import create_test_database, measure, report, setup_django
+
+SYLLABLES: str = "가나다라마바사아자차카타파하원조막창곱찜닭국밥커피술집회초밥면옥"
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def create_rows(rows: int, reviews: int, seed: int) -> None:
+    from restaurants.models import Restaurant, Review
+    from restaurants.search import RestaurantSearchIndex
+
+    rng: random.Random = random.Random(seed)
+    restaurants: list[Restaurant] = []
+    for index in range(rows):
+        name: str = f"{make_word(rng)}{make_word(rng)}"
+        address: str = f"대구광역시 {make_word(rng)}구 {make_word(rng)}로 {index}"
+        restaurants.append(
+            Restaurant(
+                name=name,
+                address=address,
+                detail_address=name,
+                longitude=128.68,
+                latitude=35.84,
+                far_from_lions_park=0,
+                category=Restaurant.RestaurantType.KOREAN,
+                suggested_count=rng.randint(1, 50),
+                identity_key=Restaurant.make_identity_key(name, address, name),
+            )
+        )
+    Restaurant.objects.bulk_create(restaurants, batch_size=5000)
+
+    restaurants = list(Restaurant.objects.only("id", "name", "address"))
+    Review.objects.bulk_create(
+        [
+            Review(
+                restaurant=rng.choice(restaurants),
+                post=" ".join(make_word(rng) for _ in range(8)),
+            )
+            for _ in range(reviews)
+        ],
+        batch_size=5000,
+    )
+    for start in range(0, len(restaurants), 1000):
+        RestaurantSearchIndex.index_restaurants(restaurants[start : start + 1000])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--reviews", type=int, default=40_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    destroy = create_test_database()
+    try:
+        from restaurants.models import RestaurantSearchGram
+        from restaurants.search import RestaurantSearchIndex
+
+        create_rows(args.rows, args.reviews, args.seed)
+        print(
+            f"{args.rows} restaurants, {args.reviews} reviews, "
+            f"{RestaurantSearchGram.objects.count()} grams"
+        )
+
+        for query in ("원조막창", "국밥", "대구광역시 조막"):
+            report(
+                f"search {query!r}",
+                measure(lambda: RestaurantSearchIndex.search(query, 20), args.repeat),
+            )
+    finally:
+        destroy()
+
+
+if __name__ == "__main__":
+    main()
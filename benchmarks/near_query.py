@@ -0,0 +1,96 @@
+"""100k 개의 가상 식당으로 near/radius 조회를 측정한다.
+
+    ENV=local python -m benchmarks.near_query --rows 100000
+"""
+
+import argparse
+import random
+
+from benchmarks.utils import create_test_database, measure, report, setup_django
+
+DAEGU_BOUNDS: tuple[tuple[float, float], tuple[float, float]] = (
+    (128.35, 128.85),
+    (35.65, 36.05),
+)
+
+
+def create_restaurants(rows: int, seed: int) -> None:
+    from restaurants.models import Restaurant
+    from utils import geohash
+
+    rng: random.Random = random.Random(seed)
+    (min_longitude, max_longitude), (min_latitude, max_latitude) = DAEGU_BOUNDS
+    batch: list[Restaurant] = []
+    for index in range(rows):
+        longitude: float = rng.uniform(min_longitude, max_longitude)
+        latitude: float = rng.uniform(min_latitude, max_latitude)
+        batch.append(
+            Restaurant(
+                name=f"식당{index}",
+                address=f"대구광역시 가상구 {index}",
+                detail_address=f"식당{index}",
+                longitude=longitude,
+                latitude=latitude,
+                far_from_lions_park=0,
+                category=Restaurant.RestaurantType.KOREAN,
+                geohash=geohash.encode(longitude, latitude),
+                identity_key=Restaurant.make_identity_key(
+                    f"식당{index}", f"대구광역시 가상구 {index}", f"식당{index}"
+                ),
+            )
+        )
+        if len(batch) == 5000:
+            Restaurant.objects.bulk_create(batch)
+            batch = []
+    Restaurant.objects.bulk_create(batch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_django()
+    destroy = create_test_database()
+    try:
+        from restaurants.filters import RestaurantFilter
+        from restaurants.models import Restaurant
+        from utils.geo import haversine_expression
+
+        create_restaurants(args.rows, args.seed)
+        print(f"{args.rows} restaurants")
+
+        for radius in (0.5, 1, 3):
+            params = {"near": "35.8411,128.6812", "radius": radius}
+
+            def near_query() -> list[int]:
+                return list(
+                    RestaurantFilter(
+                        params, queryset=Restaurant.objects.all()
+                    ).qs.values_list("id", flat=True)
+                )
+
+            def full_scan() -> list[int]:
+                return list(
+                    Restaurant.objects.annotate(
+                        distance=haversine_expression((128.6812, 35.8411))
+                    )
+                    .filter(distance__lte=radius)
+                    .order_by("distance", "id")
+                    .values_list("id", flat=True)
+                )
+
+            assert near_query() == full_scan()
+            report(
+                f"near radius={radius}km ({len(near_query())} rows)",
+                measure(near_query, args.repeat),
+            )
+            report(f"full scan radius={radius}km", measure(full_scan, args.repeat))
+    finally:
+        destroy()
+
+
+if __name__ == "__main__":
+    main()
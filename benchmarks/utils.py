@@ -0,0 +1,53 @@
+import os
+import statistics
+import time
+from typing import Any, Callable
+
+import django
+
+
+def setup_django() -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "winoreat.settings")
+    os.environ.setdefault("ENV", "local")
+    django.setup()
+
+
+def create_test_database() -> Callable[[], None]:
+    """실제 DB를 건드리지 않도록 테스트 DB를 만들고, 정리 함수를 돌려준다."""
+    from django.db import connection
+
+    old_name: str = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+
+    def destroy() -> None:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    return destroy
+
+
+def percentile(timings: list[float], ratio: float) -> float:
+    """정렬된 timings의 분위수"""
+    return timings[min(len(timings) - 1, int(len(timings) * ratio))]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    func()
+    timings: list[float] = []
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "max": timings[-1],
+    }
+
+
+def report(label: str, timings: dict[str, float], **extra: Any) -> None:
+    print(
+        f"{label:<40} "
+        + " ".join(f"{key}={value:8.3f}ms" for key, value in timings.items())
+        + "".join(f" {key}={value}" for key, value in extra.items())
+    )
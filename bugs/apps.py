@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BugsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bugs"
+
+    def ready(self) -> None:
+        import bugs.signals  # noqa: F401
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bugs", "0002_alter_bug_bug_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(fields=["modified"], name="answer_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="bug",
+            index=models.Index(fields=["modified"], name="bug_modified_idx"),
+        ),
+    ]
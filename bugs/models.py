@@ -1,6 +1,8 @@
 from django.db import models
 from django_extensions.db.models import TimeStampedModel
 
+from utils.conditional import DeletionMarker
+
 
 class Bug(TimeStampedModel):
     class BugType(models.TextChoices):
@@ -24,7 +26,21 @@ class Bug(TimeStampedModel):
     title = models.CharField(verbose_name="제목", max_length=63)
     description = models.CharField(verbose_name="내용", max_length=1023)
 
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(fields=["modified"], name="bug_modified_idx"),
+        ]
+
 
 class Answer(TimeStampedModel):
     bug = models.ForeignKey(Bug, on_delete=models.CASCADE, related_name="answers")
     answer = models.CharField("처리 내용", max_length=1023)
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(fields=["modified"], name="answer_modified_idx"),
+        ]
+
+
+class BugDeletionMarker(DeletionMarker):
+    pass
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from bugs.models import Answer, Bug, BugDeletionMarker
+
+
+@receiver(post_delete, sender=Bug)
+@receiver(post_delete, sender=Answer)
+def mark_bug_deleted(sender, **kwargs) -> None:
+    BugDeletionMarker.mark(sender)
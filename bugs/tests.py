@@ -1,3 +1,74 @@
+from unittest.mock import patch
+
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from bugs.models import Answer, Bug, BugDeletionMarker
+from utils.testing import IsolatedStateMixin
+
+
+class BugsLastModifiedTest(IsolatedStateMixin, TestCase):
+    URL = "/api/v1/bugs/bugs"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.bug = Bug.objects.create(
+            bug_type=Bug.BugType.SERVICE_NOT_WORKED,
+            status_type=Bug.StatusType.REPORTED,
+            title="제목",
+            description="내용",
+        )
+
+    def test_list_returns_304_from_one_query(self):
+        last_modified = self.client.get(self.URL)["Last-Modified"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.URL, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_retrieve_accounts_for_answers(self):
+        url = f"{self.URL}/{self.bug.id}"
+        second = timezone.now().replace(microsecond=0) + timezone.timedelta(seconds=1)
+        Bug.objects.filter(id=self.bug.id).update(modified=second)
+        cached = self.client.get(url)
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=cached["ETag"]).status_code, 304
+        )
+
+        # Last-Modified와 같은 초 안의 쓰기
+        with patch(
+            "django.utils.timezone.now",
+            return_value=second + timezone.timedelta(milliseconds=500),
+        ):
+            Answer.objects.create(bug=self.bug, answer="고쳤어요.")
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=cached["ETag"],
+            HTTP_IF_MODIFIED_SINCE=cached["Last-Modified"],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["answers"][0]["answer"], "고쳤어요.")
+
+    def test_list_accounts_for_deletes(self):
+        second = timezone.now().replace(microsecond=0) + timezone.timedelta(seconds=1)
+        Bug.objects.filter(id=self.bug.id).update(modified=second)
+        Bug.objects.create(
+            bug_type=Bug.BugType.ADVERTISEMENT_DOUBT,
+            status_type=Bug.StatusType.REPORTED,
+            title="광고",
+            description="광고 같아요.",
+        )
+        cached = self.client.get(self.URL)
+
+        with patch(
+            "django.utils.timezone.now",
+            return_value=second + timezone.timedelta(milliseconds=500),
+        ):
+            Bug.objects.get(title="광고").delete()
 
-# Create your tests here.
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=cached["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(BugDeletionMarker.objects.count(), 1)
@@ -1,15 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from django.utils.decorators import method_decorator
 from rest_framework.generics import ListCreateAPIView, RetrieveAPIView
 from rest_framework.permissions import AllowAny
 
 from bugs.filters import BugFilter
-from bugs.models import Bug
+from bugs.models import Answer, Bug, BugDeletionMarker
 from bugs.serializers import (
     CreateBugSerializer,
     ListBugsSerializer,
     RetrieveBugSerializer,
 )
+from utils.conditional import get_last_modified, last_modified_condition
+
+
+def get_bugs_last_modified(request, *args, **kwargs) -> Optional[datetime]:
+    return get_last_modified(Bug.objects.all(), BugDeletionMarker.objects.all())
+
+
+def get_bug_last_modified(request, pk: int, *args, **kwargs) -> Optional[datetime]:
+    return get_last_modified(
+        Bug.objects.filter(pk=pk),
+        Answer.objects.filter(bug_id=pk),
+        BugDeletionMarker.objects.all(),
+    )
 
 
+@method_decorator(last_modified_condition(get_bugs_last_modified), name='get')
 class CreateListBugsView(ListCreateAPIView):
     permission_classes = (AllowAny,)
     queryset = Bug.objects.all()
@@ -21,6 +39,7 @@ class CreateListBugsView(ListCreateAPIView):
         return ListBugsSerializer
 
 
+@method_decorator(last_modified_condition(get_bug_last_modified), name='get')
 class RetrieveBugsView(RetrieveAPIView):
     permission_classes = (AllowAny,)
     serializer_class = RetrieveBugSerializer
@@ -40,3 +40,7 @@ class AuthenticationFailedException(NaverClientException):
 
 class InvalidParameterException(NaverClientException):
     pass
+
+
+class CassetteMissException(NaverClientException):
+    pass
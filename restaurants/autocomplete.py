@@ -0,0 +1,186 @@
+import heapq
+import sys
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Final, Optional
+
+from restaurants.dtos import SearchRestaurantsDto
+from restaurants.models import Restaurant
+from utils.parsers import normalize_query
+
+Key = tuple[str, str]
+
+
+class RestaurantAutocomplete:
+    """식당 이름 접두어 자동완성을 위한 프로세스별 정렬 배열 색인.
+
+    suggest는 lock 없이 읽으므로 _keys와 _top의 목록은 제자리에서 바꾸지 않고
+    새 목록으로 교체한다. 일치하는 이름이 많은 짧은 접두어는 추천 횟수 상위
+    TOP_SIZE개를 미리 유지한다.
+    """
+
+    TOP_PREFIX_LENGTH: Final[int] = 2
+    TOP_SIZE: Final[int] = 20
+    ENTRY_OVERHEAD: Final[int] = 200
+
+    def __init__(self, memory_budget: int, refresh_interval: float) -> None:
+        self.memory_budget: int = memory_budget
+        self.refresh_interval: float = refresh_interval
+        self._keys: list[Key] = []
+        self._entries: dict[Key, tuple[str, int]] = {}
+        self._top: dict[str, list[tuple[int, Key]]] = {}
+        self._memory: int = 0
+        self._last_modified: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def memory(self) -> int:
+        return self._memory
+
+    def _estimate(self, key: Key, name: str) -> int:
+        return (
+            sys.getsizeof(key[0])
+            + sys.getsizeof(key[1])
+            + sys.getsizeof(name)
+            + self.ENTRY_OVERHEAD
+        )
+
+    def _short_prefixes(self, key: Key) -> list[str]:
+        return [
+            key[0][:length]
+            for length in range(1, min(len(key[0]), self.TOP_PREFIX_LENGTH) + 1)
+        ]
+
+    def _rank(self, key: Key, weight: int) -> None:
+        for prefix in self._short_prefixes(key):
+            top: list[tuple[int, Key]] = [
+                item for item in self._top.get(prefix, []) if item[1] != key
+            ]
+            insort(top, (-weight, key))
+            self._top[prefix] = top[: self.TOP_SIZE]
+
+    def _add(self, name: str, road_address: str, weight: int) -> Optional[Key]:
+        """새로 들어간 key를 돌려준다. _keys에 넣는 것은 호출하는 쪽에서 한다."""
+        key: Key = (normalize_query(name), road_address)
+        entry: Optional[tuple[str, int]] = self._entries.get(key)
+        if entry is not None and entry[1] > weight:
+            return None
+        if entry is None:
+            self._memory += self._estimate(key, name)
+        self._entries[key] = (name, weight)
+        self._rank(key, weight)
+        return key if entry is None else None
+
+    def _evict(self) -> None:
+        if self._memory <= self.memory_budget:
+            return
+
+        target: int = int(self.memory_budget * 0.9)
+        for key in sorted(self._entries, key=lambda key: self._entries[key][1]):
+            if self._memory <= target:
+                break
+            name, _ = self._entries.pop(key)
+            self._memory -= self._estimate(key, name)
+        self._keys = sorted(self._entries)
+
+        top: dict[str, list[tuple[int, Key]]] = {}
+        for key, (_, weight) in self._entries.items():
+            for prefix in self._short_prefixes(key):
+                top.setdefault(prefix, []).append((-weight, key))
+        self._top = {
+            prefix: heapq.nsmallest(self.TOP_SIZE, items)
+            for prefix, items in top.items()
+        }
+
+    def add(self, name: str, road_address: str, weight: int = 0) -> None:
+        with self._lock:
+            key: Optional[Key] = self._add(name, road_address, weight)
+            if key is not None:
+                keys: list[Key] = list(self._keys)
+                insort(keys, key)
+                self._keys = keys
+            self._evict()
+
+    def _is_refresh_due(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_interval
+        )
+
+    def _refresh(self) -> None:
+        restaurants = Restaurant.objects.order_by("modified")
+        if self._last_modified is not None:
+            # 늦게 커밋된 행을 놓치지 않도록 조금 겹쳐서 읽는다.
+            restaurants = restaurants.filter(
+                modified__gte=self._last_modified
+                - timedelta(seconds=self.refresh_interval)
+            )
+        new_keys: list[Key] = []
+        for name, address, suggested_count, modified in restaurants.values_list(
+            "name", "address", "suggested_count", "modified"
+        ).iterator():
+            key: Optional[Key] = self._add(name, address, suggested_count)
+            if key is not None:
+                new_keys.append(key)
+            self._last_modified = modified
+        if new_keys:
+            self._keys = sorted(self._keys + new_keys)
+        self._evict()
+        self._refreshed_at = time.monotonic()
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._refresh()
+
+    def _refresh_if_due(self) -> None:
+        if not self._is_refresh_due():
+            return
+        with self._lock:
+            if self._is_refresh_due():
+                self._refresh()
+
+    def suggest(self, query: str, limit: int) -> list[SearchRestaurantsDto]:
+        self._refresh_if_due()
+
+        prefix: str = normalize_query(query)
+        if not prefix:
+            return []
+
+        ranked: list[tuple[int, Key]]
+        if len(prefix) <= self.TOP_PREFIX_LENGTH and limit <= self.TOP_SIZE:
+            ranked = self._top.get(prefix, [])[:limit]
+        else:
+            keys: list[Key] = self._keys
+            matches: list[tuple[int, Key]] = []
+            for key in islice(keys, bisect_left(keys, (prefix,)), None):
+                if not key[0].startswith(prefix):
+                    break
+                entry: Optional[tuple[str, int]] = self._entries.get(key)
+                if entry is not None:
+                    matches.append((-entry[1], key))
+            ranked = heapq.nsmallest(limit, matches)
+
+        suggestions: list[SearchRestaurantsDto] = []
+        for _, key in ranked:
+            entry = self._entries.get(key)
+            if entry is not None:
+                suggestions.append(
+                    SearchRestaurantsDto(name=entry[0], road_address=key[1])
+                )
+        return suggestions
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = []
+            self._entries = {}
+            self._top = {}
+            self._memory = 0
+            self._last_modified = None
+            self._refreshed_at = None
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
 
 @dataclass
@@ -7,6 +9,30 @@ class SearchRestaurantsDto:
     road_address: str
 
 
+@dataclass
+class LocalSearchRestaurantDto:
+    id: int
+    name: str
+    address: str
+    category: str
+    suggested_count: int
+
+
 @dataclass
 class CreateRestaurantDto:
     count: int
+
+
+@dataclass
+class RestaurantFeedDto:
+    etag: str
+    content: bytes
+    last_modified: datetime
+    generation: int
+
+
+@dataclass
+class ImportRestaurantsDto:
+    created: int
+    skipped: int
+    failed_rows: list[dict[str, Any]]
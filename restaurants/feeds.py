@@ -0,0 +1,67 @@
+import hashlib
+from typing import Final, Optional
+
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from restaurants.dtos import RestaurantFeedDto
+from restaurants.models import RestaurantFeedGeneration
+
+
+class RestaurantFeed:
+    CACHE_ALIAS: Final[str] = "shared"
+    GENERATION_ID: Final[int] = 1
+
+    def __init__(self) -> None:
+        self._cache: BaseCache = caches[self.CACHE_ALIAS]
+
+    def get_generation(self) -> int:
+        """목록을 만들기 전에 한 번 읽고 get/save에 그대로 넘긴다.
+
+        저장할 때 다시 읽으면, 렌더링 중에 커밋된 쓰기로 올라간 세대로
+        이전 내용이 저장되어 다음 쓰기 전까지 계속 제공된다.
+        """
+        return (
+            RestaurantFeedGeneration.objects.filter(id=self.GENERATION_ID)
+            .values_list("generation", flat=True)
+            .first()
+            or 0
+        )
+
+    @staticmethod
+    def _snapshot_key(variant: str) -> str:
+        return f"restaurant-feed:{variant}"
+
+    def get(self, generation: int, variant: str) -> Optional[RestaurantFeedDto]:
+        snapshot: Optional[RestaurantFeedDto] = self._cache.get(
+            self._snapshot_key(variant)
+        )
+        if snapshot is None or snapshot.generation != generation:
+            return None
+        return snapshot
+
+    def save(self, generation: int, variant: str, content: bytes) -> RestaurantFeedDto:
+        """variant마다 키 하나를 덮어쓰므로 세대가 바뀌어도 캐시 파일이 늘지 않는다."""
+        snapshot = RestaurantFeedDto(
+            etag=f'"{hashlib.sha256(content).hexdigest()}"',
+            content=content,
+            last_modified=timezone.now(),
+            generation=generation,
+        )
+        self._cache.set(self._snapshot_key(variant), snapshot, timeout=None)
+        return snapshot
+
+    @classmethod
+    def _bump_generation(cls) -> None:
+        if not RestaurantFeedGeneration.objects.filter(id=cls.GENERATION_ID).update(
+            generation=F("generation") + 1, modified=timezone.now()
+        ):
+            RestaurantFeedGeneration.objects.get_or_create(
+                id=cls.GENERATION_ID, defaults={"generation": 1}
+            )
+
+    @classmethod
+    def invalidate(cls) -> None:
+        transaction.on_commit(cls._bump_generation)
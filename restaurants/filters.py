@@ -1,14 +1,73 @@
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from typing import Final, Optional
+
+from django.db.models import Q, QuerySet
 from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
 
 from restaurants.models import Restaurant
+from utils import geohash
+from utils.geo import haversine_expression, parse_coordinate
 
 
 class RestaurantFilter(filters.FilterSet):
+    DEFAULT_NEAR_RADIUS_KM: Final[float] = 1
+    MAXIMUM_NEAR_RADIUS_KM: Final[float] = 50
+
     category = filters.ChoiceFilter(choices=Restaurant.RestaurantType.choices)
     max_range = filters.NumberFilter(
         field_name="far_from_lions_park", lookup_expr="lte"
     )
+    origin = filters.CharFilter(method="filter_origin")
+    near = filters.CharFilter(method="filter_near")
+    radius = filters.NumberFilter(method="filter_radius")
 
     class Meta:
         model = Restaurant
-        fields = ["category", "max_range"]
+        fields = ["category", "max_range", "origin", "near", "radius"]
+
+    def filter_origin(
+        self, queryset: QuerySet[Restaurant], name: str, value: str
+    ) -> QuerySet[Restaurant]:
+        try:
+            origin: tuple[float, float] = parse_coordinate(value, latitude_first=True)
+        except ValueError:
+            raise ValidationError({name: "위도,경도 형식이어야 합니다."})
+        return queryset.annotate(distance=haversine_expression(origin)).order_by(
+            "distance", "id"
+        )
+
+    def filter_near(
+        self, queryset: QuerySet[Restaurant], name: str, value: str
+    ) -> QuerySet[Restaurant]:
+        try:
+            longitude, latitude = parse_coordinate(value, latitude_first=True)
+        except ValueError:
+            raise ValidationError({name: "위도,경도 형식이어야 합니다."})
+
+        # radius=0도 기본값으로 바뀌지 않고 검증에서 걸러지도록 None만 확인한다.
+        value: Optional[Decimal] = self.form.cleaned_data.get("radius")
+        radius: float = self.DEFAULT_NEAR_RADIUS_KM if value is None else float(value)
+        if not 0 < radius <= self.MAXIMUM_NEAR_RADIUS_KM:
+            raise ValidationError(
+                {"radius": f"0km 초과 {self.MAXIMUM_NEAR_RADIUS_KM}km 이하여야 합니다."}
+            )
+
+        cells: Optional[list[str]] = geohash.covering_cells(longitude, latitude, radius)
+        if cells:
+            queryset = queryset.filter(
+                reduce(or_, (Q(geohash__startswith=cell) for cell in cells))
+            )
+        return (
+            queryset.annotate(distance=haversine_expression((longitude, latitude)))
+            .filter(distance__lte=radius)
+            .order_by("distance", "id")
+        )
+
+    def filter_radius(
+        self, queryset: QuerySet[Restaurant], name: str, value: float
+    ) -> QuerySet[Restaurant]:
+        # filter_near 에서 함께 사용
+        return queryset
@@ -13,6 +13,7 @@ from exceptions import (
     ApplicationAuthenticationFailedException,
     NotFoundException,
     InternalServerErrorException,
+    CassetteMissException,
 )
 
 
@@ -29,7 +30,7 @@ class RestaurantExceptionHandler:
                 UnknownNaverException,
             ): InvalidRequestException,
             AuthenticationFailedException: ApplicationAuthenticationFailedException,
-            InvalidSearchAPIException: NotFoundException,
+            (InvalidSearchAPIException, CassetteMissException): NotFoundException,
             SystemErrorException: InternalServerErrorException,
         }
 
@@ -45,4 +46,6 @@ class RestaurantExceptionHandler:
             return InvalidRequestException(str(exception))
         elif isinstance(exception, SystemErrorException):
             return InternalServerErrorException(str(exception))
+        elif isinstance(exception, CassetteMissException):
+            return NotFoundException(str(exception))
         return exception
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+
+from restaurants.models import RestaurantImage
+
+
+class Command(BaseCommand):
+    help = (
+        "같은 식당에 중복으로 저장된 이미지 주소를 하나만 남기고 삭제합니다. "
+        "이미지가 많다면 0014 마이그레이션 전에 실행해 두세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 중복 개수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        duplicates = (
+            RestaurantImage.objects.values("restaurant_id", "img_url")
+            .annotate(image_count=Count("id"), keep_id=Min("id"))
+            .filter(image_count__gt=1)
+            .order_by()
+        )
+
+        deleted: int = 0
+        for duplicate in duplicates.iterator():
+            if options["dry_run"]:
+                deleted += duplicate["image_count"] - 1
+                continue
+            with transaction.atomic():
+                count, _ = (
+                    RestaurantImage.objects.filter(
+                        restaurant_id=duplicate["restaurant_id"],
+                        img_url=duplicate["img_url"],
+                    )
+                    .exclude(id=duplicate["keep_id"])
+                    .only("id")
+                    .delete()
+                )
+            deleted += count
+
+        self.stdout.write(
+            f"중복 이미지 {deleted}개를 {'찾았습니다' if options['dry_run'] else '삭제했습니다'}."
+        )
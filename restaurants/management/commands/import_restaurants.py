@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+from typing import Any, Iterator, TextIO
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from restaurants.dtos import ImportRestaurantsDto
+from restaurants.services import RestaurantImportService
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV/JSON Lines 파일에서 식당을 대량으로 가져옵니다. "
+        "name, address, category 열이 필요하고 detail_address, players_pick, "
+        "longitude, latitude 열은 선택입니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("csv", "jsonl"))
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument(
+            "--workers", type=int, default=settings.NAVER_CLIENT_FAN_OUT_WORKERS
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="처리한 행 수를 기록할 파일 경로 (기본값: <path>.checkpoint)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="체크포인트에 기록된 행 이후부터 다시 가져옵니다.",
+        )
+        parser.add_argument(
+            "--rejects",
+            help=(
+                "좌표를 얻지 못한 행을 JSON Lines로 기록할 파일 경로 "
+                "(기본값: <path>.rejects.jsonl). 이 파일을 다시 가져오면 재시도합니다."
+            ),
+        )
+        parser.add_argument(
+            "--no-images",
+            action="store_true",
+            help="가져온 식당의 이미지 수집 작업을 등록하지 않습니다.",
+        )
+
+    def handle(self, *args, **options):
+        path: str = options["path"]
+        file_format: str = options["format"] or (
+            "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+        )
+        checkpoint: str = options["checkpoint"] or f"{path}.checkpoint"
+        rejects: str = options["rejects"] or f"{path}.rejects.jsonl"
+        processed: int = self._read_checkpoint(checkpoint) if options["resume"] else 0
+
+        service: RestaurantImportService = RestaurantImportService(
+            workers=options["workers"], fetch_images=not options["no_images"]
+        )
+        started: float = time.perf_counter()
+        created: int = 0
+        skipped: int = 0
+        failed: int = 0
+
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as file, open(
+                rejects, "a" if options["resume"] else "w", encoding="utf-8"
+            ) as rejects_file:
+                rows: Iterator[dict[str, Any]] = islice(
+                    self._read_rows(file, file_format), processed, None
+                )
+                while chunk := list(islice(rows, options["chunk_size"])):
+                    result: ImportRestaurantsDto = service.import_rows(chunk)
+                    processed += len(chunk)
+                    created += result.created
+                    skipped += result.skipped
+                    failed += len(result.failed_rows)
+                    # 체크포인트가 넘어가기 전에 재시도할 행을 남긴다.
+                    self._write_rejects(rejects_file, result.failed_rows)
+                    self._write_checkpoint(checkpoint, processed)
+                    if options["verbosity"] > 1:
+                        self.stdout.write(
+                            f"{processed}행 처리됨 "
+                            f"(추가 {created}, 건너뜀 {skipped}, 실패 {failed})"
+                        )
+        finally:
+            service.close()
+
+        elapsed: float = time.perf_counter() - started
+        self.stdout.write(
+            f"식당 {created}개를 추가하고 {skipped}개를 건너뛰었습니다. "
+            f"({elapsed:.1f}초, 초당 "
+            f"{(created + skipped + failed) / elapsed if elapsed else 0:.0f}행)"
+        )
+        if failed:
+            self.stdout.write(
+                f"좌표를 얻지 못한 {failed}개 행을 {rejects}에 기록했습니다."
+            )
+
+    @staticmethod
+    def _read_rows(file: TextIO, file_format: str) -> Iterator[dict[str, Any]]:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+            return
+
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                raise CommandError(f"{line_number}번째 줄이 JSON이 아닙니다.") from exc
+
+    @staticmethod
+    def _write_rejects(file: TextIO, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        file.flush()
+
+    @staticmethod
+    def _read_checkpoint(checkpoint: str) -> int:
+        try:
+            with open(checkpoint) as file:
+                return int(file.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _write_checkpoint(checkpoint: str, processed: int) -> None:
+        with open(f"{checkpoint}.tmp", "w") as file:
+            file.write(str(processed))
+        os.replace(f"{checkpoint}.tmp", checkpoint)
@@ -0,0 +1,93 @@
+import json
+import time
+from datetime import datetime
+from typing import Optional, TextIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from restaurants.models import IPAddress
+from restaurants.validators import RestaurantValidator
+
+
+class Command(BaseCommand):
+    help = "추천 제한 기간이 지난 작성자 IP 기록을 배치 단위로 삭제(또는 보관)합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=RestaurantValidator.RESTAURANT_ADD_COOLDOWN_DAYS,
+            help="이 기간(일)보다 오래된 기록을 정리합니다.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="배치 사이에 기다리는 시간(초)",
+        )
+        parser.add_argument(
+            "--archive",
+            help="삭제하기 전에 기록을 JSON Lines 형식으로 덧붙여 저장할 파일 경로",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < RestaurantValidator.RESTAURANT_ADD_COOLDOWN_DAYS:
+            raise CommandError(
+                f"{RestaurantValidator.RESTAURANT_ADD_COOLDOWN_DAYS}일보다 짧게 정리할 수 없습니다."
+            )
+
+        cutoff: datetime = timezone.now() - timezone.timedelta(days=options["days"])
+        archive: Optional[TextIO] = (
+            open(options["archive"], "a", encoding="utf-8")
+            if options["archive"]
+            else None
+        )
+        started: float = time.perf_counter()
+        pruned: int = 0
+
+        try:
+            while True:
+                deleted: int = self._prune_batch(cutoff, options["batch_size"], archive)
+                if not deleted:
+                    break
+                pruned += deleted
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"{pruned}개 정리됨")
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+        finally:
+            if archive is not None:
+                archive.close()
+
+        elapsed: float = time.perf_counter() - started
+        self.stdout.write(
+            f"{pruned}개의 작성자 IP 기록을 정리했습니다. "
+            f"({elapsed:.1f}초, 초당 {pruned / elapsed if elapsed else 0:.0f}개)"
+        )
+
+    @staticmethod
+    def _prune_batch(
+        cutoff: datetime, batch_size: int, archive: Optional[TextIO]
+    ) -> int:
+        with transaction.atomic():
+            rows: list[dict] = list(
+                IPAddress.objects.filter(created__lt=cutoff)
+                .order_by("id")
+                .values("id", "restaurant_id", "ip_address", "created")[:batch_size]
+            )
+            if not rows:
+                return 0
+
+            if archive is not None:
+                for row in rows:
+                    archive.write(
+                        json.dumps({**row, "created": row["created"].isoformat()})
+                        + "\n"
+                    )
+                archive.flush()
+
+            IPAddress.objects.filter(id__in=[row["id"] for row in rows]).delete()
+            return len(rows)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from restaurants.models import SuggestionCooldown
+
+
+class Command(BaseCommand):
+    help = "만료된 식당 추천 제한 기록을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        purged: int = 0
+
+        while True:
+            ids: list[int] = list(
+                SuggestionCooldown.objects.filter(expires_at__lte=now).values_list(
+                    "id", flat=True
+                )[: options["batch_size"]]
+            )
+            if not ids:
+                break
+            deleted, _ = SuggestionCooldown.objects.filter(id__in=ids).delete()
+            purged += deleted
+
+        self.stdout.write(f"{purged}개의 만료된 추천 제한 기록을 삭제했습니다.")
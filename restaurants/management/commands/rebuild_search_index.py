@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from restaurants.models import Restaurant
+from restaurants.search import RestaurantSearchIndex
+
+
+class Command(BaseCommand):
+    help = "식당 이름, 주소, 리뷰의 n-gram 검색 색인을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        last_id: int = 0
+        indexed: int = 0
+
+        while True:
+            restaurants: list[Restaurant] = list(
+                Restaurant.objects.filter(id__gt=last_id)
+                .only("id", "name", "address")
+                .order_by("id")[: options["batch_size"]]
+            )
+            if not restaurants:
+                break
+            with transaction.atomic():
+                RestaurantSearchIndex.index_restaurants(restaurants)
+            last_id = restaurants[-1].id
+            indexed += len(restaurants)
+
+        self.stdout.write(f"{indexed}개 식당의 검색 색인을 다시 만들었습니다.")
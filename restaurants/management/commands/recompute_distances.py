@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from restaurants.feeds import RestaurantFeed
+from restaurants.models import Restaurant
+from utils.geo import haversine_expression
+
+
+class Command(BaseCommand):
+    help = "모든 식당의 라팍과의 거리를 좌표로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        # update()는 post_save를 보내지 않으므로 목록 캐시를 직접 무효화한다.
+        updated: int = Restaurant.objects.update(
+            far_from_lions_park=haversine_expression(settings.LIONS_PARK_COORDINATE),
+            modified=timezone.now(),
+        )
+        RestaurantFeed.invalidate()
+        self.stdout.write(f"{updated}개 식당의 거리를 다시 계산했습니다.")
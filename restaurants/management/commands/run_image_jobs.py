@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from restaurants.services import RestaurantImageService
+
+
+class Command(BaseCommand):
+    help = "식당 이미지 수집 작업을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=20)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=5,
+            help="처리할 작업이 없을 때 기다리는 시간(초)",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="대기 중인 작업을 한 번만 처리합니다."
+        )
+
+    def handle(self, *args, **options):
+        service: RestaurantImageService = RestaurantImageService()
+
+        while True:
+            processed: int = service.run_pending_jobs(options["batch_size"])
+            if processed:
+                self.stdout.write(f"{processed}개의 이미지 수집 작업을 처리했습니다.")
+            if options["once"]:
+                return
+            if processed < options["batch_size"]:
+                time.sleep(options["sleep"])
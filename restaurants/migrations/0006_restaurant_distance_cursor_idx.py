@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0005_remove_restaurant_ip_address_ipaddress"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="restaurant",
+            index=models.Index(
+                fields=["far_from_lions_park", "players_pick", "id"],
+                name="restaurant_distance_cursor_idx",
+            ),
+        ),
+    ]
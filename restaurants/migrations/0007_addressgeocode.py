@@ -0,0 +1,57 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:11
+
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0006_restaurant_distance_cursor_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AddressGeocode",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "address_key",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="정규화된 주소 해시"
+                    ),
+                ),
+                (
+                    "address",
+                    models.CharField(max_length=1023, verbose_name="정규화된 주소"),
+                ),
+                ("longitude", models.FloatField(verbose_name="경도")),
+                ("latitude", models.FloatField(verbose_name="위도")),
+                ("distance", models.FloatField(verbose_name="라팍과의 직선 거리(m)")),
+            ],
+            options={
+                "get_latest_by": "modified",
+                "abstract": False,
+            },
+        ),
+    ]
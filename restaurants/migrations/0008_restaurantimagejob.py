@@ -0,0 +1,79 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:15
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0007_addressgeocode"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RestaurantImageJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "status_type",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "대기"),
+                            ("RUNNING", "진행 중"),
+                            ("DONE", "완료"),
+                            ("FAILED", "실패"),
+                        ],
+                        default="PENDING",
+                        max_length=15,
+                        verbose_name="작업 상태",
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0, verbose_name="시도 횟수")),
+                ("run_after", models.DateTimeField(verbose_name="실행 가능 시각")),
+                (
+                    "last_error",
+                    models.TextField(blank=True, null=True, verbose_name="마지막 에러"),
+                ),
+                (
+                    "restaurant",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="image_job",
+                        to="restaurants.restaurant",
+                        verbose_name="식당 id",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "modified",
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["status_type", "run_after"], name="image_job_due_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:19
+
+from django.db import migrations, models
+
+from utils import geohash
+
+
+def fill_geohash(apps, schema_editor):
+    Restaurant = apps.get_model("restaurants", "Restaurant")
+    restaurants = list(Restaurant.objects.only("id", "longitude", "latitude"))
+    for restaurant in restaurants:
+        restaurant.geohash = geohash.encode(restaurant.longitude, restaurant.latitude)
+    Restaurant.objects.bulk_update(restaurants, ["geohash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0008_restaurantimagejob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="restaurant",
+            name="geohash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=12,
+                verbose_name="지오해시",
+            ),
+        ),
+        migrations.RunPython(fill_geohash, migrations.RunPython.noop),
+    ]
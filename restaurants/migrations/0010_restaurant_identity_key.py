@@ -0,0 +1,75 @@
+# Generated by Django 5.1.15 on 2026-10-18 16:02
+
+import hashlib
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def make_identity_key(name, address, detail_address):
+    return hashlib.sha256(
+        "\0".join((name, address, detail_address or "")).encode()
+    ).hexdigest()
+
+
+def merge_duplicates(apps, schema_editor):
+    Restaurant = apps.get_model("restaurants", "Restaurant")
+    related_models = [
+        apps.get_model("restaurants", model_name)
+        for model_name in ("Review", "RestaurantImage", "IPAddress")
+    ]
+    RestaurantImageJob = apps.get_model("restaurants", "RestaurantImageJob")
+
+    survivors = {}
+    updates = []
+    restaurants = list(
+        Restaurant.objects.only(
+            "id", "name", "address", "detail_address", "suggested_count"
+        ).order_by("id")
+    )
+    for restaurant in restaurants:
+        restaurant.identity_key = make_identity_key(
+            restaurant.name, restaurant.address, restaurant.detail_address
+        )
+        survivor_id = survivors.get(restaurant.identity_key)
+        if survivor_id is None:
+            survivors[restaurant.identity_key] = restaurant.id
+            updates.append(restaurant)
+            continue
+
+        for model in related_models:
+            model.objects.filter(restaurant_id=restaurant.id).update(
+                restaurant_id=survivor_id
+            )
+        Restaurant.objects.filter(id=survivor_id).update(
+            suggested_count=F("suggested_count") + restaurant.suggested_count
+        )
+        RestaurantImageJob.objects.filter(restaurant_id=restaurant.id).delete()
+        Restaurant.objects.filter(id=restaurant.id).delete()
+
+    Restaurant.objects.bulk_update(updates, ["identity_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0009_restaurant_geohash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="restaurant",
+            name="identity_key",
+            field=models.CharField(
+                max_length=64, null=True, verbose_name="식당 식별 해시"
+            ),
+        ),
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="restaurant",
+            name="identity_key",
+            field=models.CharField(
+                max_length=64, unique=True, verbose_name="식당 식별 해시"
+            ),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:34
+
+from datetime import timedelta
+
+import django_extensions.db.fields
+from django.db import migrations, models
+from django.utils import timezone
+
+COOLDOWN = timedelta(days=3)
+
+
+def fill_cooldowns(apps, schema_editor):
+    IPAddress = apps.get_model("restaurants", "IPAddress")
+    SuggestionCooldown = apps.get_model("restaurants", "SuggestionCooldown")
+
+    expires_at = {}
+    for identity_key, ip_address, created in (
+        IPAddress.objects.filter(created__gte=timezone.now() - COOLDOWN)
+        .order_by("created")
+        .values_list("restaurant__identity_key", "ip_address", "created")
+    ):
+        expires_at[identity_key, ip_address] = created + COOLDOWN
+
+    SuggestionCooldown.objects.bulk_create(
+        [
+            SuggestionCooldown(
+                identity_key=identity_key, ip_address=ip_address, expires_at=expires
+            )
+            for (identity_key, ip_address), expires in expires_at.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0010_restaurant_identity_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SuggestionCooldown",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "identity_key",
+                    models.CharField(max_length=64, verbose_name="식당 식별 해시"),
+                ),
+                (
+                    "ip_address",
+                    models.CharField(max_length=63, verbose_name="작성자 IP"),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(db_index=True, verbose_name="만료 시각"),
+                ),
+            ],
+            options={
+                "get_latest_by": "modified",
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("identity_key", "ip_address"),
+                        name="suggestion_cooldown_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_cooldowns, migrations.RunPython.noop),
+    ]
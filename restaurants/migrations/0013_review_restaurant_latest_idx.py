@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0012_suggestioncooldown"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["restaurant", "-created", "-id"],
+                name="review_restaurant_latest_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:10
+
+import hashlib
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def fill_img_url_key(apps, schema_editor):
+    RestaurantImage = apps.get_model("restaurants", "RestaurantImage")
+
+    duplicates = (
+        RestaurantImage.objects.values("restaurant_id", "img_url")
+        .annotate(image_count=Count("id"), keep_id=Min("id"))
+        .filter(image_count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        RestaurantImage.objects.filter(
+            restaurant_id=duplicate["restaurant_id"], img_url=duplicate["img_url"]
+        ).exclude(id=duplicate["keep_id"]).delete()
+
+    images = list(RestaurantImage.objects.only("id", "img_url"))
+    for image in images:
+        image.img_url_key = hashlib.sha256(image.img_url.encode()).hexdigest()
+    RestaurantImage.objects.bulk_update(images, ["img_url_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0013_review_restaurant_latest_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="restaurantimage",
+            name="img_url_key",
+            field=models.CharField(
+                max_length=64, null=True, verbose_name="이미지 주소 해시"
+            ),
+        ),
+        migrations.RunPython(fill_img_url_key, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="restaurantimage",
+            name="img_url_key",
+            field=models.CharField(max_length=64, verbose_name="이미지 주소 해시"),
+        ),
+        migrations.AddConstraint(
+            model_name="restaurantimage",
+            constraint=models.UniqueConstraint(
+                fields=("restaurant", "img_url_key"), name="restaurant_image_unique"
+            ),
+        ),
+    ]
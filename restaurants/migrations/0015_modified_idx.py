@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0014_restaurantimage_img_url_key"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="restaurant",
+            index=models.Index(fields=["modified"], name="restaurant_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="restaurantimage",
+            index=models.Index(
+                fields=["modified"], name="restaurant_image_modified_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(fields=["modified"], name="review_modified_idx"),
+        ),
+    ]
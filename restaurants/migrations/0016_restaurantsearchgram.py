@@ -0,0 +1,80 @@
+# Generated by Django 5.1.15 on 2026-10-18 15:45
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0015_modified_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RestaurantSearchGram",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "field_type",
+                    models.CharField(
+                        choices=[
+                            ("NAME", "식당 이름"),
+                            ("ADDRESS", "식당 주소"),
+                            ("REVIEW", "리뷰"),
+                        ],
+                        max_length=15,
+                        verbose_name="검색 필드",
+                    ),
+                ),
+                ("gram", models.CharField(max_length=15, verbose_name="n-gram")),
+                ("frequency", models.IntegerField(default=1, verbose_name="등장 횟수")),
+                (
+                    "restaurant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_grams",
+                        to="restaurants.restaurant",
+                        verbose_name="식당 id",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "modified",
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["gram", "restaurant", "field_type"],
+                        name="search_gram_lookup_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("restaurant", "field_type", "gram"),
+                        name="restaurant_search_gram_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.15 on 2026-10-18 18:10
+
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+REGION_WORDS = frozenset(("대구광역시", "대구시", "경상북도", "경북", "경산시"))
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def make_ngrams(text, size=2):
+    ngrams = []
+    for word in WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if len(word) <= size:
+            ngrams.append(word)
+        else:
+            ngrams.extend(
+                word[index : index + size] for index in range(len(word) - size + 1)
+            )
+    return ngrams
+
+
+def make_counts(text):
+    return Counter(
+        make_ngrams(" ".join(word for word in text.split() if word not in REGION_WORDS))
+    )
+
+
+def fill_search_grams(apps, schema_editor):
+    Restaurant = apps.get_model("restaurants", "Restaurant")
+    Review = apps.get_model("restaurants", "Review")
+    RestaurantSearchGram = apps.get_model("restaurants", "RestaurantSearchGram")
+
+    last_id = 0
+    while True:
+        restaurants = list(
+            Restaurant.objects.filter(id__gt=last_id)
+            .only("id", "name", "address")
+            .order_by("id")[:BATCH_SIZE]
+        )
+        if not restaurants:
+            break
+        restaurant_ids = [restaurant.id for restaurant in restaurants]
+
+        review_counts = {restaurant_id: Counter() for restaurant_id in restaurant_ids}
+        for restaurant_id, post in Review.objects.filter(
+            restaurant_id__in=restaurant_ids
+        ).values_list("restaurant_id", "post"):
+            review_counts[restaurant_id].update(make_counts(post))
+
+        grams = []
+        for restaurant in restaurants:
+            for field_type, counts in (
+                ("NAME", make_counts(restaurant.name)),
+                ("ADDRESS", make_counts(restaurant.address)),
+                ("REVIEW", review_counts[restaurant.id]),
+            ):
+                grams += [
+                    RestaurantSearchGram(
+                        restaurant_id=restaurant.id,
+                        field_type=field_type,
+                        gram=gram,
+                        frequency=frequency,
+                    )
+                    for gram, frequency in counts.items()
+                ]
+
+        RestaurantSearchGram.objects.filter(restaurant_id__in=restaurant_ids).delete()
+        RestaurantSearchGram.objects.bulk_create(grams, batch_size=1000)
+        last_id = restaurant_ids[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0016_restaurantsearchgram"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_search_grams, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,69 @@
-from django.db import models
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.db import connections, models
+from django.utils import timezone
 from django_extensions.db.models import TimeStampedModel
 
+from utils import geohash
+from utils.conditional import DeletionMarker
+
+
+class RestaurantQuerySet(models.QuerySet):
+    def increment_or_create(
+        self, restaurant: "Restaurant"
+    ) -> tuple["Restaurant", bool]:
+        """식당을 추가하거나, 이미 있으면 suggested_count를 1 올린다.
+
+        한 문장의 upsert라 처음 추천이 동시에 들어와도 gap lock끼리 교착되지 않는다.
+        get_or_create처럼 (id, name, address, suggested_count만 읽은 식당, 추가 여부)를
+        돌려준다.
+        """
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        now = timezone.now()
+        # save()를 거치지 않으므로 직접 채운다.
+        restaurant.identity_key = Restaurant.make_identity_key(
+            restaurant.name, restaurant.address, restaurant.detail_address
+        )
+        restaurant.geohash = geohash.encode(restaurant.longitude, restaurant.latitude)
+        restaurant.created = restaurant.modified = now
+
+        fields = [
+            field for field in Restaurant._meta.concrete_fields if not field.primary_key
+        ]
+        table: str = quote(Restaurant._meta.db_table)
+        count: str = quote(Restaurant._meta.get_field("suggested_count").column)
+        modified: str = quote(Restaurant._meta.get_field("modified").column)
+        if connection.vendor == "mysql":
+            on_conflict: str = (
+                f"ON DUPLICATE KEY UPDATE {count} = {count} + 1, "
+                f"{modified} = VALUES({modified})"
+            )
+        else:
+            on_conflict = (
+                f"ON CONFLICT ({quote('identity_key')}) DO UPDATE SET "
+                f"{count} = {table}.{count} + 1, {modified} = excluded.{modified}"
+            )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                f"({', '.join(quote(field.column) for field in fields)}) "
+                f"VALUES ({', '.join(['%s'] * len(fields))}) {on_conflict}",
+                [
+                    field.get_db_prep_save(
+                        getattr(restaurant, field.attname), connection
+                    )
+                    for field in fields
+                ],
+            )
+
+        saved: Restaurant = self.only(
+            "id", "name", "address", "suggested_count", "created"
+        ).get(identity_key=restaurant.identity_key)
+        return saved, saved.created == now
+
 
 class Restaurant(TimeStampedModel):
     class RestaurantType(models.TextChoices):
@@ -36,6 +99,47 @@ class Restaurant(TimeStampedModel):
         verbose_name="이 가게를 고른 선수 이름", max_length=15, null=True, blank=True
     )
     suggested_count = models.IntegerField(verbose_name="추천된 횟수", default=1)
+    geohash = models.CharField(
+        verbose_name="지오해시", max_length=12, db_index=True, blank=True, default=""
+    )
+    identity_key = models.CharField(
+        verbose_name="식당 식별 해시", max_length=64, unique=True
+    )
+
+    objects = RestaurantQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(
+                fields=["far_from_lions_park", "players_pick", "id"],
+                name="restaurant_distance_cursor_idx",
+            ),
+            models.Index(fields=["modified"], name="restaurant_modified_idx"),
+        ]
+
+    @staticmethod
+    def make_identity_key(
+        name: str, address: str, detail_address: Optional[str]
+    ) -> str:
+        return hashlib.sha256(
+            "\0".join((name, address, detail_address or "")).encode()
+        ).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.identity_key = self.make_identity_key(
+            self.name, self.address, self.detail_address
+        )
+        self.geohash = geohash.encode(self.longitude, self.latitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and (
+            {"longitude", "latitude"} & set(update_fields)
+        ):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        if update_fields is not None and (
+            {"name", "address", "detail_address"} & set(update_fields)
+        ):
+            kwargs["update_fields"] = {*kwargs["update_fields"], "identity_key"}
+        super().save(*args, **kwargs)
 
 
 class Review(TimeStampedModel):
@@ -47,6 +151,24 @@ class Review(TimeStampedModel):
     )
     post = models.TextField()
 
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(
+                fields=["restaurant", "-created", "-id"],
+                name="review_restaurant_latest_idx",
+            ),
+            models.Index(fields=["modified"], name="review_modified_idx"),
+        ]
+
+
+class RestaurantImageQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create does not call RestaurantImage.save().
+        objs = list(objs)
+        for obj in objs:
+            obj.img_url_key = RestaurantImage.make_img_url_key(obj.img_url)
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 class RestaurantImage(TimeStampedModel):
     restaurant = models.ForeignKey(
@@ -56,6 +178,60 @@ class RestaurantImage(TimeStampedModel):
         related_name="images",
     )
     img_url = models.URLField(max_length=4095)
+    img_url_key = models.CharField(verbose_name="이미지 주소 해시", max_length=64)
+
+    objects = RestaurantImageQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["restaurant", "img_url_key"],
+                name="restaurant_image_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["modified"], name="restaurant_image_modified_idx"),
+        ]
+
+    @staticmethod
+    def make_img_url_key(img_url: str) -> str:
+        return hashlib.sha256(img_url.encode()).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.img_url_key = self.make_img_url_key(self.img_url)
+        super().save(*args, **kwargs)
+
+
+class RestaurantImageJob(TimeStampedModel):
+    class StatusType(models.TextChoices):
+        PENDING = "PENDING", "대기"
+        RUNNING = "RUNNING", "진행 중"
+        DONE = "DONE", "완료"
+        FAILED = "FAILED", "실패"
+
+    restaurant = models.OneToOneField(
+        Restaurant,
+        on_delete=models.CASCADE,
+        verbose_name="식당 id",
+        related_name="image_job",
+    )
+    status_type = models.CharField(
+        verbose_name="작업 상태",
+        choices=StatusType.choices,
+        max_length=15,
+        default=StatusType.PENDING,
+    )
+    attempts = models.IntegerField(verbose_name="시도 횟수", default=0)
+    run_after = models.DateTimeField(verbose_name="실행 가능 시각")
+    last_error = models.TextField(verbose_name="마지막 에러", null=True, blank=True)
+
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(
+                fields=["status_type", "run_after"],
+                name="image_job_due_idx",
+            ),
+        ]
 
 
 class IPAddress(TimeStampedModel):
@@ -66,3 +242,139 @@ class IPAddress(TimeStampedModel):
         related_name="ip_addresses",
     )
     ip_address = models.CharField(verbose_name="작성자 IP", max_length=63)
+
+
+class SuggestionCooldownQuerySet(models.QuerySet):
+    def claim(self, identity_key: str, ip_address: str, expires_at: datetime) -> bool:
+        """쿨다운이 없거나 만료되었으면 expires_at까지 새로 걸고 True를 돌려준다.
+
+        increment_or_create처럼 한 문장의 upsert라 INSERT 실패 뒤 UPDATE하는 사이
+        gap lock끼리 교착되지 않는다. MySQL은 FOUND_ROWS 때문에 영향받은 행 수로
+        바뀌지 않은 행을 구분할 수 없어, 다시 읽어 expires_at이 이번 값인지 본다.
+        """
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        now = timezone.now()
+        cooldown = SuggestionCooldown(
+            identity_key=identity_key,
+            ip_address=ip_address,
+            expires_at=expires_at,
+            created=now,
+            modified=now,
+        )
+
+        fields = [
+            field
+            for field in SuggestionCooldown._meta.concrete_fields
+            if not field.primary_key
+        ]
+        table: str = quote(SuggestionCooldown._meta.db_table)
+        expires: str = quote(SuggestionCooldown._meta.get_field("expires_at").column)
+        modified: str = quote(SuggestionCooldown._meta.get_field("modified").column)
+        expired_before = SuggestionCooldown._meta.get_field(
+            "expires_at"
+        ).get_db_prep_save(now, connection)
+        if connection.vendor == "mysql":
+            # 왼쪽부터 대입해 뒤의 IF는 바뀐 expires_at을 보므로 modified를 먼저 쓴다.
+            on_conflict: str = (
+                f"ON DUPLICATE KEY UPDATE "
+                f"{modified} = IF({expires} <= %s, VALUES({modified}), {modified}), "
+                f"{expires} = IF({expires} <= %s, VALUES({expires}), {expires})"
+            )
+            on_conflict_params: list = [expired_before, expired_before]
+        else:
+            on_conflict = (
+                f"ON CONFLICT ({quote('identity_key')}, {quote('ip_address')}) "
+                f"DO UPDATE SET {expires} = excluded.{expires}, "
+                f"{modified} = excluded.{modified} "
+                f"WHERE {table}.{expires} <= %s"
+            )
+            on_conflict_params = [expired_before]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                f"({', '.join(quote(field.column) for field in fields)}) "
+                f"VALUES ({', '.join(['%s'] * len(fields))}) {on_conflict}",
+                [
+                    field.get_db_prep_save(getattr(cooldown, field.attname), connection)
+                    for field in fields
+                ]
+                + on_conflict_params,
+            )
+
+        return self.filter(
+            identity_key=identity_key, ip_address=ip_address, expires_at=expires_at
+        ).exists()
+
+
+class SuggestionCooldown(TimeStampedModel):
+    identity_key = models.CharField(verbose_name="식당 식별 해시", max_length=64)
+    ip_address = models.CharField(verbose_name="작성자 IP", max_length=63)
+    expires_at = models.DateTimeField(verbose_name="만료 시각", db_index=True)
+
+    objects = SuggestionCooldownQuerySet.as_manager()
+
+    class Meta(TimeStampedModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["identity_key", "ip_address"],
+                name="suggestion_cooldown_unique",
+            ),
+        ]
+
+
+class RestaurantSearchGram(TimeStampedModel):
+    class FieldType(models.TextChoices):
+        NAME = "NAME", "식당 이름"
+        ADDRESS = "ADDRESS", "식당 주소"
+        REVIEW = "REVIEW", "리뷰"
+
+    restaurant = models.ForeignKey(
+        Restaurant,
+        on_delete=models.CASCADE,
+        verbose_name="식당 id",
+        related_name="search_grams",
+    )
+    field_type = models.CharField(
+        verbose_name="검색 필드", choices=FieldType.choices, max_length=15
+    )
+    gram = models.CharField(verbose_name="n-gram", max_length=15)
+    frequency = models.IntegerField(verbose_name="등장 횟수", default=1)
+
+    class Meta(TimeStampedModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["restaurant", "field_type", "gram"],
+                name="restaurant_search_gram_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["gram", "restaurant", "field_type"],
+                name="search_gram_lookup_idx",
+            ),
+        ]
+
+
+class RestaurantFeedGeneration(TimeStampedModel):
+    """식당 목록 스냅샷의 세대. 캐시와 달리 지워지지 않도록 DB에 한 줄로 둔다."""
+
+    generation = models.BigIntegerField(verbose_name="목록 세대", default=0)
+
+
+class RestaurantDeletionMarker(DeletionMarker):
+    pass
+
+
+class AddressGeocode(TimeStampedModel):
+    address_key = models.CharField(
+        verbose_name="정규화된 주소 해시", max_length=64, unique=True
+    )
+    address = models.CharField(verbose_name="정규화된 주소", max_length=1023)
+    longitude = models.FloatField(verbose_name="경도")
+    latitude = models.FloatField(verbose_name="위도")
+    distance = models.FloatField(verbose_name="라팍과의 직선 거리(m)")
+
+    @staticmethod
+    def make_address_key(address: str) -> str:
+        return hashlib.sha256(address.encode()).hexdigest()
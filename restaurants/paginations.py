@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class RestaurantCursorPagination(CursorPagination):
+    ordering = ("far_from_lions_park", "players_pick", "id")
+    page_size = 30
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ReviewCursorPagination(CursorPagination):
+    ordering = ("-created", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -0,0 +1,177 @@
+import math
+from collections import Counter
+from typing import Final, Iterable
+
+from django.db.models import Case, Count, F, IntegerField, Max, Sum, Value, When
+
+from restaurants.models import Restaurant, RestaurantSearchGram, Review
+from utils.parsers import make_ngrams
+
+FieldType = RestaurantSearchGram.FieldType
+
+
+class RestaurantSearchIndex:
+    FIELD_WEIGHTS: Final[dict[str, int]] = {
+        FieldType.NAME: 3,
+        FieldType.ADDRESS: 1,
+        FieldType.REVIEW: 1,
+    }
+    MINIMUM_MATCH_RATIO: Final[float] = 0.5
+    # 모든 식당 주소에 들어 있어 순위에 도움이 되지 않는 단어
+    REGION_WORDS: Final[frozenset[str]] = frozenset(
+        ("대구광역시", "대구시", "경상북도", "경북", "경산시")
+    )
+
+    @classmethod
+    def _make_ngrams(cls, text: str) -> list[str]:
+        return make_ngrams(
+            " ".join(word for word in text.split() if word not in cls.REGION_WORDS)
+        )
+
+    @staticmethod
+    def _make_grams(
+        restaurant_id: int, field_type: str, counts: Counter
+    ) -> list[RestaurantSearchGram]:
+        return [
+            RestaurantSearchGram(
+                restaurant_id=restaurant_id,
+                field_type=field_type,
+                gram=gram,
+                frequency=frequency,
+            )
+            for gram, frequency in counts.items()
+        ]
+
+    @classmethod
+    def index_restaurants(cls, restaurants: Iterable[Restaurant]) -> None:
+        """식당 이름, 주소, 리뷰의 n-gram을 통째로 다시 만든다."""
+        restaurants = list(restaurants)
+        restaurant_ids: list[int] = [restaurant.id for restaurant in restaurants]
+        review_counts: dict[int, Counter] = {
+            restaurant_id: Counter() for restaurant_id in restaurant_ids
+        }
+        for restaurant_id, post in Review.objects.filter(
+            restaurant_id__in=restaurant_ids
+        ).values_list("restaurant_id", "post"):
+            review_counts[restaurant_id].update(cls._make_ngrams(post))
+
+        grams: list[RestaurantSearchGram] = []
+        for restaurant in restaurants:
+            grams += cls._make_grams(
+                restaurant.id,
+                FieldType.NAME,
+                Counter(cls._make_ngrams(restaurant.name)),
+            )
+            grams += cls._make_grams(
+                restaurant.id,
+                FieldType.ADDRESS,
+                Counter(cls._make_ngrams(restaurant.address)),
+            )
+            grams += cls._make_grams(
+                restaurant.id, FieldType.REVIEW, review_counts[restaurant.id]
+            )
+
+        RestaurantSearchGram.objects.filter(restaurant_id__in=restaurant_ids).delete()
+        RestaurantSearchGram.objects.bulk_create(grams, batch_size=1000)
+
+    @classmethod
+    def index_restaurant_fields(cls, restaurant: Restaurant) -> None:
+        RestaurantSearchGram.objects.filter(
+            restaurant_id=restaurant.id,
+            field_type__in=(FieldType.NAME, FieldType.ADDRESS),
+        ).delete()
+        RestaurantSearchGram.objects.bulk_create(
+            cls._make_grams(
+                restaurant.id,
+                FieldType.NAME,
+                Counter(cls._make_ngrams(restaurant.name)),
+            )
+            + cls._make_grams(
+                restaurant.id,
+                FieldType.ADDRESS,
+                Counter(cls._make_ngrams(restaurant.address)),
+            )
+        )
+
+    @classmethod
+    def add_review(cls, restaurant_id: int, post: str) -> None:
+        counts: Counter = Counter(cls._make_ngrams(post))
+        existing: set[str] = set(
+            RestaurantSearchGram.objects.filter(
+                restaurant_id=restaurant_id,
+                field_type=FieldType.REVIEW,
+                gram__in=counts,
+            ).values_list("gram", flat=True)
+        )
+        cls._update_frequencies(
+            restaurant_id, {gram: counts[gram] for gram in existing}
+        )
+        RestaurantSearchGram.objects.bulk_create(
+            cls._make_grams(
+                restaurant_id,
+                FieldType.REVIEW,
+                Counter(
+                    {gram: n for gram, n in counts.items() if gram not in existing}
+                ),
+            ),
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def remove_review(cls, restaurant_id: int, post: str) -> None:
+        counts: Counter = Counter(cls._make_ngrams(post))
+        cls._update_frequencies(
+            restaurant_id, {gram: -frequency for gram, frequency in counts.items()}
+        )
+        RestaurantSearchGram.objects.filter(
+            restaurant_id=restaurant_id,
+            field_type=FieldType.REVIEW,
+            gram__in=counts,
+            frequency__lte=0,
+        ).delete()
+
+    @staticmethod
+    def _update_frequencies(restaurant_id: int, deltas: dict[str, int]) -> None:
+        grams_by_delta: dict[int, list[str]] = {}
+        for gram, delta in deltas.items():
+            grams_by_delta.setdefault(delta, []).append(gram)
+        for delta, grams in grams_by_delta.items():
+            RestaurantSearchGram.objects.filter(
+                restaurant_id=restaurant_id,
+                field_type=FieldType.REVIEW,
+                gram__in=grams,
+            ).update(frequency=F("frequency") + delta)
+
+    @classmethod
+    def search(cls, query: str, limit: int) -> list[Restaurant]:
+        grams: set[str] = set(cls._make_ngrams(query))
+        if not grams:
+            return []
+
+        ranked: list[int] = list(
+            RestaurantSearchGram.objects.filter(gram__in=grams)
+            .values("restaurant_id")
+            .annotate(
+                matched=Count("gram", distinct=True),
+                score=Sum(
+                    Case(
+                        *(
+                            When(field_type=field_type, then=Value(weight))
+                            for field_type, weight in cls.FIELD_WEIGHTS.items()
+                        ),
+                        output_field=IntegerField(),
+                    )
+                ),
+                suggested_count=Max("restaurant__suggested_count"),
+            )
+            .filter(matched__gte=math.ceil(len(grams) * cls.MINIMUM_MATCH_RATIO))
+            .order_by("-matched", "-score", "-suggested_count", "restaurant_id")
+            .values_list("restaurant_id", flat=True)[:limit]
+        )
+
+        restaurants: dict[int, Restaurant] = Restaurant.objects.in_bulk(ranked)
+        return [
+            restaurants[restaurant_id]
+            for restaurant_id in ranked
+            if restaurant_id in restaurants
+        ]
@@ -1,11 +1,13 @@
+from django.conf import settings
+from django.utils.text import Truncator
 from rest_framework import serializers
 
-from restaurants.models import Restaurant
+from restaurants.models import Restaurant, Review
 
 
 class ReviewPostsField(serializers.RelatedField):
     def to_representation(self, value):
-        return value.post
+        return Truncator(value.post).chars(settings.RESTAURANT_LIST_REVIEW_LENGTH)
 
 
 class RestaurantImageUrlsField(serializers.RelatedField):
@@ -14,12 +16,37 @@ class RestaurantImageUrlsField(serializers.RelatedField):
 
 
 class ListRestaurantSerializer(serializers.ModelSerializer):
-    review_posts = ReviewPostsField(source="reviews", many=True, read_only=True)
+    review_posts = ReviewPostsField(source="latest_reviews", many=True, read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
     image_urls = RestaurantImageUrlsField(source="images", many=True, read_only=True)
+    distance = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Restaurant
-        fields = "__all__"
+        fields = (
+            "id",
+            "review_posts",
+            "review_count",
+            "image_urls",
+            "distance",
+            "created",
+            "modified",
+            "name",
+            "address",
+            "detail_address",
+            "longitude",
+            "latitude",
+            "far_from_lions_park",
+            "category",
+            "players_pick",
+            "suggested_count",
+        )
+
+
+class ReviewSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Review
+        fields = ("id", "post", "created")
 
 
 class SearchRestaurantsResponseSerializer(serializers.Serializer):
@@ -31,6 +58,24 @@ class SearchRestaurantsQuerySerializer(serializers.Serializer):
     name = serializers.CharField()
 
 
+class AutocompleteRestaurantsQuerySerializer(serializers.Serializer):
+    query = serializers.CharField()
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=10)
+
+
+class LocalSearchRestaurantsQuerySerializer(serializers.Serializer):
+    query = serializers.CharField()
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class LocalSearchRestaurantsResponseSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    address = serializers.CharField()
+    category = serializers.CharField()
+    suggested_count = serializers.IntegerField()
+
+
 class CreateRestaurantRequestSerializer(serializers.ModelSerializer):
     review = serializers.CharField(allow_null=True, allow_blank=True)
 
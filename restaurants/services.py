@@ -1,21 +1,91 @@
-from typing import Any, Final
+import asyncio
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Final, Optional
 
-from exceptions import NotFoundException
-from restaurants.dtos import CreateRestaurantDto, SearchRestaurantsDto
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from exceptions import (
+    CategoryNotFoundException,
+    NotFoundException,
+    TooFarFromLionsParkException,
+)
+from restaurants.autocomplete import RestaurantAutocomplete
+from restaurants.dtos import (
+    CreateRestaurantDto,
+    ImportRestaurantsDto,
+    LocalSearchRestaurantDto,
+    SearchRestaurantsDto,
+)
+from restaurants.feeds import RestaurantFeed
 from restaurants.handlers import RestaurantExceptionHandler
-from restaurants.models import IPAddress, Restaurant, RestaurantImage, Review
+from restaurants.models import (
+    AddressGeocode,
+    IPAddress,
+    Restaurant,
+    RestaurantImage,
+    RestaurantImageJob,
+    Review,
+)
+from restaurants.search import RestaurantSearchIndex
 from restaurants.validators import RestaurantValidator
+from utils import geohash
+from utils.caches import TTLLRUCache
 from utils.clients import NaverClient
-from utils.parsers import remove_html_tags
+from utils.geo import haversine_distance
+from utils.parsers import normalize_query, remove_html_tags
+
+logger = logging.getLogger(__name__)
+
+
+def _timed(label: str, func: Callable[..., Any], *args: Any) -> Any:
+    started: float = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        logger.info(
+            "naver %s call took %.1fms", label, (time.perf_counter() - started) * 1000
+        )
+
+
+async def _atimed(label: str, func: Callable[..., Any], *args: Any) -> Any:
+    started: float = time.perf_counter()
+    try:
+        return await func(*args)
+    finally:
+        logger.info(
+            "naver %s call took %.1fms", label, (time.perf_counter() - started) * 1000
+        )
 
 
 class RestaurantService:
     DAEGU_PREFIX: Final[str] = "대구광역시"
     GYUNGSAN_PREFIX: Final[str] = "경상북도 경산시"
-    METERS_PER_KM: Final[int] = 1000
+
+    _search_cache: TTLLRUCache = TTLLRUCache(
+        maxsize=settings.SEARCH_RESTAURANTS_CACHE_MAXSIZE,
+        ttl=settings.SEARCH_RESTAURANTS_CACHE_TTL,
+    )
+
+    _autocomplete: RestaurantAutocomplete = RestaurantAutocomplete(
+        memory_budget=settings.RESTAURANT_AUTOCOMPLETE_MEMORY_BUDGET,
+        refresh_interval=settings.RESTAURANT_AUTOCOMPLETE_REFRESH_INTERVAL,
+    )
+
+    _executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=settings.NAVER_CLIENT_FAN_OUT_WORKERS,
+        thread_name_prefix="naver",
+    )
 
     def __init__(self):
         self._naver_client: NaverClient = NaverClient()
+        self._image_service: RestaurantImageService = RestaurantImageService()
         self._validator: RestaurantValidator = RestaurantValidator()
         self._exception_handler: RestaurantExceptionHandler = (
             RestaurantExceptionHandler()
@@ -43,61 +113,169 @@ class RestaurantService:
         road_address = self._clean_road_address(name, restaurant.get("roadAddress", ""))
         return SearchRestaurantsDto(name=name, road_address=road_address)
 
-    def search_restaurants(self, name: str) -> list[SearchRestaurantsDto]:
+    def _fetch_search_results(self, query: str) -> list[SearchRestaurantsDto]:
         try:
             restaurants: list[dict[str, Any]] = self._naver_client.search_places(
-                name=name
+                name=query
+            )
+        except Exception as exc:
+            raise self._exception_handler.handle_search_exceptions(exc)
+
+        return self._create_search_dtos(restaurants)
+
+    async def _afetch_search_results(self, query: str) -> list[SearchRestaurantsDto]:
+        try:
+            restaurants: list[dict[str, Any]] = await self._naver_client.asearch_places(
+                name=query
             )
         except Exception as exc:
             raise self._exception_handler.handle_search_exceptions(exc)
 
+        return self._create_search_dtos(restaurants)
+
+    def _create_search_dtos(
+        self, restaurants: list[dict[str, Any]]
+    ) -> list[SearchRestaurantsDto]:
         daegu_restaurants: list[dict[str, Any]] = (
             self._filter_daegu_gyungsan_restaurants(restaurants)
         )
         search_results: list[SearchRestaurantsDto] = [
             self._create_search_dto(restaurant) for restaurant in daegu_restaurants
         ]
+        for search_result in search_results:
+            self._autocomplete.add(search_result.name, search_result.road_address)
+        return search_results
 
+    def _get_search_results(
+        self, search_results: list[SearchRestaurantsDto]
+    ) -> list[SearchRestaurantsDto]:
         if not search_results:
             raise NotFoundException("해당하는 식당이 없습니다.")
 
-        return search_results
+        return list(search_results)
+
+    def search_restaurants(self, name: str) -> list[SearchRestaurantsDto]:
+        query: str = normalize_query(name)
+        search_results: Optional[list[SearchRestaurantsDto]] = self._search_cache.get(
+            query
+        )
+        if search_results is None:
+            search_results = self._fetch_search_results(query)
+            self._search_cache.set(query, search_results)
+
+        return self._get_search_results(search_results)
+
+    async def asearch_restaurants(self, name: str) -> list[SearchRestaurantsDto]:
+        query: str = normalize_query(name)
+        search_results: Optional[list[SearchRestaurantsDto]] = self._search_cache.get(
+            query
+        )
+        if search_results is None:
+            search_results = await self._afetch_search_results(query)
+            self._search_cache.set(query, search_results)
+
+        return self._get_search_results(search_results)
+
+    def autocomplete_restaurants(
+        self, query: str, limit: int
+    ) -> list[SearchRestaurantsDto]:
+        return self._autocomplete.suggest(query, limit)
+
+    def search_local_restaurants(
+        self, query: str, limit: int
+    ) -> list[LocalSearchRestaurantDto]:
+        restaurants: list[Restaurant] = RestaurantSearchIndex.search(query, limit)
+        if not restaurants:
+            raise NotFoundException("해당하는 식당이 없습니다.")
+
+        return [
+            LocalSearchRestaurantDto(
+                id=restaurant.id,
+                name=restaurant.name,
+                address=restaurant.address,
+                category=restaurant.category,
+                suggested_count=restaurant.suggested_count,
+            )
+            for restaurant in restaurants
+        ]
+
+    def _get_cached_geocode(self, address: str) -> Optional[tuple[float, float, float]]:
+        address_key: str = AddressGeocode.make_address_key(normalize_query(address))
+        geocode: Optional[AddressGeocode] = AddressGeocode.objects.filter(
+            address_key=address_key
+        ).first()
+        if geocode is None:
+            return None
+        return geocode.longitude, geocode.latitude, geocode.distance
+
+    def _cache_geocode(
+        self, address: str, x: str, y: str, distance: float
+    ) -> tuple[float, float, float]:
+        normalized_address: str = normalize_query(address)
+        geocode, _ = AddressGeocode.objects.get_or_create(
+            address_key=AddressGeocode.make_address_key(normalized_address),
+            defaults={
+                "address": normalized_address,
+                "longitude": float(x),
+                "latitude": float(y),
+                "distance": float(distance),
+            },
+        )
+        return geocode.longitude, geocode.latitude, geocode.distance
+
+    def _get_geocode_data(self, address: str) -> tuple[float, float, float]:
+        geocode: Optional[tuple[float, float, float]] = self._get_cached_geocode(
+            address
+        )
+        if geocode is not None:
+            return geocode
 
-    def _get_geocode_data(self, address: str) -> tuple[str, str, float]:
         try:
-            return self._naver_client.get_geocode_distance_by_address(address=address)
+            x, y, distance = self._naver_client.get_geocode_distance_by_address(
+                address=address
+            )
         except Exception as exc:
             raise self._exception_handler.handle_geocode_exceptions(exc)
 
-    def _get_image_links(self, name: str) -> list[str]:
-        items: list[dict[str, Any]] = self._naver_client.get_images(name)
-        return [
-            item.get("link")
-            for item in items
-            if item.get("link").startswith("https://")
-        ]
+        return self._cache_geocode(address, x, y, distance)
 
-    def create_restaurant(
-        self, name: str, address: str, category: str, ip_address: str, review=None
-    ) -> CreateRestaurantDto:
+    async def _aget_geocode_data(self, address: str) -> tuple[float, float, float]:
+        geocode: Optional[tuple[float, float, float]] = await sync_to_async(
+            self._get_cached_geocode
+        )(address)
+        if geocode is not None:
+            return geocode
+
+        try:
+            x, y, distance = await self._naver_client.aget_geocode_distance_by_address(
+                address=address
+            )
+        except Exception as exc:
+            raise self._exception_handler.handle_geocode_exceptions(exc)
+
+        return await sync_to_async(self._cache_geocode)(address, x, y, distance)
+
+    def _validate_suggestion(
+        self, name: str, address: str, category: str, ip_address: str
+    ) -> None:
         self._validator.validate_duplicate_restaurant(name, address, ip_address)
         self._validator.validate_category(category)
 
-        x, y, distance = self._get_geocode_data(address)
-        distance /= self.METERS_PER_KM
+    def _save_suggestion(
+        self,
+        name: str,
+        address: str,
+        category: str,
+        ip_address: str,
+        review: Optional[str],
+        x: float,
+        y: float,
+        distance: float,
+    ) -> Restaurant:
+        self._validator.claim_suggestion_cooldown(name, address, ip_address)
 
-        self._validator.validate_distance(distance)
-
-        if Restaurant.objects.filter(
-            name=name, address=address, detail_address=name
-        ).exists():
-            restaurant: Restaurant = Restaurant.objects.get(
-                name=name, address=address, detail_address=name
-            )
-            restaurant.suggested_count += 1
-            restaurant.save()
-        else:
-            restaurant = Restaurant.objects.create(
+        restaurant, created = Restaurant.objects.increment_or_create(
+            Restaurant(
                 name=name,
                 address=address,
                 detail_address=name,
@@ -106,21 +284,460 @@ class RestaurantService:
                 latitude=y,
                 far_from_lions_park=distance,
             )
+        )
+        # raw upsert라 post_save 시그널이 불리지 않는다.
+        RestaurantFeed.invalidate()
+        if created:
+            RestaurantSearchIndex.index_restaurant_fields(restaurant)
 
         if review:
             Review.objects.create(restaurant=restaurant, post=review)
 
         IPAddress.objects.create(restaurant=restaurant, ip_address=ip_address)
+        return restaurant
+
+    def _save_images(self, restaurant: Restaurant, images: Optional[list[str]]) -> None:
+        if images is not None:
+            self._image_service.save_images(restaurant.id, images)
+        # 워커가 없으면 작업이 쌓이기만 하므로, 다음 추천 때 다시 가져온다.
+        elif settings.RESTAURANT_IMAGE_FETCH_IN_BACKGROUND:
+            RestaurantImageService.enqueue(restaurant)
+
+    def _fan_out_naver_calls(
+        self, name: str, address: str
+    ) -> tuple[tuple[float, float, float], Optional[list[str]]]:
+        images_future: Future = self._executor.submit(
+            _timed, "image", self._image_service.get_image_links, name
+        )
+
+        geocode: Optional[tuple[float, float, float]] = self._get_cached_geocode(
+            address
+        )
+        if geocode is None:
+            geocode_future: Future = self._executor.submit(
+                _timed,
+                "geocode",
+                self._naver_client.get_geocode_distance_by_address,
+                address,
+            )
+            try:
+                x, y, distance = geocode_future.result()
+            except Exception as exc:
+                images_future.cancel()
+                raise self._exception_handler.handle_geocode_exceptions(exc)
+            geocode = self._cache_geocode(address, x, y, distance)
+
+        try:
+            images: Optional[list[str]] = images_future.result()
+        except Exception:
+            logger.exception("naver image call failed")
+            images = None
+        return geocode, images
+
+    async def _afan_out_naver_calls(
+        self, name: str, address: str
+    ) -> tuple[tuple[float, float, float], Optional[list[str]]]:
+        geocode, images = await asyncio.gather(
+            _atimed("geocode", self._aget_geocode_data, address),
+            _atimed("image", self._image_service.aget_image_links, name),
+            return_exceptions=True,
+        )
+        if isinstance(geocode, BaseException):
+            raise geocode
+        if isinstance(images, BaseException):
+            logger.error("naver image call failed", exc_info=images)
+            images = None
+        return geocode, images
+
+    def create_restaurant(
+        self, name: str, address: str, category: str, ip_address: str, review=None
+    ) -> CreateRestaurantDto:
+        self._validate_suggestion(name, address, category, ip_address)
+        fetch_images: bool = not self._image_service.has_fresh_images(
+            Restaurant.make_identity_key(name, address, name)
+        )
+
+        images: Optional[list[str]] = None
+        if settings.RESTAURANT_IMAGE_FETCH_IN_BACKGROUND or not fetch_images:
+            x, y, _ = self._get_geocode_data(address)
+        else:
+            (x, y, _), images = self._fan_out_naver_calls(name, address)
+        distance: float = haversine_distance(x, y, settings.LIONS_PARK_COORDINATE)
+
+        self._validator.validate_distance(distance)
+
+        restaurant: Restaurant = self._save_suggestion(
+            name, address, category, ip_address, review, x, y, distance
+        )
+        if fetch_images:
+            self._save_images(restaurant, images)
+        return CreateRestaurantDto(count=restaurant.suggested_count)
+
+    async def acreate_restaurant(
+        self, name: str, address: str, category: str, ip_address: str, review=None
+    ) -> CreateRestaurantDto:
+        await sync_to_async(self._validate_suggestion)(
+            name, address, category, ip_address
+        )
+        fetch_images: bool = not await sync_to_async(
+            self._image_service.has_fresh_images
+        )(Restaurant.make_identity_key(name, address, name))
+
+        images: Optional[list[str]] = None
+        if settings.RESTAURANT_IMAGE_FETCH_IN_BACKGROUND or not fetch_images:
+            x, y, _ = await self._aget_geocode_data(address)
+        else:
+            (x, y, _), images = await self._afan_out_naver_calls(name, address)
+        distance: float = haversine_distance(x, y, settings.LIONS_PARK_COORDINATE)
+
+        self._validator.validate_distance(distance)
+
+        @transaction.atomic
+        def save() -> Restaurant:
+            restaurant: Restaurant = self._save_suggestion(
+                name, address, category, ip_address, review, x, y, distance
+            )
+            if fetch_images:
+                self._save_images(restaurant, images)
+            return restaurant
+
+        restaurant: Restaurant = await sync_to_async(save)()
+        return CreateRestaurantDto(count=restaurant.suggested_count)
+
+
+class RestaurantImageService:
+    def __init__(self):
+        self._naver_client: NaverClient = NaverClient()
+
+    @staticmethod
+    def enqueue(restaurant: Restaurant) -> None:
+        job, created = RestaurantImageJob.objects.get_or_create(
+            restaurant=restaurant,
+            defaults={"run_after": timezone.now()},
+        )
+        if created:
+            return
+        if job.status_type == RestaurantImageJob.StatusType.FAILED or (
+            job.status_type == RestaurantImageJob.StatusType.DONE
+            and job.modified < RestaurantImageService._stale_before()
+        ):
+            RestaurantImageJob.objects.filter(
+                id=job.id, status_type=job.status_type
+            ).update(
+                status_type=RestaurantImageJob.StatusType.PENDING,
+                attempts=0,
+                run_after=timezone.now(),
+            )
 
-        images: list[str] = self._get_image_links(name)
-        if images:
+    @staticmethod
+    def _stale_before() -> datetime:
+        return timezone.now() - timedelta(seconds=settings.RESTAURANT_IMAGE_MAX_AGE)
+
+    @classmethod
+    def has_fresh_images(cls, identity_key: str) -> bool:
+        return RestaurantImage.objects.filter(
+            restaurant__identity_key=identity_key,
+            modified__gte=cls._stale_before(),
+        ).exists()
+
+    def _filter_image_links(self, items: list[dict[str, Any]]) -> list[str]:
+        return [
+            item.get("link")
+            for item in items
+            if item.get("link").startswith("https://")
+        ]
+
+    def get_image_links(self, name: str) -> list[str]:
+        return self._filter_image_links(self._naver_client.get_images(name))
+
+    async def aget_image_links(self, name: str) -> list[str]:
+        return self._filter_image_links(await self._naver_client.aget_images(name))
+
+    def save_images(self, restaurant_id: int, images: list[str]) -> None:
+        if not images:
+            return
+
+        img_url_keys: list[str] = [
+            RestaurantImage.make_img_url_key(image) for image in images
+        ]
+        with transaction.atomic():
+            RestaurantImage.objects.filter(restaurant_id=restaurant_id).exclude(
+                img_url_key__in=img_url_keys
+            ).delete()
+            RestaurantImage.objects.filter(
+                restaurant_id=restaurant_id, img_url_key__in=img_url_keys
+            ).update(modified=timezone.now())
             RestaurantImage.objects.bulk_create(
                 [
                     RestaurantImage(
-                        restaurant=restaurant,
+                        restaurant_id=restaurant_id,
                         img_url=image,
                     )
                     for image in images
                 ],
+                ignore_conflicts=True,
             )
-        return CreateRestaurantDto(count=restaurant.suggested_count)
+            # bulk_create does not send post_save.
+            RestaurantFeed.invalidate()
+
+    def _release_stale_jobs(self) -> None:
+        stale_before: datetime = timezone.now() - timedelta(
+            seconds=settings.RESTAURANT_IMAGE_JOB_TIMEOUT
+        )
+        stale_jobs: QuerySet[RestaurantImageJob] = RestaurantImageJob.objects.filter(
+            status_type=RestaurantImageJob.StatusType.RUNNING,
+            modified__lt=stale_before,
+        )
+        # 워커를 죽이는 작업이 끝없이 다시 실행되지 않도록 시도 횟수에 포함한다.
+        stale_jobs.filter(
+            attempts__gte=settings.RESTAURANT_IMAGE_JOB_MAX_ATTEMPTS - 1
+        ).update(
+            status_type=RestaurantImageJob.StatusType.FAILED,
+            attempts=F("attempts") + 1,
+            last_error="작업 시간 초과",
+            modified=timezone.now(),
+        )
+        stale_jobs.update(
+            status_type=RestaurantImageJob.StatusType.PENDING,
+            attempts=F("attempts") + 1,
+            last_error="작업 시간 초과",
+            modified=timezone.now(),
+        )
+
+    def _claim(self, job_id: int) -> bool:
+        return bool(
+            RestaurantImageJob.objects.filter(
+                id=job_id, status_type=RestaurantImageJob.StatusType.PENDING
+            ).update(
+                status_type=RestaurantImageJob.StatusType.RUNNING,
+                modified=timezone.now(),
+            )
+        )
+
+    def _run(self, job: RestaurantImageJob) -> None:
+        try:
+            images: list[str] = self.get_image_links(job.restaurant.name)
+        except Exception as exc:
+            attempts: int = job.attempts + 1
+            failed: bool = attempts >= settings.RESTAURANT_IMAGE_JOB_MAX_ATTEMPTS
+            RestaurantImageJob.objects.filter(id=job.id).update(
+                status_type=(
+                    RestaurantImageJob.StatusType.FAILED
+                    if failed
+                    else RestaurantImageJob.StatusType.PENDING
+                ),
+                attempts=attempts,
+                run_after=timezone.now()
+                + timedelta(
+                    seconds=settings.RESTAURANT_IMAGE_JOB_RETRY_DELAY
+                    * 2 ** (attempts - 1)
+                ),
+                last_error=repr(exc),
+                modified=timezone.now(),
+            )
+            return
+
+        with transaction.atomic():
+            self.save_images(job.restaurant_id, images)
+            RestaurantImageJob.objects.filter(id=job.id).update(
+                status_type=RestaurantImageJob.StatusType.DONE,
+                attempts=job.attempts + 1,
+                last_error=None,
+                modified=timezone.now(),
+            )
+
+    def run_pending_jobs(self, batch_size: int) -> int:
+        self._release_stale_jobs()
+
+        job_ids: list[int] = list(
+            RestaurantImageJob.objects.filter(
+                status_type=RestaurantImageJob.StatusType.PENDING,
+                run_after__lte=timezone.now(),
+            )
+            .order_by("run_after")
+            .values_list("id", flat=True)[:batch_size]
+        )
+
+        processed: int = 0
+        for job_id in job_ids:
+            if not self._claim(job_id):
+                continue
+            self._run(
+                RestaurantImageJob.objects.select_related("restaurant").get(id=job_id)
+            )
+            processed += 1
+        return processed
+
+
+class RestaurantImportService:
+    def __init__(self, workers: int, fetch_images: bool = True):
+        self._naver_client: NaverClient = NaverClient()
+        self._validator: RestaurantValidator = RestaurantValidator()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="import"
+        )
+        self._fetch_images: bool = fetch_images
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def _geocode_addresses(self, addresses: set[str]) -> dict[str, tuple[float, float]]:
+        addresses_by_key: dict[str, str] = {
+            AddressGeocode.make_address_key(normalize_query(address)): address
+            for address in addresses
+        }
+        coordinates: dict[str, tuple[float, float]] = {
+            address_key: (longitude, latitude)
+            for address_key, longitude, latitude in AddressGeocode.objects.filter(
+                address_key__in=addresses_by_key
+            ).values_list("address_key", "longitude", "latitude")
+        }
+
+        futures: dict[str, Future] = {
+            address_key: self._executor.submit(
+                self._naver_client.get_geocode_distance_by_address, address
+            )
+            for address_key, address in addresses_by_key.items()
+            if address_key not in coordinates
+        }
+        geocodes: list[AddressGeocode] = []
+        for address_key, future in futures.items():
+            try:
+                x, y, distance = future.result()
+            except Exception:
+                logger.warning(
+                    "failed to geocode %s", addresses_by_key[address_key], exc_info=True
+                )
+                continue
+            coordinates[address_key] = (float(x), float(y))
+            geocodes.append(
+                AddressGeocode(
+                    address_key=address_key,
+                    address=normalize_query(addresses_by_key[address_key]),
+                    longitude=float(x),
+                    latitude=float(y),
+                    distance=float(distance),
+                )
+            )
+        AddressGeocode.objects.bulk_create(geocodes, ignore_conflicts=True)
+
+        return {
+            address: coordinates[address_key]
+            for address_key, address in addresses_by_key.items()
+            if address_key in coordinates
+        }
+
+    def _clean_row(self, row: dict[str, Any]) -> Optional[dict[str, Any]]:
+        name: str = (row.get("name") or "").strip()
+        address: str = (row.get("address") or "").strip()
+        category: str = (row.get("category") or "").strip()
+        try:
+            self._validator.validate_category(category)
+            coordinate: Optional[tuple[float, float]] = (
+                (float(row["longitude"]), float(row["latitude"]))
+                if row.get("longitude") and row.get("latitude")
+                else None
+            )
+        except (ValueError, CategoryNotFoundException):
+            return None
+        if not name or not address:
+            return None
+
+        return {
+            "source": row,
+            "name": name,
+            "address": address,
+            "detail_address": (row.get("detail_address") or "").strip() or name,
+            "category": category,
+            "players_pick": (row.get("players_pick") or "").strip() or None,
+            "coordinate": coordinate,
+        }
+
+    def _build_restaurant(
+        self, row: dict[str, Any], coordinate: tuple[float, float]
+    ) -> Optional[Restaurant]:
+        x, y = coordinate
+        distance: float = haversine_distance(x, y, settings.LIONS_PARK_COORDINATE)
+        try:
+            self._validator.validate_distance(distance)
+        except TooFarFromLionsParkException:
+            return None
+
+        # bulk_create does not call Restaurant.save().
+        return Restaurant(
+            name=row["name"],
+            address=row["address"],
+            detail_address=row["detail_address"],
+            category=row["category"],
+            longitude=x,
+            latitude=y,
+            far_from_lions_park=distance,
+            players_pick=row["players_pick"],
+            identity_key=Restaurant.make_identity_key(
+                row["name"], row["address"], row["detail_address"]
+            ),
+            geohash=geohash.encode(x, y),
+        )
+
+    def import_rows(self, rows: list[dict[str, Any]]) -> ImportRestaurantsDto:
+        cleaned_rows: list[dict[str, Any]] = [
+            cleaned_row
+            for cleaned_row in map(self._clean_row, rows)
+            if cleaned_row is not None
+        ]
+        coordinates: dict[str, tuple[float, float]] = self._geocode_addresses(
+            {row["address"] for row in cleaned_rows if row["coordinate"] is None}
+        )
+
+        restaurants: dict[str, Restaurant] = {}
+        failed_rows: list[dict[str, Any]] = []
+        for row in cleaned_rows:
+            coordinate: Optional[tuple[float, float]] = row["coordinate"]
+            if coordinate is None:
+                coordinate = coordinates.get(row["address"])
+            if coordinate is None:
+                failed_rows.append(row["source"])
+                continue
+            restaurant: Optional[Restaurant] = self._build_restaurant(row, coordinate)
+            if restaurant is not None:
+                restaurants.setdefault(restaurant.identity_key, restaurant)
+
+        with transaction.atomic():
+            existing_keys: set[str] = set(
+                Restaurant.objects.filter(identity_key__in=restaurants).values_list(
+                    "identity_key", flat=True
+                )
+            )
+            new_restaurants: list[Restaurant] = [
+                restaurant
+                for identity_key, restaurant in restaurants.items()
+                if identity_key not in existing_keys
+            ]
+            Restaurant.objects.bulk_create(new_restaurants, ignore_conflicts=True)
+
+            created_restaurants: list[Restaurant] = list(
+                Restaurant.objects.filter(
+                    identity_key__in=[
+                        restaurant.identity_key for restaurant in new_restaurants
+                    ]
+                ).only("id", "name", "address")
+            )
+            # bulk_create does not send post_save.
+            RestaurantSearchIndex.index_restaurants(created_restaurants)
+            if self._fetch_images and created_restaurants:
+                now: datetime = timezone.now()
+                RestaurantImageJob.objects.bulk_create(
+                    [
+                        RestaurantImageJob(restaurant_id=restaurant.id, run_after=now)
+                        for restaurant in created_restaurants
+                    ],
+                    ignore_conflicts=True,
+                )
+            if new_restaurants:
+                RestaurantFeed.invalidate()
+
+        return ImportRestaurantsDto(
+            created=len(new_restaurants),
+            skipped=len(rows) - len(new_restaurants) - len(failed_rows),
+            failed_rows=failed_rows,
+        )
@@ -0,0 +1,48 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from restaurants.feeds import RestaurantFeed
+from restaurants.models import (
+    Restaurant,
+    RestaurantDeletionMarker,
+    RestaurantImage,
+    Review,
+)
+from restaurants.search import RestaurantSearchIndex
+
+
+@receiver(post_save, sender=Restaurant)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=RestaurantImage)
+@receiver(post_delete, sender=Restaurant)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=RestaurantImage)
+def invalidate_restaurant_feed(sender, **kwargs) -> None:
+    RestaurantFeed.invalidate()
+
+
+@receiver(post_delete, sender=Restaurant)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=RestaurantImage)
+def mark_restaurant_deleted(sender, **kwargs) -> None:
+    RestaurantDeletionMarker.mark(sender)
+
+
+@receiver(post_save, sender=Restaurant)
+def index_restaurant(sender, instance: Restaurant, created: bool, **kwargs) -> None:
+    update_fields = kwargs.get("update_fields")
+    if created or update_fields is None or {"name", "address"} & set(update_fields):
+        RestaurantSearchIndex.index_restaurant_fields(instance)
+
+
+@receiver(post_save, sender=Review)
+def index_review(sender, instance: Review, created: bool, **kwargs) -> None:
+    if created:
+        RestaurantSearchIndex.add_review(instance.restaurant_id, instance.post)
+    else:
+        RestaurantSearchIndex.index_restaurants([instance.restaurant])
+
+
+@receiver(post_delete, sender=Review)
+def unindex_review(sender, instance: Review, **kwargs) -> None:
+    RestaurantSearchIndex.remove_review(instance.restaurant_id, instance.post)
@@ -1,3 +1,1214 @@
-from django.test import TestCase
+import asyncio
+import json
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import AsyncMock, patch
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from exceptions import (
+    CassetteMissException,
+    IncorrectQueryRequestException,
+    InternalServerErrorException,
+    NotFoundException,
+    SystemErrorException,
+)
+from restaurants.autocomplete import RestaurantAutocomplete
+from restaurants.models import (
+    IPAddress,
+    Restaurant,
+    RestaurantImage,
+    RestaurantImageJob,
+    Review,
+    SuggestionCooldown,
+)
+from restaurants.services import RestaurantImageService, RestaurantService
+from utils import geohash
+from utils.clients import NaverClient
+from utils.limiters import FileState
+from utils.middlewares import MetricsMiddleware
+from utils.testing import IsolatedStateMixin
+
+
+@override_settings(RESTAURANT_FEED_HOSTS=["testserver"])
+class ListRestaurantViewTest(IsolatedStateMixin, TestCase):
+    URL = "/api/v1/restaurants/restaurants"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+
+    def _create_restaurants(self, count: int) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_restaurant_rows(count)
+
+    def _create_restaurant_rows(self, count: int) -> None:
+        start = Restaurant.objects.count()
+        for index in range(start, start + count):
+            restaurant = Restaurant.objects.create(
+                name=f"식당{index}",
+                address=f"대구광역시 수성구 {index}",
+                detail_address=f"식당{index}",
+                longitude=128.68,
+                latitude=35.84,
+                far_from_lions_park=index,
+                category=Restaurant.RestaurantType.KOREAN,
+            )
+            Review.objects.create(restaurant=restaurant, post=f"리뷰{index}")
+            RestaurantImage.objects.bulk_create(
+                [
+                    RestaurantImage(
+                        restaurant=restaurant, img_url=f"https://img.test/{index}/{n}"
+                    )
+                    for n in range(2)
+                ]
+            )
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self._create_restaurants(3)
+        # 세대 조회 1번 + 목록 4번
+        with self.assertNumQueries(5):
+            response = self.client.get(self.URL)
+        self.assertEqual(response.status_code, 200)
+
+        self._create_restaurants(20)
+        with self.assertNumQueries(5):
+            response = self.client.get(self.URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 23)
+
+    def test_embeds_review_posts_and_image_urls(self):
+        self._create_restaurants(1)
+        response = self.client.get(self.URL)
+
+        restaurant = response.json()["results"][0]
+        self.assertNotIn("identity_key", restaurant)
+        self.assertNotIn("geohash", restaurant)
+        self.assertEqual(restaurant["review_posts"], ["리뷰0"])
+        self.assertEqual(
+            restaurant["image_urls"],
+            ["https://img.test/0/0", "https://img.test/0/1"],
+        )
+
+    @override_settings(RESTAURANT_LIST_REVIEW_LIMIT=2, RESTAURANT_LIST_REVIEW_LENGTH=5)
+    def test_embeds_only_latest_truncated_reviews_with_count(self):
+        self._create_restaurants(1)
+        restaurant = Restaurant.objects.get()
+        for post in ("두번째 리뷰", "세번째 리뷰입니다"):
+            Review.objects.create(restaurant=restaurant, post=post)
+
+        response = self.client.get(self.URL, {"page": 1})
+
+        restaurant = response.json()["results"][0]
+        self.assertEqual(restaurant["review_count"], 3)
+        self.assertEqual(restaurant["review_posts"], ["세번째 …", "두번째 …"])
+
+    def test_review_count_does_not_join_reviews(self):
+        self._create_restaurants(2)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.URL, {"pagination": "cursor"})
+
+        self.assertEqual(
+            [restaurant["review_count"] for restaurant in response.json()["results"]],
+            [1, 1],
+        )
+        list_query = next(
+            query["sql"]
+            for query in context.captured_queries
+            if "review_count" in query["sql"]
+        )
+        self.assertNotIn("JOIN", list_query)
+
+    def test_lists_full_review_history_per_restaurant(self):
+        self._create_restaurants(2)
+        restaurant = Restaurant.objects.get(name="식당0")
+        for index in range(1, 4):
+            Review.objects.create(restaurant=restaurant, post=f"리뷰0-{index}")
+
+        url = f"{self.URL}/{restaurant.id}/reviews"
+        first_page = self.client.get(url, {"page_size": 3}).json()
+        second_page = self.client.get(first_page["next"]).json()
+
+        self.assertEqual(
+            [review["post"] for review in first_page["results"]],
+            ["리뷰0-3", "리뷰0-2", "리뷰0-1"],
+        )
+        self.assertEqual(
+            [review["post"] for review in second_page["results"]], ["리뷰0"]
+        )
+        self.assertEqual(self.client.get(f"{self.URL}/0/reviews").status_code, 404)
+
+    def test_serves_snapshot_with_etag(self):
+        self._create_restaurants(2)
+        response = self.client.get(self.URL)
+        etag = response["ETag"]
+
+        # 세대 조회 1번
+        with self.assertNumQueries(1):
+            cached = self.client.get(self.URL)
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached["ETag"], etag)
+        self.assertEqual(cached.content, response.content)
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_snapshot_is_regenerated_after_write(self):
+        self._create_restaurants(1)
+        etag = self.client.get(self.URL)["ETag"]
+
+        self._create_restaurants(1)
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_snapshot_is_not_stored_under_generation_bumped_while_rendering(self):
+        self._create_restaurants(1)
+        render = JSONRenderer.render
+
+        def render_during_write(renderer, data, *args, **kwargs):
+            self._create_restaurants(1)
+            return render(renderer, data, *args, **kwargs)
+
+        with patch.object(JSONRenderer, "render", render_during_write):
+            stale = self.client.get(self.URL)
+        self.assertEqual(stale.json()["count"], 1)
+
+        response = self.client.get(self.URL)
+        self.assertEqual(response.json()["count"], 2)
+        self.assertNotEqual(response["ETag"], stale["ETag"])
+
+    def test_snapshot_key_is_overwritten_per_generation(self):
+        self._create_restaurants(1)
+        self.client.get(self.URL)
+        self._create_restaurants(1)
+        self.client.get(self.URL)
+
+        snapshot = caches["shared"].get("restaurant-feed:testserver")
+        self.assertEqual(json.loads(snapshot.content)["count"], 2)
+        self.assertIsNone(caches["shared"].get("restaurant-feed:generation"))
+
+    def test_unknown_hosts_bypass_snapshot(self):
+        self._create_restaurants(1)
+
+        response = self.client.get(self.URL, HTTP_HOST="attacker.test")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertIsNone(caches["shared"].get("restaurant-feed:attacker.test"))
+
+    def test_filtered_requests_bypass_snapshot(self):
+        self._create_restaurants(1)
+        self.client.get(self.URL)
+
+        # Last-Modified 집계 1번 + 목록 4번
+        with self.assertNumQueries(5):
+            response = self.client.get(self.URL, {"max_range": 100})
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+    def test_filtered_requests_honor_if_modified_since(self):
+        self._create_restaurants(2)
+        last_modified = self.client.get(self.URL, {"max_range": 100})["Last-Modified"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.URL, {"max_range": 100}, HTTP_IF_MODIFIED_SINCE=last_modified
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_filtered_requests_see_deletes_in_the_same_second(self):
+        self._create_restaurants(2)
+        second = timezone.now().replace(microsecond=0) + timezone.timedelta(seconds=1)
+        Review.objects.update(modified=second)
+        response = self.client.get(self.URL, {"max_range": 100})
+
+        with patch(
+            "django.utils.timezone.now",
+            return_value=second + timezone.timedelta(milliseconds=500),
+        ):
+            Review.objects.first().delete()
+
+        response = self.client.get(
+            self.URL,
+            {"max_range": 100},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_origin_annotates_and_orders_by_local_distance(self):
+        self._create_restaurants(2)
+        Restaurant.objects.filter(name="식당1").update(
+            longitude=128.5986, latitude=35.8714
+        )
+
+        response = self.client.get(self.URL, {"origin": "35.87,128.6"})
+
+        results = response.json()["results"]
+        self.assertEqual([result["name"] for result in results], ["식당1", "식당0"])
+        self.assertAlmostEqual(results[0]["distance"], 0.2, places=2)
+        self.assertEqual(self.client.get(self.URL, {"origin": "대구"}).status_code, 400)
+        self.assertEqual(
+            self.client.get(self.URL, {"origin": "128.6,35.87"}).status_code, 400
+        )
+
+    def test_recompute_distances_refreshes_snapshot(self):
+        self._create_restaurants(1)
+        etag = self.client.get(self.URL)["ETag"]
+        modified = Restaurant.objects.get().modified
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("recompute_distances", stdout=StringIO())
+
+        restaurant = Restaurant.objects.get()
+        self.assertGreater(restaurant.modified, modified)
+        response = self.client.get(self.URL)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            response.json()["results"][0]["far_from_lions_park"],
+            restaurant.far_from_lions_park,
+        )
+
+    def test_near_returns_restaurants_within_radius(self):
+        self._create_restaurants(3)
+        for name, longitude, latitude in (
+            ("식당1", 128.5986, 35.8714),
+            ("식당2", 128.6012, 35.8694),
+        ):
+            restaurant = Restaurant.objects.get(name=name)
+            restaurant.longitude, restaurant.latitude = longitude, latitude
+            restaurant.save()
+
+        response = self.client.get(self.URL, {"near": "35.87,128.6", "radius": 0.5})
+
+        results = response.json()["results"]
+        self.assertEqual([result["name"] for result in results], ["식당2", "식당1"])
+        self.assertEqual(
+            self.client.get(
+                self.URL, {"near": "35.87,128.6", "radius": 100}
+            ).status_code,
+            400,
+        )
+        self.assertEqual(
+            self.client.get(self.URL, {"near": "35.87,128.6", "radius": 0}).status_code,
+            400,
+        )
+
+    def test_cursor_pagination_walks_every_restaurant_once(self):
+        self._create_restaurants(5)
+
+        names = []
+        response = self.client.get(self.URL, {"pagination": "cursor", "page_size": 2})
+        while True:
+            body = response.json()
+            self.assertNotIn("count", body)
+            names += [restaurant["name"] for restaurant in body["results"]]
+            if not body["next"]:
+                break
+            response = self.client.get(body["next"])
+
+        self.assertEqual(names, [f"식당{index}" for index in range(5)])
+
+
+class LocalSearchRestaurantsViewTest(IsolatedStateMixin, TestCase):
+    URL = "/api/v1/restaurants/local-search-restaurants"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+
+    def _create_restaurant(self, name: str, suggested_count: int = 1) -> Restaurant:
+        return Restaurant.objects.create(
+            name=name,
+            address="대구광역시 수성구 야구전설로 1",
+            detail_address=name,
+            longitude=128.68,
+            latitude=35.84,
+            far_from_lions_park=0.1,
+            category=Restaurant.RestaurantType.MEAT,
+            suggested_count=suggested_count,
+        )
+
+    def _search(self, query: str) -> list[str]:
+        response = self.client.get(self.URL, {"query": query})
+        if response.status_code == 404:
+            return []
+        return [restaurant["name"] for restaurant in response.json()]
+
+    def test_ranks_by_match_quality_then_suggested_count(self):
+        self._create_restaurant("원조막창", suggested_count=1)
+        self._create_restaurant("수성막창", suggested_count=5)
+        review_only = self._create_restaurant("곱창골목", suggested_count=9)
+        Review.objects.create(restaurant=review_only, post="막창도 맛있어요")
+        self._create_restaurant("동네카페")
+
+        self.assertEqual(
+            self._search("원조 막창"), ["원조막창", "수성막창", "곱창골목"]
+        )
+        self.assertEqual(self._search("막창"), ["수성막창", "원조막창", "곱창골목"])
+
+    def test_index_follows_review_and_restaurant_writes(self):
+        restaurant = self._create_restaurant("동네카페")
+        review = Review.objects.create(restaurant=restaurant, post="라떼가 맛있어요")
+        Review.objects.create(restaurant=restaurant, post="라떼 추천")
+        self.assertEqual(self._search("라떼"), ["동네카페"])
+
+        review.delete()
+        self.assertEqual(self._search("라떼"), ["동네카페"])
+        self.assertEqual(self._search("맛있어요"), [])
+
+        restaurant.name = "라팍커피"
+        restaurant.save()
+        self.assertEqual(self._search("커피"), ["라팍커피"])
+        self.assertEqual(self._search("카페"), [])
+
+
+class AutocompleteRestaurantsViewTest(IsolatedStateMixin, TestCase):
+    URL = "/api/v1/restaurants/autocomplete-restaurants"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        RestaurantService._autocomplete.clear()
+        RestaurantService._search_cache.clear()
+
+    def _create_restaurant(self, name: str, suggested_count: int = 1) -> Restaurant:
+        return Restaurant.objects.create(
+            name=name,
+            address=f"대구광역시 수성구 {name}로 1",
+            detail_address=name,
+            longitude=128.68,
+            latitude=35.84,
+            far_from_lions_park=0.1,
+            category=Restaurant.RestaurantType.MEAT,
+            suggested_count=suggested_count,
+        )
+
+    def _suggest(self, query: str) -> list[str]:
+        response = self.client.get(self.URL, {"query": query})
+        self.assertEqual(response.status_code, 200)
+        return [restaurant["name"] for restaurant in response.json()]
+
+    @patch("restaurants.services.NaverClient.search_places")
+    def test_suggests_by_prefix_including_naver_results(self, search_places):
+        self._create_restaurant("막창골목", suggested_count=1)
+        self._create_restaurant("막창명가", suggested_count=5)
+        self._create_restaurant("동네카페")
+        search_places.return_value = [
+            {"title": "<b>막창</b>하우스", "roadAddress": "대구광역시 북구 1"},
+        ]
+        RestaurantService().search_restaurants("막창")
+
+        self.assertEqual(self._suggest("막창"), ["막창명가", "막창골목", "막창하우스"])
+        self.assertEqual(self._suggest("막창명"), ["막창명가"])
+        self.assertEqual(self._suggest("곱창"), [])
+
+    def test_refreshes_incrementally_from_modified(self):
+        restaurant = self._create_restaurant("막창골목", suggested_count=1)
+        self._create_restaurant("막창명가", suggested_count=2)
+        self.assertEqual(self._suggest("막창"), ["막창명가", "막창골목"])
+
+        restaurant.suggested_count = 3
+        restaurant.save()
+        self._create_restaurant("막창하우스", suggested_count=9)
+        self.assertEqual(self._suggest("막창"), ["막창명가", "막창골목"])
+
+        RestaurantService._autocomplete.refresh()
+        self.assertEqual(self._suggest("막창"), ["막창하우스", "막창골목", "막창명가"])
+
+    def test_evicts_least_suggested_names_over_memory_budget(self):
+        for index in range(10):
+            self._create_restaurant(f"막창{index}", suggested_count=index)
+        autocomplete = RestaurantAutocomplete(memory_budget=2000, refresh_interval=60)
+
+        suggestions = autocomplete.suggest("막창", limit=10)
+
+        self.assertLessEqual(autocomplete.memory, 2000)
+        self.assertEqual(len(suggestions), len(autocomplete))
+        self.assertEqual(suggestions[0].name, "막창9")
+        self.assertNotIn("막창0", [suggestion.name for suggestion in suggestions])
+
+    def test_ranks_every_prefix_match_by_suggested_count(self):
+        autocomplete = RestaurantAutocomplete(
+            memory_budget=16 * 1024 * 1024, refresh_interval=60
+        )
+        for index in range(1100):
+            autocomplete.add(f"막창골목{index:04d}", f"수성구 {index}")
+        autocomplete.add("막창명가", "수성구 명가로 1", weight=5)
+        autocomplete.add("막창골목1099", "수성구 1099", weight=3)
+
+        def suggest(query: str) -> list[str]:
+            return [
+                suggestion.name for suggestion in autocomplete.suggest(query, limit=2)
+            ]
+
+        self.assertEqual(suggest("막"), ["막창명가", "막창골목1099"])
+        self.assertEqual(suggest("막창"), ["막창명가", "막창골목1099"])
+        self.assertEqual(suggest("막창골"), ["막창골목1099", "막창골목0000"])
+
+
+@patch("restaurants.services.NaverClient.search_places")
+class SearchRestaurantsCacheTest(IsolatedStateMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        RestaurantService._search_cache.clear()
+
+    def test_repeated_queries_skip_naver(self, search_places):
+        search_places.return_value = [
+            {
+                "title": "<b>원조</b>막창",
+                "roadAddress": "대구광역시 수성구 야구전설로 1",
+            }
+        ]
+
+        first = RestaurantService().search_restaurants("  원조   막창 ")
+        second = RestaurantService().search_restaurants("원조 막창")
+
+        search_places.assert_called_once_with(name="원조 막창")
+        self.assertEqual(first, second)
+        self.assertEqual(first[0].name, "원조막창")
+        self.assertEqual(RestaurantService._search_cache.hits, 1)
+        self.assertEqual(RestaurantService._search_cache.misses, 1)
+
+    def test_not_found_results_are_cached(self, search_places):
+        search_places.return_value = [
+            {"title": "막창", "roadAddress": "서울특별시 강남구 테헤란로 1"}
+        ]
+
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                RestaurantService().search_restaurants("막창")
+
+        search_places.assert_called_once()
+
+
+class ConcurrentSuggestionTest(IsolatedStateMixin, TransactionTestCase):
+    def _suggest(self, barrier: threading.Barrier, ip_address: str) -> None:
+        try:
+            barrier.wait()
+            RestaurantService()._save_suggestion(
+                "원조막창",
+                "대구광역시 수성구 야구전설로 1",
+                Restaurant.RestaurantType.MEAT,
+                ip_address,
+                None,
+                128.68,
+                35.84,
+                0.1,
+            )
+        finally:
+            connection.close()
+
+    def test_first_suggestions_at_once_create_one_row(self):
+        barrier = threading.Barrier(4)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._suggest, barrier, f"1.1.1.{index}")
+                for index in range(4)
+            ]
+        for future in futures:
+            future.result()
+
+        restaurant = Restaurant.objects.get()
+        self.assertEqual(restaurant.suggested_count, 4)
+        self.assertTrue(restaurant.search_grams.exists())
+
+
+@patch(
+    "restaurants.services.NaverClient.get_geocode_distance_by_address",
+    return_value=("128.68", "35.84", 1200.0),
+)
+@override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=True)
+class CreateRestaurantViewTest(IsolatedStateMixin, TestCase):
+    URL = "/api/v1/restaurants/restaurant"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+
+    def _suggest(self, ip_address: str, name: str = "원조막창"):
+        return self.client.post(
+            self.URL,
+            {
+                "name": name,
+                "address": "대구광역시 수성구 야구전설로 1",
+                "category": Restaurant.RestaurantType.MEAT,
+                "review": "",
+            },
+            REMOTE_ADDR=ip_address,
+        )
+
+    def test_geocode_is_cached_by_normalized_address(self, get_geocode):
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 201)
+        response = self.client.post(
+            self.URL,
+            {
+                "name": "원조막창",
+                "address": " 대구광역시  수성구 야구전설로 1",
+                "category": Restaurant.RestaurantType.MEAT,
+                "review": "",
+            },
+            REMOTE_ADDR="2.2.2.2",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        get_geocode.assert_called_once()
+        for distance in Restaurant.objects.values_list(
+            "far_from_lions_park", flat=True
+        ):
+            self.assertAlmostEqual(distance, 0.168, places=3)
+
+    def test_repeated_suggestions_increment_one_row(self, get_geocode):
+        self._suggest("1.1.1.1")
+        self._suggest("2.2.2.2")
+        response = self._suggest("3.3.3.3")
+
+        self.assertEqual(response.data, {"count": 3})
+        self.assertEqual(Restaurant.objects.get().suggested_count, 3)
+
+    def test_same_ip_is_cooled_down_until_expiry(self, get_geocode):
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 201)
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 400)
+
+        SuggestionCooldown.objects.update(expires_at=timezone.now())
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 201)
+        self.assertEqual(Restaurant.objects.get().suggested_count, 2)
+
+    def test_claim_renews_only_expired_cooldowns(self, get_geocode):
+        expires_at = timezone.now() + timezone.timedelta(days=3)
+        later = expires_at + timezone.timedelta(seconds=1)
+
+        self.assertTrue(SuggestionCooldown.objects.claim("key", "1.1.1.1", expires_at))
+        self.assertFalse(SuggestionCooldown.objects.claim("key", "1.1.1.1", later))
+        self.assertEqual(SuggestionCooldown.objects.get().expires_at, expires_at)
+
+        SuggestionCooldown.objects.update(expires_at=timezone.now())
+        self.assertTrue(SuggestionCooldown.objects.claim("key", "1.1.1.1", later))
+        self.assertEqual(SuggestionCooldown.objects.get().expires_at, later)
+
+    def test_rejected_suggestion_does_not_start_cooldown(self, get_geocode):
+        get_geocode.return_value = ("128.0", "35.0", 25000.0)
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 400)
+
+        self.assertFalse(SuggestionCooldown.objects.exists())
+
+    def test_purge_removes_only_expired_cooldowns(self, get_geocode):
+        self._suggest("1.1.1.1")
+        self._suggest("2.2.2.2")
+        SuggestionCooldown.objects.filter(ip_address="1.1.1.1").update(
+            expires_at=timezone.now()
+        )
+
+        call_command("purge_suggestion_cooldowns", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            list(SuggestionCooldown.objects.values_list("ip_address", flat=True)),
+            ["2.2.2.2"],
+        )
+
+    def test_prune_archives_and_deletes_old_ip_addresses(self, get_geocode):
+        for ip_address in ("1.1.1.1", "2.2.2.2", "3.3.3.3"):
+            self._suggest(ip_address)
+        IPAddress.objects.exclude(ip_address="3.3.3.3").update(
+            created=timezone.now() - timezone.timedelta(days=4)
+        )
+
+        with tempfile.NamedTemporaryFile("r", suffix=".jsonl") as archive:
+            call_command(
+                "prune_ip_addresses",
+                batch_size=1,
+                archive=archive.name,
+                stdout=StringIO(),
+            )
+            archived = [json.loads(line)["ip_address"] for line in archive]
+
+        self.assertEqual(archived, ["1.1.1.1", "2.2.2.2"])
+        self.assertEqual(
+            list(IPAddress.objects.values_list("ip_address", flat=True)),
+            ["3.3.3.3"],
+        )
+
+    def test_images_are_fetched_in_background(self, get_geocode):
+        self._suggest("1.1.1.1")
+        self._suggest("2.2.2.2")
+
+        self.assertFalse(RestaurantImage.objects.exists())
+        job = RestaurantImageJob.objects.get()
+        self.assertEqual(job.status_type, RestaurantImageJob.StatusType.PENDING)
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=False)
+    @patch(
+        "restaurants.services.NaverClient.get_images",
+        return_value=[{"link": "https://img.test/1"}],
+    )
+    def test_images_are_fetched_alongside_geocode(self, get_images, get_geocode):
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 201)
+
+        get_images.assert_called_once_with("원조막창")
+        self.assertEqual(RestaurantImage.objects.count(), 1)
+        self.assertFalse(RestaurantImageJob.objects.exists())
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=False)
+    @patch("restaurants.services.NaverClient.get_images")
+    def test_images_are_refetched_only_when_stale(self, get_images, get_geocode):
+        get_images.return_value = [
+            {"link": "https://img.test/1"},
+            {"link": "https://img.test/2"},
+        ]
+        self._suggest("1.1.1.1")
+        self._suggest("2.2.2.2")
+        get_images.assert_called_once()
+
+        RestaurantImage.objects.update(
+            modified=timezone.now() - timezone.timedelta(days=31)
+        )
+        get_images.return_value = [
+            {"link": "https://img.test/2"},
+            {"link": "https://img.test/3"},
+        ]
+        self._suggest("3.3.3.3")
+
+        self.assertEqual(get_images.call_count, 2)
+        self.assertEqual(
+            sorted(RestaurantImage.objects.values_list("img_url", flat=True)),
+            ["https://img.test/2", "https://img.test/3"],
+        )
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=False)
+    @patch(
+        "restaurants.services.NaverClient.get_images",
+        side_effect=SystemErrorException("네이버 서버에 문제가 발생했습니다."),
+    )
+    def test_failed_images_are_not_queued_without_worker(self, get_images, get_geocode):
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 201)
+
+        self.assertFalse(RestaurantImage.objects.exists())
+        self.assertFalse(RestaurantImageJob.objects.exists())
+
+    def test_finished_image_job_is_requeued_when_stale(self, get_geocode):
+        self._suggest("1.1.1.1")
+        RestaurantImageJob.objects.update(
+            status_type=RestaurantImageJob.StatusType.DONE
+        )
+        self._suggest("2.2.2.2")
+        self.assertEqual(
+            RestaurantImageJob.objects.get().status_type,
+            RestaurantImageJob.StatusType.DONE,
+        )
+
+        RestaurantImageJob.objects.update(
+            modified=timezone.now() - timezone.timedelta(days=31)
+        )
+        self._suggest("3.3.3.3")
+        self.assertEqual(
+            RestaurantImageJob.objects.get().status_type,
+            RestaurantImageJob.StatusType.PENDING,
+        )
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=False)
+    @patch(
+        "restaurants.services.NaverClient.get_images",
+        return_value=[{"link": "https://img.test/1"}],
+    )
+    def test_images_are_discarded_when_too_far(self, get_images, get_geocode):
+        get_geocode.return_value = ("128.0", "35.0", 25000.0)
+
+        self.assertEqual(self._suggest("1.1.1.1").status_code, 400)
+
+        self.assertFalse(Restaurant.objects.exists())
+        self.assertFalse(RestaurantImage.objects.exists())
+
+
+@patch(
+    "restaurants.services.NaverClient.get_geocode_distance_by_address",
+    return_value=("128.68", "35.84", 1200.0),
+)
+class ImportRestaurantsCommandTest(IsolatedStateMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = f"{self.directory.name}/restaurants.csv"
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(
+                "name,address,category,longitude,latitude\n"
+                "원조막창,대구광역시 수성구 야구전설로 1,MEAT,,\n"
+                "동네카페,대구광역시 수성구 야구전설로 1,CAFE,,\n"
+                "좌표식당,대구광역시 수성구 야구전설로 2,KOREAN,128.681,35.842\n"
+                "먼식당,서울특별시 중구 세종대로 110,KOREAN,126.978,37.566\n"
+                "이상한식당,대구광역시 수성구 야구전설로 3,UNKNOWN,,\n"
+            )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _import(self, *args):
+        call_command(
+            "import_restaurants", self.path, "--chunk-size=2", *args, stdout=StringIO()
+        )
+
+    def test_imports_valid_rows_and_geocodes_each_address_once(self, get_geocode):
+        self._import()
+
+        get_geocode.assert_called_once_with("대구광역시 수성구 야구전설로 1")
+        self.assertEqual(
+            sorted(Restaurant.objects.values_list("name", flat=True)),
+            ["동네카페", "원조막창", "좌표식당"],
+        )
+        self.assertEqual(RestaurantImageJob.objects.count(), 3)
+        self.assertEqual(
+            Restaurant.objects.get(name="좌표식당").geohash,
+            geohash.encode(128.681, 35.842),
+        )
+
+    def test_resume_skips_processed_rows(self, get_geocode):
+        with open(f"{self.path}.checkpoint", "w") as file:
+            file.write("2")
+
+        self._import("--resume", "--no-images")
+
+        get_geocode.assert_not_called()
+        self.assertEqual(
+            list(Restaurant.objects.values_list("name", flat=True)), ["좌표식당"]
+        )
+        self.assertFalse(RestaurantImageJob.objects.exists())
+        with open(f"{self.path}.checkpoint") as file:
+            self.assertEqual(file.read(), "5")
+
+    def test_rows_that_fail_to_geocode_are_written_for_retry(self, get_geocode):
+        get_geocode.side_effect = SystemErrorException(
+            "네이버 서버에 문제가 발생했습니다."
+        )
+
+        self._import("--no-images")
+
+        self.assertEqual(
+            list(Restaurant.objects.values_list("name", flat=True)), ["좌표식당"]
+        )
+        rejects = f"{self.path}.rejects.jsonl"
+        with open(rejects, encoding="utf-8") as file:
+            self.assertEqual(
+                [json.loads(line)["name"] for line in file], ["원조막창", "동네카페"]
+            )
+
+        get_geocode.side_effect = None
+        call_command("import_restaurants", rejects, "--no-images", stdout=StringIO())
+        self.assertEqual(
+            sorted(Restaurant.objects.values_list("name", flat=True)),
+            ["동네카페", "원조막창", "좌표식당"],
+        )
+
+
+class AsyncRestaurantViewsTest(IsolatedStateMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        RestaurantService._search_cache.clear()
+
+    @patch(
+        "restaurants.services.NaverClient.asearch_places",
+        new_callable=AsyncMock,
+        return_value=[
+            {"title": "원조막창", "roadAddress": "대구광역시 수성구 야구전설로 1"}
+        ],
+    )
+    async def test_search_restaurants(self, asearch_places):
+        response = await self.async_client.get(
+            "/api/v1/restaurants/async/search-restaurants", {"name": "막창"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [{"name": "원조막창", "road_address": "대구광역시 수성구 야구전설로 1"}],
+        )
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=True)
+    @patch(
+        "restaurants.services.NaverClient.aget_geocode_distance_by_address",
+        new_callable=AsyncMock,
+        return_value=("128.68", "35.84", 1200.0),
+    )
+    async def test_create_restaurant(self, aget_geocode):
+        response = await self.async_client.post(
+            "/api/v1/restaurants/async/restaurant",
+            {
+                "name": "원조막창",
+                "address": "대구광역시 수성구 야구전설로 1",
+                "category": Restaurant.RestaurantType.MEAT,
+                "review": "맛있어요",
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"count": 1})
+        self.assertEqual(await Review.objects.acount(), 1)
+        self.assertEqual(await RestaurantImageJob.objects.acount(), 1)
+
+
+@patch("restaurants.services.NaverClient.get_images")
+class RestaurantImageServiceTest(IsolatedStateMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.restaurant = Restaurant.objects.create(
+            name="원조막창",
+            address="대구광역시 수성구 야구전설로 1",
+            detail_address="원조막창",
+            longitude=128.68,
+            latitude=35.84,
+            far_from_lions_park=1.2,
+            category=Restaurant.RestaurantType.MEAT,
+        )
+        RestaurantImageService.enqueue(self.restaurant)
+
+    def test_saves_https_images(self, get_images):
+        get_images.return_value = [
+            {"link": "https://img.test/1"},
+            {"link": "http://img.test/2"},
+        ]
+
+        self.assertEqual(RestaurantImageService().run_pending_jobs(10), 1)
+
+        self.assertEqual(
+            list(RestaurantImage.objects.values_list("img_url", flat=True)),
+            ["https://img.test/1"],
+        )
+        job = RestaurantImageJob.objects.get()
+        self.assertEqual(job.status_type, RestaurantImageJob.StatusType.DONE)
+        self.assertEqual(RestaurantImageService().run_pending_jobs(10), 0)
+
+    def test_failed_job_is_retried_later(self, get_images):
+        get_images.side_effect = SystemErrorException(
+            "네이버 서버에 문제가 발생했습니다."
+        )
+
+        RestaurantImageService().run_pending_jobs(10)
+
+        job = RestaurantImageJob.objects.get()
+        self.assertEqual(job.status_type, RestaurantImageJob.StatusType.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertEqual(RestaurantImageService().run_pending_jobs(10), 0)
+
+    @override_settings(RESTAURANT_IMAGE_JOB_MAX_ATTEMPTS=2)
+    def test_stale_running_job_counts_as_attempt(self, get_images):
+        get_images.return_value = []
+
+        def time_out() -> RestaurantImageJob:
+            RestaurantImageJob.objects.update(
+                status_type=RestaurantImageJob.StatusType.RUNNING,
+                modified=timezone.now() - timezone.timedelta(hours=1),
+            )
+            RestaurantImageService().run_pending_jobs(10)
+            return RestaurantImageJob.objects.get()
+
+        job = time_out()
+        self.assertEqual(job.status_type, RestaurantImageJob.StatusType.DONE)
+        self.assertEqual(job.attempts, 2)
+
+        RestaurantImageJob.objects.update(attempts=1)
+        job = time_out()
+        self.assertEqual(job.status_type, RestaurantImageJob.StatusType.FAILED)
+        self.assertEqual(job.attempts, 2)
+        get_images.assert_called_once()
+
+
+class NaverAsyncClientTest(IsolatedStateMixin, SimpleTestCase):
+    def test_each_event_loop_gets_its_own_client(self):
+        async def get_client():
+            return NaverClient._get_async_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        self.assertIsNot(first, second)
+
+    async def test_lifespan_shutdown_closes_client(self):
+        from winoreat.asgi import application
+
+        client = NaverClient._get_async_client()
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        await application({"type": "lifespan"}, receive, send)
+
+        self.assertTrue(client.is_closed)
+        self.assertEqual(
+            sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        )
+
+
+class NaverClientGuardTest(IsolatedStateMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(
+            NAVER_CLIENT_BREAKER_FAILURE_THRESHOLD=2,
+            NAVER_CLIENT_RATE_LIMIT_TIMEOUT=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @patch("utils.clients.NaverClient._send_request")
+    def test_circuit_opens_after_system_errors(self, send_request):
+        send_request.side_effect = SystemErrorException(
+            "네이버 서버에 문제가 발생했습니다."
+        )
+
+        for _ in range(2):
+            with self.assertRaises(SystemErrorException):
+                NaverClient().search_places("막창")
+        with self.assertRaises(InternalServerErrorException):
+            NaverClient().search_places("막창")
+
+        self.assertEqual(send_request.call_count, 2)
+        send_request.side_effect = None
+        send_request.return_value = {"addresses": [{"x": "1", "y": "2", "distance": 3}]}
+        NaverClient().get_geocode_distance_by_address("대구광역시")
+
+    @patch("utils.clients.NaverClient._send_request", return_value={"items": []})
+    def test_rate_limit_is_shared_between_clients(self, send_request):
+        limits = {
+            "DEVELOPER_PLATFORM": {"rate": 0.001, "capacity": 2, "daily_limit": 100},
+            "CLOUD_PLATFORM": {"rate": 10, "capacity": 10, "daily_limit": 100},
+        }
+        with override_settings(NAVER_CLIENT_RATE_LIMITS=limits):
+            NaverClient().search_places("막창")
+            NaverClient().get_images("막창")
+            with self.assertRaises(InternalServerErrorException):
+                NaverClient().search_places("막창")
+
+        self.assertEqual(send_request.call_count, 2)
+
+    @patch("utils.clients.NaverClient._send_request", return_value={"items": []})
+    def test_corrupted_state_files_are_reset(self, send_request):
+        state_dir = self.state_dir / "naver"
+        state_dir.mkdir()
+        for name in ("developer_platform.bucket", "developer_platform.breaker"):
+            (state_dir / name).write_text('{"tokens": 1')
+
+        self.assertEqual(NaverClient().search_places("막창"), [])
+
+    @patch(
+        "utils.clients.NaverClient._asend_request",
+        new_callable=AsyncMock,
+        return_value={"items": []},
+    )
+    async def test_async_requests_keep_file_locks_off_the_event_loop(
+        self, asend_request
+    ):
+        loop_thread = threading.current_thread()
+        lock_threads = []
+        locked = FileState.locked
+
+        def record_thread(state):
+            lock_threads.append(threading.current_thread())
+            return locked(state)
+
+        with patch.object(FileState, "locked", record_thread):
+            await NaverClient().asearch_places("막창")
+
+        self.assertEqual(len(lock_threads), 3)
+        self.assertNotIn(loop_thread, lock_threads)
+
+
+class MetricsViewTest(IsolatedStateMixin, TestCase):
+    URL = "/metrics"
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.metrics_dir = self.state_dir / "metrics"
+        self.metrics_dir.mkdir()
+
+    def test_records_latency_and_queries_per_url_pattern(self):
+        self.client.get("/api/v1/restaurants/restaurants/1/reviews")
+
+        content = self.client.get(self.URL).content.decode()
+
+        view = 'view="api/v1/restaurants/restaurants/<int:restaurant_id>/reviews"'
+        self.assertIn(
+            f'http_request_duration_seconds_count{{{view},method="GET",status="404"}}',
+            content,
+        )
+        self.assertIn(f"http_request_db_queries_count{{{view}}}", content)
+        self.assertIn(f"http_request_db_duration_seconds_sum{{{view}}}", content)
+
+    @override_settings(RESTAURANT_IMAGE_FETCH_IN_BACKGROUND=True)
+    @patch(
+        "restaurants.services.NaverClient.aget_geocode_distance_by_address",
+        new_callable=AsyncMock,
+        return_value=("128.68", "35.84", 1200.0),
+    )
+    async def test_records_async_requests(self, aget_geocode):
+        await self.async_client.post(
+            "/api/v1/restaurants/async/restaurant",
+            {
+                "name": "원조막창",
+                "address": "대구광역시 수성구 야구전설로 1",
+                "category": Restaurant.RestaurantType.MEAT,
+                "review": "맛있어요",
+            },
+            content_type="application/json",
+        )
+
+        response = await self.async_client.get(self.URL)
+
+        view = 'view="api/v1/restaurants/async/restaurant"'
+        content = response.content.decode()
+        self.assertIn(
+            f'http_request_duration_seconds_count{{{view},method="POST",status="201"}}',
+            content,
+        )
+        queries = next(
+            line.split()[-1]
+            for line in content.splitlines()
+            if line.startswith(f"http_request_db_queries_sum{{{view}}}")
+        )
+        self.assertGreater(float(queries), 0)
+
+    def test_middleware_runs_natively_in_both_modes(self):
+        async def aget_response(request):
+            return HttpResponse()
+
+        self.assertTrue(iscoroutinefunction(MetricsMiddleware(aget_response)))
+        self.assertFalse(iscoroutinefunction(MetricsMiddleware(HttpResponse)))
+
+    def test_rejects_clients_outside_allowed_ips(self):
+        with override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"]):
+            self.assertEqual(self.client.get(self.URL).status_code, 403)
+            with override_settings(METRICS_TOKEN="secret"):
+                self.assertEqual(
+                    self.client.get(
+                        self.URL, HTTP_AUTHORIZATION="Bearer wrong"
+                    ).status_code,
+                    403,
+                )
+                self.assertEqual(
+                    self.client.get(
+                        self.URL, HTTP_AUTHORIZATION="Bearer secret"
+                    ).status_code,
+                    200,
+                )
+
+    @patch("utils.clients.NaverClient._get_session")
+    def test_sums_naver_errors_across_worker_processes(self, get_session):
+        labels = json.dumps(["v1/search/local.json", "SE01"])
+        (self.metrics_dir / "1-0.json").write_text(
+            json.dumps({"naver_request_errors_total": {labels: [2]}})
+        )
+        get_session.return_value.get.return_value.ok = False
+        get_session.return_value.get.return_value.json.return_value = {
+            "errorCode": "SE01"
+        }
+
+        with self.assertRaises(IncorrectQueryRequestException):
+            NaverClient().search_places("막창")
+        content = self.client.get(self.URL).content.decode()
+
+        self.assertIn(
+            'naver_request_errors_total{endpoint="v1/search/local.json",'
+            'error_code="SE01"} 3',
+            content,
+        )
+        self.assertIn(
+            'naver_request_duration_seconds_count{endpoint="v1/search/local.json"}',
+            content,
+        )
+
+
+@patch("utils.clients.NaverClient._get_session")
+class NaverClientCassetteTest(IsolatedStateMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cassette_path = self.state_dir / "naver-cassette.jsonl.gz"
+
+    def _respond(self, get_session, status_code: int, content: dict) -> None:
+        response = get_session.return_value.get.return_value
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.json.return_value = content
+
+    def test_replays_recorded_responses_without_calling_naver(self, get_session):
+        items = [{"title": "막창골목", "roadAddress": "대구광역시 수성구 1"}]
+        with override_settings(NAVER_CLIENT_CASSETTE_MODE="record"):
+            self._respond(get_session, 200, {"items": items})
+            NaverClient().search_places("막창")
+            self._respond(get_session, 400, {"errorCode": "SE01"})
+            with self.assertRaises(IncorrectQueryRequestException):
+                NaverClient().search_places("잘못된")
+        get_session.reset_mock()
+
+        with override_settings(NAVER_CLIENT_CASSETTE_MODE="replay"):
+            self.assertEqual(NaverClient().search_places("막창"), items)
+            with self.assertRaises(IncorrectQueryRequestException):
+                NaverClient().search_places("잘못된")
+            with self.assertRaises(CassetteMissException):
+                NaverClient().get_images("막창")
+
+        get_session.assert_not_called()
+
+    def test_server_errors_are_not_recorded(self, get_session):
+        with override_settings(NAVER_CLIENT_CASSETTE_MODE="record"):
+            self._respond(get_session, 500, {"errorCode": "SE99"})
+            with self.assertRaises(SystemErrorException):
+                NaverClient().search_places("막창")
+
+        with override_settings(NAVER_CLIENT_CASSETTE_MODE="replay"):
+            with self.assertRaises(CassetteMissException):
+                NaverClient().search_places("막창")
+
+    def test_replay_skips_rate_limit(self, get_session):
+        items = [{"title": "막창골목", "roadAddress": "대구광역시 수성구 1"}]
+        with override_settings(NAVER_CLIENT_CASSETTE_MODE="record"):
+            self._respond(get_session, 200, {"items": items})
+            NaverClient().search_places("막창")
+
+        limits = {
+            "DEVELOPER_PLATFORM": {"rate": 0.001, "capacity": 1, "daily_limit": 1},
+            "CLOUD_PLATFORM": {"rate": 0.001, "capacity": 1, "daily_limit": 1},
+        }
+        with override_settings(
+            NAVER_CLIENT_CASSETTE_MODE="replay", NAVER_CLIENT_RATE_LIMITS=limits
+        ):
+            for _ in range(3):
+                self.assertEqual(NaverClient().search_places("막창"), items)
+
+    @override_settings(NAVER_CLIENT_CASSETTE_MODE="replay")
+    def test_unrecorded_search_returns_not_found(self, get_session):
+        RestaurantService._search_cache.clear()
+
+        response = APIClient().get(
+            "/api/v1/restaurants/search-restaurants", {"name": "막창"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            response.json(), {"detail": "녹화되지 않은 네이버 요청입니다."}
+        )
+        get_session.assert_not_called()
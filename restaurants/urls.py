@@ -18,13 +18,25 @@ Including another URLconf
 from django.urls import path
 
 from restaurants.views import (
+    AsyncCreateRestaurantView,
+    AsyncSearchRestaurantsView,
+    AutocompleteRestaurantsView,
     CreateRestaurantView,
+    ListRestaurantReviewsView,
     ListRestaurantView,
+    LocalSearchRestaurantsView,
     SearchRestaurantsView,
 )
 
 urlpatterns = [
     path("restaurants", ListRestaurantView.as_view()),
+    path(
+        "restaurants/<int:restaurant_id>/reviews", ListRestaurantReviewsView.as_view()
+    ),
     path("search-restaurants", SearchRestaurantsView.as_view()),
+    path("autocomplete-restaurants", AutocompleteRestaurantsView.as_view()),
+    path("local-search-restaurants", LocalSearchRestaurantsView.as_view()),
     path("restaurant", CreateRestaurantView.as_view()),
+    path("async/search-restaurants", AsyncSearchRestaurantsView.as_view()),
+    path("async/restaurant", AsyncCreateRestaurantView.as_view()),
 ]
@@ -1,7 +1,6 @@
 from datetime import datetime
 from typing import Final
 
-from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from exceptions import (
@@ -9,7 +8,7 @@ from exceptions import (
     CategoryNotFoundException,
     TooFarFromLionsParkException,
 )
-from restaurants.models import IPAddress, Restaurant
+from restaurants.models import Restaurant, SuggestionCooldown
 
 
 class RestaurantValidator:
@@ -30,23 +29,27 @@ class RestaurantValidator:
     def validate_duplicate_restaurant(
         cls, name: str, address: str, ip_address: str
     ) -> None:
-        cooldown_date: datetime = timezone.now() - timezone.timedelta(
+        if SuggestionCooldown.objects.filter(
+            identity_key=Restaurant.make_identity_key(name, address, name),
+            ip_address=ip_address,
+            expires_at__gt=timezone.now(),
+        ).exists():
+            raise cls._already_add_restaurant_exception()
+
+    @classmethod
+    def claim_suggestion_cooldown(
+        cls, name: str, address: str, ip_address: str
+    ) -> None:
+        identity_key: str = Restaurant.make_identity_key(name, address, name)
+        expires_at: datetime = timezone.now() + timezone.timedelta(
             days=cls.RESTAURANT_ADD_COOLDOWN_DAYS
         )
 
-        ip_address_exists = IPAddress.objects.filter(
-            restaurant=OuterRef('pk'),
-            ip_address=ip_address
-        )
+        if not SuggestionCooldown.objects.claim(identity_key, ip_address, expires_at):
+            raise cls._already_add_restaurant_exception()
 
-        if Restaurant.objects.filter(
-            name=name,
-            address=address,
-            detail_address=name,
-            modified__gte=cooldown_date,
-        ).annotate(
-            has_ip=Exists(ip_address_exists)
-        ).filter(has_ip=True).exists():
-            raise AlreadyAddRestaurantException(
-                f"같은 식당은 {cls.RESTAURANT_ADD_COOLDOWN_DAYS}일에 1번만 추천할 수 있습니다."
-            )
+    @classmethod
+    def _already_add_restaurant_exception(cls) -> AlreadyAddRestaurantException:
+        return AlreadyAddRestaurantException(
+            f"같은 식당은 {cls.RESTAURANT_ADD_COOLDOWN_DAYS}일에 1번만 추천할 수 있습니다."
+        )
@@ -1,8 +1,27 @@
+import json
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, OuterRef, Prefetch, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.utils.http import http_date
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.exceptions import NotAuthenticated, NotFound, ValidationError
 from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.pagination import BasePagination
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -16,24 +35,144 @@ from exceptions import (
     NotFoundException,
     TooFarFromLionsParkException,
 )
-from restaurants.dtos import CreateRestaurantDto, SearchRestaurantsDto
+from restaurants.dtos import (
+    CreateRestaurantDto,
+    LocalSearchRestaurantDto,
+    RestaurantFeedDto,
+    SearchRestaurantsDto,
+)
+from restaurants.feeds import RestaurantFeed
 from restaurants.filters import RestaurantFilter
-from restaurants.models import Restaurant
+from restaurants.models import (
+    Restaurant,
+    RestaurantDeletionMarker,
+    RestaurantImage,
+    Review,
+)
+from restaurants.paginations import (
+    RestaurantCursorPagination,
+    ReviewCursorPagination,
+)
 from restaurants.serializers import (
+    AutocompleteRestaurantsQuerySerializer,
     CreateRestaurantRequestSerializer,
     CreateRestaurantResponseSerializer,
     ListRestaurantSerializer,
+    LocalSearchRestaurantsQuerySerializer,
+    LocalSearchRestaurantsResponseSerializer,
+    ReviewSerializer,
     SearchRestaurantsQuerySerializer,
     SearchRestaurantsResponseSerializer,
 )
 from restaurants.services import RestaurantService
+from utils.conditional import get_last_modified, make_etag
+
+
+def get_client_ip(request: HttpRequest) -> str:
+    return (
+        request.META.get("HTTP_X_FORWARDED_FOR").split(",")[0]
+        if request.META.get("HTTP_X_FORWARDED_FOR")
+        else request.META.get("REMOTE_ADDR")
+    )
 
 
 class ListRestaurantView(ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = ListRestaurantSerializer
     filterset_class = RestaurantFilter
-    queryset = Restaurant.objects.all().order_by("far_from_lions_park", "players_pick")
+    queryset = (
+        Restaurant.objects.prefetch_related("images")
+        .all()
+        .order_by("far_from_lions_park", "players_pick")
+    )
+
+    def get_queryset(self) -> QuerySet[Restaurant]:
+        return (
+            super()
+            .get_queryset()
+            # JOIN + GROUP BY는 restaurant_distance_cursor_idx로 정렬하지 못하게 한다.
+            .annotate(
+                review_count=Coalesce(
+                    Subquery(
+                        Review.objects.filter(restaurant=OuterRef("pk"))
+                        .order_by()
+                        .values("restaurant")
+                        .annotate(count=Count("*"))
+                        .values("count")
+                    ),
+                    0,
+                )
+            )
+            .prefetch_related(
+                Prefetch(
+                    "reviews",
+                    queryset=Review.objects.order_by("-created", "-id")[
+                        : settings.RESTAURANT_LIST_REVIEW_LIMIT
+                    ],
+                    to_attr="latest_reviews",
+                )
+            )
+        )
+
+    @property
+    def pagination_class(self) -> type[BasePagination]:
+        if self.request.query_params.get("pagination") == "cursor":
+            return RestaurantCursorPagination
+        return super().pagination_class
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponse:
+        host: str = request.get_host()
+        if request.query_params or host not in settings.RESTAURANT_FEED_HOSTS:
+            return self._list_with_last_modified(request, *args, **kwargs)
+
+        feed: RestaurantFeed = RestaurantFeed()
+        generation: int = feed.get_generation()
+        snapshot: RestaurantFeedDto | None = feed.get(generation, host)
+        if snapshot is None:
+            list_response: Response = super().list(request, *args, **kwargs)
+            snapshot = feed.save(
+                generation, host, JSONRenderer().render(list_response.data)
+            )
+
+        response: HttpResponse = get_conditional_response(
+            request,
+            etag=snapshot.etag,
+            last_modified=int(snapshot.last_modified.timestamp()),
+        ) or HttpResponse(snapshot.content, content_type="application/json")
+        response["ETag"] = snapshot.etag
+        response["Last-Modified"] = http_date(snapshot.last_modified.timestamp())
+        return response
+
+    def _list_with_last_modified(
+        self, request: Request, *args, **kwargs
+    ) -> HttpResponse:
+        last_modified: Optional[datetime] = get_last_modified(
+            Restaurant.objects.all(),
+            Review.objects.all(),
+            RestaurantImage.objects.all(),
+            RestaurantDeletionMarker.objects.all(),
+        )
+        if last_modified is None:
+            return super().list(request, *args, **kwargs)
+
+        etag: str = make_etag(last_modified)
+        response: HttpResponse = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp())
+        ) or super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class ListRestaurantReviewsView(ListAPIView):
+    permission_classes = [AllowAny]
+    serializer_class = ReviewSerializer
+    pagination_class = ReviewCursorPagination
+
+    def get_queryset(self) -> QuerySet[Review]:
+        if not Restaurant.objects.filter(id=self.kwargs["restaurant_id"]).exists():
+            raise NotFound(detail="해당하는 식당이 없습니다.")
+        return Review.objects.filter(restaurant_id=self.kwargs["restaurant_id"])
 
 
 class SearchRestaurantsView(APIView):
@@ -66,6 +205,51 @@ class SearchRestaurantsView(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+class AutocompleteRestaurantsView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request: Request) -> Response:
+        query_serializer: AutocompleteRestaurantsQuerySerializer = (
+            AutocompleteRestaurantsQuerySerializer(data=request.query_params)
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        suggestions: list[
+            SearchRestaurantsDto
+        ] = RestaurantService().autocomplete_restaurants(
+            **query_serializer.validated_data
+        )
+
+        response_serializer: SearchRestaurantsResponseSerializer = (
+            SearchRestaurantsResponseSerializer(suggestions, many=True)
+        )
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+class LocalSearchRestaurantsView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request: Request) -> Response:
+        query_serializer: LocalSearchRestaurantsQuerySerializer = (
+            LocalSearchRestaurantsQuerySerializer(data=request.query_params)
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        try:
+            search_restaurants: list[
+                LocalSearchRestaurantDto
+            ] = RestaurantService().search_local_restaurants(
+                **query_serializer.validated_data
+            )
+        except NotFoundException as exc:
+            raise NotFound(detail=str(exc)) from exc
+
+        response_serializer: LocalSearchRestaurantsResponseSerializer = (
+            LocalSearchRestaurantsResponseSerializer(search_restaurants, many=True)
+        )
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
 class CreateRestaurantView(GenericAPIView):
     serializer_class = CreateRestaurantRequestSerializer
     queryset = Restaurant.objects.all()
@@ -79,11 +263,7 @@ class CreateRestaurantView(GenericAPIView):
         try:
             restaurant: CreateRestaurantDto = RestaurantService().create_restaurant(
                 **request_serializer.validated_data,
-                ip_address=(
-                    request.META.get("HTTP_X_FORWARDED_FOR").split(",")[0]
-                    if request.META.get("HTTP_X_FORWARDED_FOR")
-                    else request.META.get("REMOTE_ADDR")
-                ),
+                ip_address=get_client_ip(request),
             )
         except (
             InvalidRequestException,
@@ -99,3 +279,92 @@ class CreateRestaurantView(GenericAPIView):
             CreateRestaurantResponseSerializer(restaurant)
         )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+
+class AsyncSearchRestaurantsView(View):
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        query_serializer: SearchRestaurantsQuerySerializer = (
+            SearchRestaurantsQuerySerializer(data=request.GET)
+        )
+        if not query_serializer.is_valid():
+            return JsonResponse(
+                query_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            search_restaurants: list[
+                SearchRestaurantsDto
+            ] = await RestaurantService().asearch_restaurants(
+                name=query_serializer.validated_data["name"],
+            )
+        except InvalidRequestException as exc:
+            return JsonResponse(
+                [str(exc)], status=status.HTTP_400_BAD_REQUEST, safe=False
+            )
+        except ApplicationAuthenticationFailedException as exc:
+            return JsonResponse(
+                {"detail": str(exc)}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        except NotFoundException as exc:
+            return JsonResponse({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        except InternalServerErrorException as exc:
+            return JsonResponse(
+                [str(exc)], status=status.HTTP_500_INTERNAL_SERVER_ERROR, safe=False
+            )
+
+        response_serializer: SearchRestaurantsResponseSerializer = (
+            SearchRestaurantsResponseSerializer(search_restaurants, many=True)
+        )
+        return JsonResponse(
+            response_serializer.data, status=status.HTTP_200_OK, safe=False
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncCreateRestaurantView(View):
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        if request.content_type == "application/json":
+            try:
+                data = json.loads(request.body)
+            except ValueError:
+                return JsonResponse(
+                    {"detail": "JSON 형식이 올바르지 않습니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            data = request.POST
+
+        request_serializer: CreateRestaurantRequestSerializer = (
+            CreateRestaurantRequestSerializer(data=data)
+        )
+        if not request_serializer.is_valid():
+            return JsonResponse(
+                request_serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            restaurant: (
+                CreateRestaurantDto
+            ) = await RestaurantService().acreate_restaurant(
+                **request_serializer.validated_data,
+                ip_address=get_client_ip(request),
+            )
+        except (
+            InvalidRequestException,
+            AlreadyAddRestaurantException,
+            TooFarFromLionsParkException,
+        ) as exc:
+            return JsonResponse(
+                [str(exc)], status=status.HTTP_400_BAD_REQUEST, safe=False
+            )
+        except CategoryNotFoundException as exc:
+            return JsonResponse({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        except InternalServerErrorException as exc:
+            return JsonResponse(
+                [str(exc)], status=status.HTTP_500_INTERNAL_SERVER_ERROR, safe=False
+            )
+
+        response_serializer: CreateRestaurantResponseSerializer = (
+            CreateRestaurantResponseSerializer(restaurant)
+        )
+        return JsonResponse(response_serializer.data, status=status.HTTP_201_CREATED)
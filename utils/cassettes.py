@@ -0,0 +1,87 @@
+import fcntl
+import gzip
+import hashlib
+import json
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+Entry = tuple[bool, dict[str, Any]]
+
+
+class CassetteMode(Enum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class Cassette:
+    """네이버 요청/응답 쌍을 gzip으로 압축한 JSON Lines 파일에 녹화한다.
+
+    한 줄마다 gzip 멤버 하나로 덧붙이므로 여러 워커가 같은 파일에 녹화할 수
+    있고, 같은 요청은 처음 응답 하나만 남긴다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._entries: Optional[dict[str, Entry]] = None
+        self._loaded_size: int = -1
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any]) -> str:
+        return hashlib.sha256(
+            json.dumps([endpoint, params], sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+
+    def _load(self) -> dict[str, Entry]:
+        size: int = self.path.stat().st_size if self.path.exists() else 0
+        if self._entries is None or size != self._loaded_size:
+            entries: dict[str, Entry] = {}
+            if size:
+                with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                    for line in file:
+                        record: dict[str, Any] = json.loads(line)
+                        entries.setdefault(
+                            record["key"], (record["ok"], record["body"])
+                        )
+            self._entries = entries
+            self._loaded_size = size
+        return self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def get(self, endpoint: str, params: dict[str, Any]) -> Optional[Entry]:
+        with self._lock:
+            return self._load().get(self.make_key(endpoint, params))
+
+    def record(
+        self, endpoint: str, params: dict[str, Any], ok: bool, body: dict[str, Any]
+    ) -> None:
+        key: str = self.make_key(endpoint, params)
+        line: str = json.dumps(
+            {
+                "key": key,
+                "endpoint": endpoint,
+                "params": params,
+                "ok": ok,
+                "body": body,
+            },
+            ensure_ascii=False,
+        )
+        with self._lock:
+            if key in self._load():
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    file.write(gzip.compress(f"{line}\n".encode()))
+                    file.flush()
+                finally:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+            self._entries[key] = (ok, body)
+            self._loaded_size = self.path.stat().st_size
@@ -1,17 +1,40 @@
+import asyncio
+import os
+import time
+import weakref
 from enum import Enum
-from typing import Any, Final, NoReturn
+from pathlib import Path
+from typing import Any, Final, NoReturn, Optional
 
-import requests
+import httpx
 from django.conf import settings
-from requests import Response
+from requests import RequestException, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from exceptions import (AuthenticationFailedException,
+                        CassetteMissException,
                         IncorrectQueryRequestException,
+                        InternalServerErrorException,
                         InvalidDisplayValueException,
                         InvalidParameterException, InvalidSearchAPIException,
                         InvalidSortValueException, InvalidStartValueException,
                         MalformedEncodingException, NaverClientException,
                         SystemErrorException, UnknownNaverException)
+from utils.cassettes import Cassette, CassetteMode
+from utils.limiters import CircuitBreaker, TokenBucket
+from utils.metrics import Counter, Histogram
+
+NAVER_REQUEST_DURATION: Histogram = Histogram(
+    "naver_request_duration_seconds",
+    "네이버 API 엔드포인트별 호출 시간",
+    ("endpoint",),
+)
+NAVER_REQUEST_ERRORS: Counter = Counter(
+    "naver_request_errors_total",
+    "네이버 API 엔드포인트와 errorCode별 실패 횟수",
+    ("endpoint", "error_code"),
+)
 
 
 class NaverURLType(Enum):
@@ -44,6 +67,16 @@ class NaverExceptionHandler:
 
 
 class NaverClient:
+    SEARCH_PLACES_ENDPOINT: Final[str] = "v1/search/local.json"
+    GET_IMAGES_ENDPOINT: Final[str] = "v1/search/image.json"
+    GEOCODE_ENDPOINT: Final[str] = "map-geocode/v2/geocode"
+    RETRY_STATUS_CODES: Final[tuple[int, ...]] = (500, 502, 503, 504)
+
+    _session: Optional[Session] = None
+    _session_pid: Optional[int] = None
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _cassette: Optional[Cassette] = None
+
     def __init__(self) -> None:
         self.develop_platform_client_id: str = (
             settings.NAVER_DEVELOPER_PLATFORM_CLIENT_ID
@@ -56,16 +89,151 @@ class NaverClient:
             settings.NAVER_CLOUD_PLATFORM_CLIENT_SECRET
         )
 
+    @classmethod
+    def _get_session(cls) -> Session:
+        if cls._session is None or cls._session_pid != os.getpid():
+            retry: Retry = Retry(
+                total=settings.NAVER_CLIENT_MAX_RETRIES,
+                backoff_factor=settings.NAVER_CLIENT_BACKOFF_FACTOR,
+                status_forcelist=cls.RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            )
+            adapter: HTTPAdapter = HTTPAdapter(
+                pool_connections=len(NaverURLType),
+                pool_maxsize=settings.NAVER_CLIENT_POOL_SIZE,
+                max_retries=retry,
+            )
+            session: Session = Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+            cls._session_pid = os.getpid()
+        return cls._session
+
+    @classmethod
+    def _get_async_client(cls) -> httpx.AsyncClient:
+        # 연결은 만든 이벤트 루프에 묶이므로 루프마다 따로 두고, 루프가 사라지면 함께 버린다.
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        client: Optional[httpx.AsyncClient] = cls._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.NAVER_CLIENT_POOL_SIZE,
+                    max_keepalive_connections=settings.NAVER_CLIENT_POOL_SIZE,
+                ),
+                timeout=httpx.Timeout(
+                    settings.NAVER_CLIENT_READ_TIMEOUT,
+                    connect=settings.NAVER_CLIENT_CONNECT_TIMEOUT,
+                ),
+            )
+            cls._async_clients[loop] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """현재 이벤트 루프의 AsyncClient를 닫는다. ASGI lifespan shutdown에서 부른다."""
+        client: Optional[httpx.AsyncClient] = cls._async_clients.pop(
+            asyncio.get_running_loop(), None
+        )
+        if client is not None:
+            await client.aclose()
+
+    @classmethod
+    def _get_cassette(cls) -> Cassette:
+        path: Path = Path(settings.NAVER_CLIENT_CASSETTE_PATH)
+        if cls._cassette is None or cls._cassette.path != path:
+            cls._cassette = Cassette(path)
+        return cls._cassette
+
+    def _get_cassette_mode(self) -> CassetteMode:
+        return CassetteMode(settings.NAVER_CLIENT_CASSETTE_MODE)
+
+    def _replay(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        entry: Optional[tuple[bool, dict[str, Any]]] = self._get_cassette().get(
+            endpoint, params
+        )
+        if entry is None:
+            self._record_error(endpoint, "CASSETTE_MISS")
+            raise CassetteMissException("녹화되지 않은 네이버 요청입니다.")
+        return self._handle_response(endpoint, *entry)
+
+    def _record(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        status_code: int,
+        res_dict: dict[str, Any],
+    ) -> None:
+        # 일시적인 서버 에러는 녹화하지 않아 다음 녹화 때 다시 받아오게 한다.
+        if (
+            self._get_cassette_mode() == CassetteMode.RECORD
+            and status_code not in self.RETRY_STATUS_CODES
+        ):
+            self._get_cassette().record(
+                endpoint, params, 200 <= status_code < 300, res_dict
+            )
+
     def _is_search_places(self, endpoint: str) -> True:
         if endpoint == "v1/search/local.json" or endpoint == "v1/search/image.json":
             return True
         return False
 
+    def _get_url_type(self, endpoint: str) -> NaverURLType:
+        if self._is_search_places(endpoint=endpoint):
+            return NaverURLType.DEVELOPER_PLATFORM
+        return NaverURLType.CLOUD_PLATFORM
+
+    def _get_rate_limiter(self, url_type: NaverURLType) -> TokenBucket:
+        limits: dict[str, float] = settings.NAVER_CLIENT_RATE_LIMITS[url_type.name]
+        return TokenBucket(
+            Path(settings.NAVER_CLIENT_STATE_DIR) / f"{url_type.name.lower()}.bucket",
+            rate=limits["rate"],
+            capacity=limits["capacity"],
+            daily_limit=limits["daily_limit"],
+        )
+
+    def _is_rate_limited(self) -> bool:
+        # 재생은 네이버를 호출하지 않으므로 호출 한도를 쓰지 않는다.
+        return self._get_cassette_mode() != CassetteMode.REPLAY
+
+    def _get_circuit_breaker(self, url_type: NaverURLType) -> CircuitBreaker:
+        return CircuitBreaker(
+            Path(settings.NAVER_CLIENT_STATE_DIR) / f"{url_type.name.lower()}.breaker",
+            failure_threshold=settings.NAVER_CLIENT_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.NAVER_CLIENT_BREAKER_RECOVERY_TIMEOUT,
+        )
+
+    def _record_error(self, endpoint: str, error_code: str) -> None:
+        NAVER_REQUEST_ERRORS.inc(endpoint=endpoint, error_code=error_code)
+
+    def _check_circuit(self, endpoint: str, circuit_breaker: CircuitBreaker) -> None:
+        if not circuit_breaker.allow_request():
+            self._record_error(endpoint, "CIRCUIT_OPEN")
+            raise InternalServerErrorException(
+                "네이버 서버가 불안정합니다. 잠시 후 다시 시도해주세요."
+            )
+
+    def _raise_rate_limited(self, endpoint: str) -> NoReturn:
+        self._record_error(endpoint, "RATE_LIMITED")
+        raise InternalServerErrorException("네이버 API 호출 한도를 초과했습니다.")
+
+    def _record_result(
+        self, circuit_breaker: CircuitBreaker, exception: Optional[Exception]
+    ) -> None:
+        if isinstance(exception, SystemErrorException):
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
     def _create_full_url(self, url_type: NaverURLType, endpoint: str) -> str:
-        return f"{url_type.value}{endpoint}"
+        base_url: str = settings.NAVER_CLIENT_BASE_URLS.get(
+            url_type.name, url_type.value
+        )
+        return f"{base_url}{endpoint}"
 
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        if self._is_search_places(endpoint=endpoint):
+    def _build_request(self, endpoint: str) -> tuple[str, dict[str, str]]:
+        if self._get_url_type(endpoint) == NaverURLType.DEVELOPER_PLATFORM:
             full_url: str = self._create_full_url(
                 NaverURLType.DEVELOPER_PLATFORM, endpoint
             )
@@ -79,46 +247,184 @@ class NaverClient:
                 "X-NCP-APIGW-API-KEY-ID": self.cloud_platform_client_id,
                 "X-NCP-APIGW-API-KEY": self.cloud_platform_client_secret,
             }
+        return full_url, {key: value for key, value in headers.items() if value}
 
-        response: Response = requests.get(full_url, headers=headers, params=params)
-        res_dict: dict[str, Any] = response.json()
-
-        if not response.ok:
-            NaverExceptionHandler.raise_exception(
+    def _handle_response(
+        self, endpoint: str, ok: bool, res_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        if not ok:
+            error_code: str = (
                 res_dict["errorCode"]
                 if res_dict.get("errorCode")
                 else res_dict.get("errorMessage")
             )
+            self._record_error(endpoint, str(error_code))
+            NaverExceptionHandler.raise_exception(error_code)
+        return res_dict
+
+    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        url_type: NaverURLType = self._get_url_type(endpoint)
+        circuit_breaker: CircuitBreaker = self._get_circuit_breaker(url_type)
+        self._check_circuit(endpoint, circuit_breaker)
+        if self._is_rate_limited() and not self._get_rate_limiter(url_type).acquire(
+            settings.NAVER_CLIENT_RATE_LIMIT_TIMEOUT
+        ):
+            self._raise_rate_limited(endpoint)
+
+        started: float = time.perf_counter()
+        try:
+            res_dict: dict[str, Any] = self._send_request(endpoint, params)
+        except Exception as exc:
+            self._record_result(circuit_breaker, exc)
+            raise
+        finally:
+            NAVER_REQUEST_DURATION.observe(
+                time.perf_counter() - started, endpoint=endpoint
+            )
+        self._record_result(circuit_breaker, None)
+        return res_dict
+
+    def _send_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        if self._get_cassette_mode() == CassetteMode.REPLAY:
+            time.sleep(settings.NAVER_CLIENT_CASSETTE_LATENCY)
+            return self._replay(endpoint, params)
+
+        full_url, headers = self._build_request(endpoint)
+
+        try:
+            response: Response = self._get_session().get(
+                full_url,
+                headers=headers,
+                params=params,
+                timeout=(
+                    settings.NAVER_CLIENT_CONNECT_TIMEOUT,
+                    settings.NAVER_CLIENT_READ_TIMEOUT,
+                ),
+            )
+            res_dict: dict[str, Any] = response.json()
+        except RequestException as exc:
+            self._record_error(endpoint, "CONNECTION_ERROR")
+            raise SystemErrorException("네이버 서버에 연결할 수 없습니다.") from exc
 
+        self._record(endpoint, params, response.status_code, res_dict)
+        return self._handle_response(endpoint, response.ok, res_dict)
+
+    async def _amake_request(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        url_type: NaverURLType = self._get_url_type(endpoint)
+        circuit_breaker: CircuitBreaker = self._get_circuit_breaker(url_type)
+        await asyncio.to_thread(self._check_circuit, endpoint, circuit_breaker)
+        if self._is_rate_limited() and not await self._get_rate_limiter(
+            url_type
+        ).aacquire(settings.NAVER_CLIENT_RATE_LIMIT_TIMEOUT):
+            self._raise_rate_limited(endpoint)
+
+        started: float = time.perf_counter()
+        try:
+            res_dict: dict[str, Any] = await self._asend_request(endpoint, params)
+        except Exception as exc:
+            await asyncio.to_thread(self._record_result, circuit_breaker, exc)
+            raise
+        finally:
+            NAVER_REQUEST_DURATION.observe(
+                time.perf_counter() - started, endpoint=endpoint
+            )
+        await asyncio.to_thread(self._record_result, circuit_breaker, None)
         return res_dict
 
-    def search_places(self, name: str, display: int = 5) -> list[dict[str, Any]]:
-        ENDPOINT: Final[str] = "v1/search/local.json"
-        params: dict[str, Any] = {
-            "query": name,
-            "display": display,
-        }
-        result: dict[str, Any] = self._make_request(ENDPOINT, params)
-        return result["items"]
+    async def _asend_request(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        if self._get_cassette_mode() == CassetteMode.REPLAY:
+            await asyncio.sleep(settings.NAVER_CLIENT_CASSETTE_LATENCY)
+            return self._replay(endpoint, params)
 
-    def get_images(self, name: str, display: int = 5) -> list:
-        ENDPOINT: Final[str] = "v1/search/image.json"
-        params: dict[str, Any] = {
+        full_url, headers = self._build_request(endpoint)
+
+        for attempt in range(settings.NAVER_CLIENT_MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(
+                    settings.NAVER_CLIENT_BACKOFF_FACTOR * 2 ** (attempt - 1)
+                )
+            try:
+                response: httpx.Response = await self._get_async_client().get(
+                    full_url, headers=headers, params=params
+                )
+            except httpx.TransportError as exc:
+                if attempt < settings.NAVER_CLIENT_MAX_RETRIES:
+                    continue
+                self._record_error(endpoint, "CONNECTION_ERROR")
+                raise SystemErrorException("네이버 서버에 연결할 수 없습니다.") from exc
+            if (
+                response.status_code in self.RETRY_STATUS_CODES
+                and attempt < settings.NAVER_CLIENT_MAX_RETRIES
+            ):
+                continue
+            break
+
+        try:
+            res_dict: dict[str, Any] = response.json()
+        except ValueError as exc:
+            self._record_error(endpoint, "INVALID_RESPONSE")
+            raise SystemErrorException("네이버 서버에 연결할 수 없습니다.") from exc
+
+        self._record(endpoint, params, response.status_code, res_dict)
+        return self._handle_response(endpoint, response.is_success, res_dict)
+
+    def _search_params(self, name: str, display: int) -> dict[str, Any]:
+        return {
             "query": name,
             "display": display,
         }
-        result: dict[str, Any] = self._make_request(ENDPOINT, params)
-        return result["items"]
 
-    def get_geocode_distance_by_address(self, address: str) -> tuple[str, str, float]:
-        ENDPOINT: Final[str] = "map-geocode/v2/geocode"
-        params: dict[str, Any] = {
+    def _geocode_params(self, address: str) -> dict[str, Any]:
+        return {
             "query": address,
-            "coordinate": "128.6812364,35.8411290",
+            "coordinate": "{},{}".format(*settings.LIONS_PARK_COORDINATE),
         }
-        result: dict[str, Any] = self._make_request(ENDPOINT, params)
+
+    def _parse_geocode(self, result: dict[str, Any]) -> tuple[str, str, float]:
         return (
             result["addresses"][0].get("x"),
             result["addresses"][0].get("y"),
             result["addresses"][0].get("distance"),
         )
+
+    def search_places(self, name: str, display: int = 5) -> list[dict[str, Any]]:
+        result: dict[str, Any] = self._make_request(
+            self.SEARCH_PLACES_ENDPOINT, self._search_params(name, display)
+        )
+        return result["items"]
+
+    def get_images(self, name: str, display: int = 5) -> list:
+        result: dict[str, Any] = self._make_request(
+            self.GET_IMAGES_ENDPOINT, self._search_params(name, display)
+        )
+        return result["items"]
+
+    def get_geocode_distance_by_address(self, address: str) -> tuple[str, str, float]:
+        result: dict[str, Any] = self._make_request(
+            self.GEOCODE_ENDPOINT, self._geocode_params(address)
+        )
+        return self._parse_geocode(result)
+
+    async def asearch_places(self, name: str, display: int = 5) -> list[dict[str, Any]]:
+        result: dict[str, Any] = await self._amake_request(
+            self.SEARCH_PLACES_ENDPOINT, self._search_params(name, display)
+        )
+        return result["items"]
+
+    async def aget_images(self, name: str, display: int = 5) -> list:
+        result: dict[str, Any] = await self._amake_request(
+            self.GET_IMAGES_ENDPOINT, self._search_params(name, display)
+        )
+        return result["items"]
+
+    async def aget_geocode_distance_by_address(
+        self, address: str
+    ) -> tuple[str, str, float]:
+        result: dict[str, Any] = await self._amake_request(
+            self.GEOCODE_ENDPOINT, self._geocode_params(address)
+        )
+        return self._parse_geocode(result)
@@ -0,0 +1,80 @@
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Optional
+
+from django.db import connections, models
+from django.db.models import Model, QuerySet, Subquery
+from django.views.decorators.http import condition
+from django_extensions.db.models import TimeStampedModel
+
+
+class DeletionMarker(TimeStampedModel):
+    """삭제는 modified에 남지 않으므로 모델마다 마지막 삭제 시각을 한 줄로 남긴다.
+
+    각 앱이 상속해 자기 테이블을 두고, get_last_modified에 함께 넘긴다.
+    """
+
+    model_label = models.CharField(verbose_name="모델", max_length=127, unique=True)
+
+    class Meta(TimeStampedModel.Meta):
+        abstract = True
+
+    @classmethod
+    def mark(cls, model: type[Model]) -> None:
+        connection = connections[cls.objects.db]
+        # 한 문장의 upsert라 동시에 삭제해도 먼저 읽고 쓰는 사이에 끼어들지 않는다.
+        cls.objects.bulk_create(
+            [cls(model_label=model._meta.label)],
+            update_conflicts=True,
+            unique_fields=(
+                ["model_label"]
+                if connection.features.supports_update_conflicts_with_target
+                else None
+            ),
+            update_fields=["modified"],
+        )
+
+
+def get_last_modified(*querysets: QuerySet) -> Optional[datetime]:
+    """querysets 중 가장 최근 modified를 한 번의 쿼리로 구한다.
+
+    첫 번째 queryset이 비어 있으면 None을 돌려준다.
+    """
+    anchor, *_ = querysets
+    fields: list[str] = [f"modified_{index}" for index in range(len(querysets))]
+    rows: list[tuple[Optional[datetime], ...]] = list(
+        anchor.order_by()
+        .annotate(
+            **{
+                field: Subquery(queryset.order_by("-modified").values("modified")[:1])
+                for field, queryset in zip(fields, querysets)
+            }
+        )
+        .values_list(*fields)[:1]
+    )
+    if not rows:
+        return None
+    return max((timestamp for timestamp in rows[0] if timestamp), default=None)
+
+
+def make_etag(last_modified: datetime) -> str:
+    """Last-Modified는 초 단위라 같은 초 안의 쓰기를 구분하도록 마이크로초까지 담는다."""
+    return f'W/"{last_modified.timestamp():.6f}"'
+
+
+def last_modified_condition(
+    last_modified_func: Callable[..., Optional[datetime]],
+) -> Callable:
+    """last_modified_func로 Last-Modified와 ETag를 함께 검사한다. 쿼리는 한 번만 한다."""
+
+    @wraps(last_modified_func)
+    def get_last_modified_once(request, *args, **kwargs) -> Optional[datetime]:
+        if not hasattr(request, "_last_modified"):
+            request._last_modified = last_modified_func(request, *args, **kwargs)
+        return request._last_modified
+
+    def get_etag(request, *args, **kwargs) -> Optional[str]:
+        last_modified = get_last_modified_once(request, *args, **kwargs)
+        return None if last_modified is None else make_etag(last_modified)
+
+    return condition(etag_func=get_etag, last_modified_func=get_last_modified_once)
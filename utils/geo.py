@@ -0,0 +1,51 @@
+import math
+from typing import Final
+
+from django.db.models import F, FloatField, Value
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM: Final[float] = 6371.0088
+
+
+def haversine_distance(
+    longitude: float, latitude: float, origin: tuple[float, float]
+) -> float:
+    origin_longitude, origin_latitude = origin
+    delta_latitude: float = math.radians(latitude - origin_latitude)
+    delta_longitude: float = math.radians(longitude - origin_longitude)
+    a: float = (
+        math.sin(delta_latitude / 2) ** 2
+        + math.cos(math.radians(origin_latitude))
+        * math.cos(math.radians(latitude))
+        * math.sin(delta_longitude / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_expression(
+    origin: tuple[float, float],
+    longitude_field: str = "longitude",
+    latitude_field: str = "latitude",
+) -> CombinedExpression:
+    """DB 안에서 행마다 origin과의 거리(km)를 계산하는 식"""
+    origin_longitude, origin_latitude = origin
+    delta_latitude = Radians(F(latitude_field)) - Value(
+        math.radians(origin_latitude), output_field=FloatField()
+    )
+    delta_longitude = Radians(F(longitude_field)) - Value(
+        math.radians(origin_longitude), output_field=FloatField()
+    )
+    a = Power(Sin(delta_latitude / 2), 2) + Value(
+        math.cos(math.radians(origin_latitude)), output_field=FloatField()
+    ) * Cos(Radians(F(latitude_field))) * Power(Sin(delta_longitude / 2), 2)
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(a))
+
+
+def parse_coordinate(value: str, latitude_first: bool = False) -> tuple[float, float]:
+    """경도,위도 문자열(latitude_first 이면 위도,경도)을 (경도, 위도)로 변환"""
+    first, second = (float(part) for part in value.split(","))
+    longitude, latitude = (second, first) if latitude_first else (first, second)
+    if not (-180 <= longitude <= 180 and -90 <= latitude <= 90):
+        raise ValueError(value)
+    return longitude, latitude
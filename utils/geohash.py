@@ -0,0 +1,67 @@
+import math
+from typing import Final, Optional
+
+BASE32: Final[str] = "0123456789bcdefghjkmnpqrstuvwxyz"
+KM_PER_DEGREE: Final[float] = 111.32
+DEFAULT_PRECISION: Final[int] = 9
+
+
+def encode(
+    longitude: float, latitude: float, precision: int = DEFAULT_PRECISION
+) -> str:
+    longitude_range: list[float] = [-180.0, 180.0]
+    latitude_range: list[float] = [-90.0, 90.0]
+    geohash: list[str] = []
+    bits: int = 0
+    bit_count: int = 0
+    even: bool = True
+
+    while len(geohash) < precision:
+        value_range, value = (
+            (longitude_range, longitude) if even else (latitude_range, latitude)
+        )
+        middle: float = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            value_range[0] = middle
+        else:
+            value_range[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(geohash)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """precision 자리 지오해시 셀의 (경도 폭, 위도 높이)를 도 단위로 반환"""
+    longitude_bits: int = math.ceil(precision * 5 / 2)
+    latitude_bits: int = math.floor(precision * 5 / 2)
+    return 360.0 / 2**longitude_bits, 180.0 / 2**latitude_bits
+
+
+def covering_cells(
+    longitude: float, latitude: float, radius_km: float
+) -> Optional[list[str]]:
+    """중심에서 radius_km 안의 모든 점을 포함하는 셀 목록. 반경이 너무 크면 None"""
+    for precision in range(DEFAULT_PRECISION, 0, -1):
+        width, height = cell_size(precision)
+        width_km: float = (
+            width * KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6)
+        )
+        if min(width_km, height * KM_PER_DEGREE) >= radius_km:
+            return sorted(
+                {
+                    encode(
+                        (longitude + longitude_step * width + 180) % 360 - 180,
+                        min(max(latitude + latitude_step * height, -90), 90),
+                        precision,
+                    )
+                    for longitude_step in (-1, 0, 1)
+                    for latitude_step in (-1, 0, 1)
+                }
+            )
+    return None
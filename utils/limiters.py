@@ -0,0 +1,128 @@
+import asyncio
+import fcntl
+import json
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+class FileState:
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+
+    @contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                try:
+                    state: dict[str, Any] = json.loads(file.read() or "{}")
+                except ValueError:
+                    # 쓰는 도중 프로세스가 죽어 깨진 파일은 빈 상태로 다시 시작한다.
+                    state = {}
+                yield state
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(state))
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+class TokenBucket:
+    def __init__(
+        self, path: Path, rate: float, capacity: int, daily_limit: int
+    ) -> None:
+        self._state: FileState = FileState(path)
+        self.rate: float = rate
+        self.capacity: int = capacity
+        self.daily_limit: int = daily_limit
+
+    def _try_acquire(self) -> Optional[float]:
+        """토큰을 얻으면 0, 기다려야 하면 대기 시간(초), 일일 한도를 넘으면 None"""
+        now: float = time.time()
+        today: str = date.today().isoformat()
+        with self._state.locked() as state:
+            if state.get("date") != today:
+                state["date"] = today
+                state["used"] = 0
+            if state["used"] >= self.daily_limit:
+                return None
+
+            tokens: float = min(
+                self.capacity,
+                state.get("tokens", self.capacity)
+                + (now - state.get("updated_at", now)) * self.rate,
+            )
+            state["updated_at"] = now
+            if tokens >= 1:
+                state["tokens"] = tokens - 1
+                state["used"] += 1
+                return 0
+            state["tokens"] = tokens
+            return (1 - tokens) / self.rate
+
+    def acquire(self, timeout: float) -> bool:
+        deadline: float = time.monotonic() + timeout
+        while True:
+            wait: Optional[float] = self._try_acquire()
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self, timeout: float) -> bool:
+        deadline: float = time.monotonic() + timeout
+        while True:
+            # flock은 이벤트 루프를 막으므로 스레드에서 잡는다.
+            wait: Optional[float] = await asyncio.to_thread(self._try_acquire)
+            if wait is None:
+                return False
+            if not wait:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    def __init__(
+        self, path: Path, failure_threshold: int, recovery_timeout: float
+    ) -> None:
+        self._state: FileState = FileState(path)
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+
+    def allow_request(self) -> bool:
+        now: float = time.time()
+        with self._state.locked() as state:
+            opened_at: Optional[float] = state.get("opened_at")
+            if opened_at is None:
+                return True
+            if now - opened_at < self.recovery_timeout:
+                return False
+            # half-open: let one probe through and keep failing fast elsewhere
+            state["opened_at"] = now
+            return True
+
+    def record_success(self) -> None:
+        with self._state.locked() as state:
+            state["failures"] = 0
+            state["opened_at"] = None
+
+    def record_failure(self) -> None:
+        now: float = time.time()
+        with self._state.locked() as state:
+            state["failures"] = state.get("failures", 0) + 1
+            if (
+                state.get("opened_at") is not None
+                or state["failures"] >= self.failure_threshold
+            ):
+                state["opened_at"] = now
@@ -0,0 +1,242 @@
+import abc
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Final, Optional
+
+from django.conf import settings
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+LabelValues = tuple[str, ...]
+
+
+class Metric(abc.ABC):
+    TYPE: str = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        registry: Optional["MetricsRegistry"] = None,
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = labelnames
+        self._values: dict[LabelValues, list[float]] = {}
+        self._registry: MetricsRegistry = registry or REGISTRY
+        self._registry.register(self)
+
+    @abc.abstractmethod
+    def _empty(self) -> list[float]:
+        pass
+
+    def _get_values(self, labels: dict[str, str]) -> list[float]:
+        key: LabelValues = tuple(str(labels[name]) for name in self.labelnames)
+        values: Optional[list[float]] = self._values.get(key)
+        if values is None:
+            values = self._values[key] = self._empty()
+        return values
+
+    def reset(self) -> None:
+        self._values = {}
+
+    def dump(self) -> dict[str, list[float]]:
+        return {json.dumps(key): list(values) for key, values in self._values.items()}
+
+    @abc.abstractmethod
+    def format(self, values: dict[LabelValues, list[float]]) -> list[str]:
+        pass
+
+
+class Counter(Metric):
+    TYPE: str = "counter"
+
+    def _empty(self) -> list[float]:
+        return [0]
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        with self._registry.lock:
+            self._registry.check_process()
+            self._get_values(labels)[0] += amount
+        self._registry.flush_if_due()
+
+    def format(self, values: dict[LabelValues, list[float]]) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} "
+            f"{_format_value(value[0])}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(Metric):
+    """버킷별 개수(마지막은 +Inf)와 합계를 [*buckets, sum] 형태로 저장한다."""
+
+    TYPE: str = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        registry: Optional["MetricsRegistry"] = None,
+    ) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _empty(self) -> list[float]:
+        return [0] * (len(self.buckets) + 2)
+
+    def observe(self, value: float, **labels: str) -> None:
+        with self._registry.lock:
+            self._registry.check_process()
+            values: list[float] = self._get_values(labels)
+            values[bisect_left(self.buckets, value)] += 1
+            values[-1] += value
+        self._registry.flush_if_due()
+
+    def format(self, values: dict[LabelValues, list[float]]) -> list[str]:
+        lines: list[str] = []
+        for key, value in sorted(values.items()):
+            count: float = 0
+            for bound, bucket in zip((*self.buckets, "+Inf"), value[:-1]):
+                count += bucket
+                labels: str = _format_labels(
+                    (*self.labelnames, "le"), (*key, str(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {_format_value(count)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(value[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(count)}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+        + "}"
+    )
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class MetricsRegistry:
+    """프로세스별 값을 METRICS_DIR의 파일에 주기적으로 기록하고, 내보낼 때 모든
+    프로세스의 파일을 합산한다. gunicorn 워커마다 값이 따로 쌓이기 때문이다.
+    """
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self._metrics: dict[str, Metric] = {}
+        self._pid: Optional[int] = None
+        self._file_name: str = ""
+        self._flushed_at: float = 0
+
+    def register(self, metric: Metric) -> None:
+        self._metrics[metric.name] = metric
+
+    def check_process(self) -> None:
+        """lock을 잡은 상태에서 값을 바꾸기 전에 호출한다."""
+        if self._pid == os.getpid():
+            return
+        if self._pid is not None:
+            # fork 이전에 쌓인 값은 부모 프로세스의 파일에 기록된다.
+            for metric in self._metrics.values():
+                metric.reset()
+        self._pid = os.getpid()
+        self._file_name = f"{self._pid}-{time.time_ns()}.json"
+
+    def reset(self) -> None:
+        """쌓인 값을 버리고, 다음 기록 때 새 파일에 쓴다. 테스트 사이를 나눌 때 쓴다."""
+        with self.lock:
+            for metric in self._metrics.values():
+                metric.reset()
+            self._pid = None
+
+    def flush(self) -> None:
+        with self.lock:
+            self.check_process()
+            path: Path = Path(settings.METRICS_DIR) / self._file_name
+            content: str = json.dumps(
+                {name: metric.dump() for name, metric in self._metrics.items()}
+            )
+            self._flushed_at = time.monotonic()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path: Path = path.with_suffix(".tmp")
+        temporary_path.write_text(content)
+        os.replace(temporary_path, path)
+
+    def flush_if_due(self) -> None:
+        if time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def collect(self) -> dict[str, dict[LabelValues, list[float]]]:
+        self.flush()
+        collected: dict[str, dict[LabelValues, list[float]]] = {
+            name: {} for name in self._metrics
+        }
+        for path in Path(settings.METRICS_DIR).glob("*.json"):
+            try:
+                content: dict[str, dict[str, list[float]]] = json.loads(
+                    path.read_text()
+                )
+            except (OSError, ValueError):
+                continue
+            for name, values in content.items():
+                if name not in collected:
+                    continue
+                for key, value in values.items():
+                    label_values: LabelValues = tuple(json.loads(key))
+                    total: Optional[list[float]] = collected[name].get(label_values)
+                    if total is None or len(total) != len(value):
+                        collected[name][label_values] = list(value)
+                    else:
+                        collected[name][label_values] = [
+                            left + right for left, right in zip(total, value)
+                        ]
+        return collected
+
+    def export(self) -> str:
+        lines: list[str] = []
+        for name, values in self.collect().items():
+            metric: Metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.TYPE}")
+            lines.extend(metric.format(values))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY: MetricsRegistry = MetricsRegistry()
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    if REGISTRY._pid == os.getpid():
+        REGISTRY.flush()
@@ -0,0 +1,119 @@
+import time
+from typing import Any, Awaitable, Callable, Final, Union
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+from utils.metrics import Histogram
+
+QUERY_COUNT_BUCKETS: Final[tuple[float, ...]] = (0, 1, 2, 5, 10, 20, 50, 100)
+
+HTTP_REQUEST_DURATION: Histogram = Histogram(
+    "http_request_duration_seconds",
+    "URL 패턴별 요청 처리 시간",
+    ("view", "method", "status"),
+)
+HTTP_REQUEST_QUERIES: Histogram = Histogram(
+    "http_request_db_queries",
+    "URL 패턴별 요청당 DB 쿼리 수",
+    ("view",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_QUERY_DURATION: Histogram = Histogram(
+    "http_request_db_duration_seconds",
+    "URL 패턴별 요청당 DB 쿼리 시간",
+    ("view",),
+)
+
+
+class QueryTimer:
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.duration: float = 0
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        started: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """요청 처리 시간과 DB 쿼리 수/시간을 URL 패턴별로 기록한다."""
+
+    UNMATCHED_VIEW: Final[str] = "unmatched"
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(
+        self,
+        get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ],
+    ) -> None:
+        self.get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ] = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _get_view(self, request: HttpRequest) -> str:
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None:
+            return self.UNMATCHED_VIEW
+        return resolver_match.route
+
+    def _observe(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        duration: float,
+        query_timer: QueryTimer,
+    ) -> None:
+        view: str = self._get_view(request)
+        HTTP_REQUEST_DURATION.observe(
+            duration,
+            view=view,
+            method=request.method,
+            status=str(response.status_code),
+        )
+        HTTP_REQUEST_QUERIES.observe(query_timer.count, view=view)
+        HTTP_REQUEST_QUERY_DURATION.observe(query_timer.duration, view=view)
+
+    def __call__(
+        self, request: HttpRequest
+    ) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        query_timer: QueryTimer = QueryTimer()
+        started: float = time.perf_counter()
+        with connection.execute_wrapper(query_timer):
+            response: HttpResponse = self.get_response(request)
+        self._observe(request, response, time.perf_counter() - started, query_timer)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # 쿼리는 sync_to_async 스레드의 연결에서 실행되므로 그 연결에 건다.
+        query_timer: QueryTimer = QueryTimer()
+        execute_wrappers: list[Callable[..., Any]] = await sync_to_async(
+            lambda: connection.execute_wrappers
+        )()
+        execute_wrappers.append(query_timer)
+        started: float = time.perf_counter()
+        try:
+            response: HttpResponse = await self.get_response(request)
+        finally:
+            execute_wrappers.remove(query_timer)
+        self._observe(request, response, time.perf_counter() - started, query_timer)
+        return response
@@ -1,6 +1,29 @@
 import re
+import unicodedata
+
+WORD_PATTERN = re.compile(r"\w+")
 
 
 def remove_html_tags(text: str) -> str:
     clean = re.compile("<.*?>")
     return re.sub(clean, "", text)
+
+
+def normalize_query(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def make_ngrams(text: str, size: int = 2) -> list[str]:
+    """단어마다 글자 n-gram을 만든다. 한글은 음절 단위로 자른다.
+
+    n보다 짧은 단어는 그대로 하나의 토큰이 된다.
+    """
+    ngrams: list[str] = []
+    for word in WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if len(word) <= size:
+            ngrams.append(word)
+        else:
+            ngrams.extend(
+                word[index : index + size] for index in range(len(word) - size + 1)
+            )
+    return ngrams
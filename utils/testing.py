@@ -0,0 +1,36 @@
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test import override_settings
+
+from utils.metrics import REGISTRY
+
+
+class IsolatedStateMixin:
+    """공유 캐시, 메트릭, 네이버 상태 파일을 테스트마다 임시 디렉터리에 둔다.
+
+    BASE_DIR/.cache를 쓰는 개발 서버나 다른 테스트 실행과 상태를 나누지 않는다.
+    """
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.state_dir = Path(directory.name)
+        settings_override = override_settings(
+            CACHES={
+                **settings.CACHES,
+                "shared": {
+                    **settings.CACHES["shared"],
+                    "LOCATION": self.state_dir / "cache",
+                },
+            },
+            METRICS_DIR=self.state_dir / "metrics",
+            NAVER_CLIENT_STATE_DIR=self.state_dir / "naver",
+            NAVER_CLIENT_CASSETTE_PATH=self.state_dir / "naver-cassette.jsonl.gz",
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # 남은 값이 종료 시 실제 METRICS_DIR에 기록되지 않게 한다.
+        self.addCleanup(REGISTRY.reset)
@@ -0,0 +1,25 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views import View
+
+from utils.metrics import REGISTRY
+
+
+class MetricsView(View):
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    def _is_allowed(self, request: HttpRequest) -> bool:
+        # X-Forwarded-For는 조작할 수 있으므로 프록시 뒤에서는 토큰을 사용한다.
+        if request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS:
+            return True
+        return bool(settings.METRICS_TOKEN) and hmac.compare_digest(
+            request.headers.get("Authorization", ""),
+            f"Bearer {settings.METRICS_TOKEN}",
+        )
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        if not self._is_allowed(request):
+            return HttpResponseForbidden()
+        return HttpResponse(REGISTRY.export(), content_type=self.CONTENT_TYPE)
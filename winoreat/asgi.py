@@ -11,6 +11,23 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from utils.clients import NaverClient
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'winoreat.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+
+async def application(scope, receive, send):
+    # Django는 lifespan을 처리하지 않으므로 종료 시 네이버 AsyncClient를 여기서 닫는다.
+    if scope['type'] != 'lifespan':
+        return await django_application(scope, receive, send)
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await NaverClient.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
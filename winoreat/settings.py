@@ -52,6 +52,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'utils.middlewares.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -93,6 +94,9 @@ if os.environ.get('ENV') == 'local':
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            # A file (not the shared in-memory database) so that threaded tests can
+            # write concurrently instead of failing with "database table is locked"
+            'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
         }
     }
 elif os.environ.get('ENV') == 'prod':
@@ -108,6 +112,18 @@ elif os.environ.get('ENV') == 'prod':
     }
     
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Shared between the gunicorn workers on the same host
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('SHARED_CACHE_LOCATION', BASE_DIR / '.cache'),
+    },
+}
+
+
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -164,4 +180,98 @@ NAVER_CLOUD_PLATFORM_CLIENT_ID = os.environ.get('NAVER_CLOUD_PLATFORM_CLIENT_ID'
 
 NAVER_CLOUD_PLATFORM_CLIENT_SECRET = os.environ.get('NAVER_CLOUD_PLATFORM_CLIENT_SECRET')
 
+NAVER_CLIENT_POOL_SIZE = int(os.environ.get('NAVER_CLIENT_POOL_SIZE', 10))
+
+NAVER_CLIENT_CONNECT_TIMEOUT = float(os.environ.get('NAVER_CLIENT_CONNECT_TIMEOUT', 3.05))
+
+NAVER_CLIENT_READ_TIMEOUT = float(os.environ.get('NAVER_CLIENT_READ_TIMEOUT', 5))
+
+NAVER_CLIENT_MAX_RETRIES = int(os.environ.get('NAVER_CLIENT_MAX_RETRIES', 2))
+
+NAVER_CLIENT_BACKOFF_FACTOR = float(os.environ.get('NAVER_CLIENT_BACKOFF_FACTOR', 0.3))
+
+SEARCH_RESTAURANTS_CACHE_TTL = int(os.environ.get('SEARCH_RESTAURANTS_CACHE_TTL', 60 * 60))
+
+SEARCH_RESTAURANTS_CACHE_MAXSIZE = int(os.environ.get('SEARCH_RESTAURANTS_CACHE_MAXSIZE', 1024))
+
+RESTAURANT_IMAGE_JOB_MAX_ATTEMPTS = int(os.environ.get('RESTAURANT_IMAGE_JOB_MAX_ATTEMPTS', 5))
+
+RESTAURANT_IMAGE_JOB_RETRY_DELAY = int(os.environ.get('RESTAURANT_IMAGE_JOB_RETRY_DELAY', 60))
+
+RESTAURANT_IMAGE_JOB_TIMEOUT = int(os.environ.get('RESTAURANT_IMAGE_JOB_TIMEOUT', 5 * 60))
+
+# True queues image fetches for `manage.py run_image_jobs` (the image-worker service in
+# docker-compose.yml). Set false where no worker runs: images are then fetched in the request,
+# concurrently with geocoding, and a failed fetch is retried on the next suggestion.
+RESTAURANT_IMAGE_FETCH_IN_BACKGROUND = os.environ.get('RESTAURANT_IMAGE_FETCH_IN_BACKGROUND', 'true') == 'true'
+
+NAVER_CLIENT_FAN_OUT_WORKERS = int(os.environ.get('NAVER_CLIENT_FAN_OUT_WORKERS', 8))
+
+# Point these at a stub server (e.g. benchmarks/fake_naver.py) to run without Naver
+NAVER_CLIENT_BASE_URLS = {
+    'DEVELOPER_PLATFORM': os.environ.get('NAVER_DEVELOPER_PLATFORM_URL', 'https://openapi.naver.com/'),
+    'CLOUD_PLATFORM': os.environ.get('NAVER_CLOUD_PLATFORM_URL', 'https://naveropenapi.apigw.ntruss.com/'),
+}
+
+# 'record' saves every Naver response to the cassette, 'replay' serves only saved
+# responses (after the given delay in seconds) without calling Naver, 'off' disables it
+NAVER_CLIENT_CASSETTE_MODE = os.environ.get('NAVER_CLIENT_CASSETTE_MODE', 'off')
+
+NAVER_CLIENT_CASSETTE_PATH = os.environ.get('NAVER_CLIENT_CASSETTE_PATH', BASE_DIR / '.cache' / 'naver-cassette.jsonl.gz')
+
+NAVER_CLIENT_CASSETTE_LATENCY = float(os.environ.get('NAVER_CLIENT_CASSETTE_LATENCY', 0))
+
+# Rate limiter and circuit breaker state shared by every worker on the host
+NAVER_CLIENT_STATE_DIR = os.environ.get('NAVER_CLIENT_STATE_DIR', BASE_DIR / '.cache' / 'naver')
+
+NAVER_CLIENT_RATE_LIMITS = {
+    'DEVELOPER_PLATFORM': {
+        'rate': float(os.environ.get('NAVER_DEVELOPER_PLATFORM_RATE', 10)),
+        'capacity': int(os.environ.get('NAVER_DEVELOPER_PLATFORM_BURST', 10)),
+        'daily_limit': int(os.environ.get('NAVER_DEVELOPER_PLATFORM_DAILY_LIMIT', 25000)),
+    },
+    'CLOUD_PLATFORM': {
+        'rate': float(os.environ.get('NAVER_CLOUD_PLATFORM_RATE', 10)),
+        'capacity': int(os.environ.get('NAVER_CLOUD_PLATFORM_BURST', 10)),
+        'daily_limit': int(os.environ.get('NAVER_CLOUD_PLATFORM_DAILY_LIMIT', 100000)),
+    },
+}
+
+NAVER_CLIENT_RATE_LIMIT_TIMEOUT = float(os.environ.get('NAVER_CLIENT_RATE_LIMIT_TIMEOUT', 1))
+
+NAVER_CLIENT_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('NAVER_CLIENT_BREAKER_FAILURE_THRESHOLD', 5))
+
+NAVER_CLIENT_BREAKER_RECOVERY_TIMEOUT = float(os.environ.get('NAVER_CLIENT_BREAKER_RECOVERY_TIMEOUT', 30))
+
+# (longitude, latitude) of Daegu Samsung Lions Park
+LIONS_PARK_COORDINATE = (128.6812364, 35.8411290)
+
+# Hosts (with the port, as in the Host header) the unfiltered restaurant list keeps a snapshot for.
+# The list embeds absolute page links, so other Host headers are rendered per request instead of growing the cache
+RESTAURANT_FEED_HOSTS = [host for host in os.environ.get('RESTAURANT_FEED_HOSTS', 'localhost:8000,127.0.0.1:8000').split(',') if host]
+
+# Latest reviews embedded per restaurant in the list, truncated to the given length
+RESTAURANT_LIST_REVIEW_LIMIT = int(os.environ.get('RESTAURANT_LIST_REVIEW_LIMIT', 3))
+
+RESTAURANT_LIST_REVIEW_LENGTH = int(os.environ.get('RESTAURANT_LIST_REVIEW_LENGTH', 100))
+
+# Images older than this (seconds) are fetched again on the next suggestion
+RESTAURANT_IMAGE_MAX_AGE = int(os.environ.get('RESTAURANT_IMAGE_MAX_AGE', 30 * 24 * 60 * 60))
+
+# Memory budget (bytes) of the per-process restaurant name autocomplete index
+RESTAURANT_AUTOCOMPLETE_MEMORY_BUDGET = int(os.environ.get('RESTAURANT_AUTOCOMPLETE_MEMORY_BUDGET', 16 * 1024 * 1024))
+
+# How often (seconds) the autocomplete index picks up modified restaurants
+RESTAURANT_AUTOCOMPLETE_REFRESH_INTERVAL = float(os.environ.get('RESTAURANT_AUTOCOMPLETE_REFRESH_INTERVAL', 30))
+
+# Each worker process writes its metrics here and /metrics sums every file.
+# Clear it when the server restarts, as a fresh container does.
+METRICS_DIR = os.environ.get('METRICS_DIR', BASE_DIR / '.cache' / 'metrics')
+
+# How often (seconds) a worker writes its metrics to METRICS_DIR
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 15))
+
+# /metrics is served only to these client IPs (REMOTE_ADDR) or with `Authorization: Bearer <METRICS_TOKEN>`
+METRICS_ALLOWED_IPS = [ip for ip in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip]
 
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
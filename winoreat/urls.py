@@ -18,10 +18,13 @@ from typing import Final
 from django.contrib import admin
 from django.urls import include, path
 
+from utils.views import MetricsView
+
 API_PREFIX: Final[str] = 'api/v1'
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', MetricsView.as_view()),
     path(f'{API_PREFIX}/restaurants/', include('restaurants.urls')),
     path(f'{API_PREFIX}/bugs/', include('bugs.urls')),
 ]